@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数值内核 - 中心线采样的 Numba JIT 版本
+
+Numba 为可选依赖：
+- 已安装: 函数经 @njit(cache=True) 编译为机器码
+- 未安装: NUMBA_AVAILABLE = False，调用方应走 NumPy 向量化路径
+
+所有内核只处理 float 标量 / NumPy 数组，返回 (N, 3) float64 数组，
+App.Vector 的构造留给调用方在边界处完成。
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba 不可用时的空装饰器"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def sample_helix(num_samples, total_angle, R, dead_coils_per_end, total_coils,
+                 pitch_dead, pitch_active, Hb_compressed):
+    """
+    压缩弹簧中心线采样 (死圈 + 有效圈 + 死圈)
+
+    与 run_export.generate_compression_centerline 的分段 Z 算法一致。
+
+    返回: (pts[N+1, 3], min_z, max_z)
+    """
+    pts = np.empty((num_samples + 1, 3))
+    bottom_dead_height = dead_coils_per_end * pitch_dead
+    top_start = total_coils - dead_coils_per_end
+    min_z = np.inf
+    max_z = -np.inf
+
+    # 角度加法递推: (c, s) 每步旋转 dtheta，循环内不调用 cos / sin
+    dtheta = total_angle / num_samples
+    cos_d = math.cos(dtheta)
+    sin_d = math.sin(dtheta)
+    c = 1.0
+    s = 0.0
+
+    for i in range(num_samples + 1):
+        n = (i / num_samples) * total_coils
+
+        if n <= dead_coils_per_end:
+            z = pitch_dead * n
+        elif n >= top_start:
+            z = bottom_dead_height + Hb_compressed + (n - top_start) * pitch_dead
+        else:
+            z = bottom_dead_height + pitch_active * (n - dead_coils_per_end)
+
+        pts[i, 0] = R * c
+        pts[i, 1] = R * s
+        pts[i, 2] = z
+        c, s = c * cos_d - s * sin_d, s * cos_d + c * sin_d
+        if z < min_z:
+            min_z = z
+        if z > max_z:
+            max_z = z
+
+    return pts, min_z, max_z
+
+
+@njit(cache=True)
+def sample_bezier(p0, p1, p2, p3, steps):
+    """
+    三次贝塞尔曲线均匀采样 t = i / steps, i = 0..steps
+
+    p0..p3: shape (3,) 控制点
+    返回: pts[steps+1, 3]
+    """
+    pts = np.empty((steps + 1, 3))
+    for i in range(steps + 1):
+        t = i / steps
+        omt = 1.0 - t
+        b0 = omt * omt * omt
+        b1 = 3.0 * omt * omt * t
+        b2 = 3.0 * omt * t * t
+        b3 = t * t * t
+        for k in range(3):
+            pts[i, k] = b0 * p0[k] + b1 * p1[k] + b2 * p2[k] + b3 * p3[k]
+    return pts
+
+
+@njit(cache=True, fastmath=True)
+def sample_coil(theta0, total_angle, z0, height, R_from, R_to, num_samples, out):
+    """
+    通用螺旋段采样 (圆柱 / 圆锥)，写入预分配缓冲区
+
+    t = i / num_samples, i = 0..num_samples:
+      theta = theta0 + total_angle * t
+      R     = R_from + (R_to - R_from) * t
+      z     = z0 + height * t
+
+    out: shape (num_samples+1, 3)
+    返回: out
+    """
+    dR = R_to - R_from
+
+    # 角度加法递推: (c, s) 每步旋转 dtheta，循环内不调用 cos / sin
+    dtheta = total_angle / num_samples
+    cos_d = math.cos(dtheta)
+    sin_d = math.sin(dtheta)
+    c = math.cos(theta0)
+    s = math.sin(theta0)
+
+    for i in range(num_samples + 1):
+        t = i / num_samples
+        R = R_from + dR * t
+        out[i, 0] = R * c
+        out[i, 1] = R * s
+        out[i, 2] = z0 + height * t
+        c, s = c * cos_d - s * sin_d, s * cos_d + c * sin_d
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def sample_arc(center, u, v, radius, theta0, total_arc, num_samples, out):
+    """
+    平面圆弧采样: center + r·cosθ·u + r·sinθ·v，写入预分配缓冲区
+
+    center/u/v: shape (3,)
+    out: shape (num_samples+1, 3)
+    返回: out
+    """
+    # 循环不变量: 半径预乘进基向量
+    uR = u * radius
+    vR = v * radius
+
+    # 角度加法递推 (同 sample_helix)
+    dtheta = total_arc / num_samples
+    cos_d = math.cos(dtheta)
+    sin_d = math.sin(dtheta)
+    c = math.cos(theta0)
+    s = math.sin(theta0)
+
+    for i in range(num_samples + 1):
+        for k in range(3):
+            out[i, k] = center[k] + c * uR[k] + s * vR[k]
+        c, s = c * cos_d - s * sin_d, s * cos_d + c * sin_d
+    return out
+
+
+@njit(cache=True)
+def sample_gb_coil_z(n_coils, Na, dead_coils_per_end, pitch_dead, pitch_active, half_t, scale):
+    """
+    GB 弹簧侧视图每圈前/后半圈的 Z 坐标 (已乘 scale)
+
+    与 run_export.generate_gb_spring_svg 的分段节距一致:
+    底部死圈 / 有效圈 / 顶部死圈
+
+    half_t: 半圈参数 t (0..1)
+    返回: out[n_coils, 2, len(half_t)]，out[:, 0] 为前半圈，out[:, 1] 为后半圈
+    """
+    n = half_t.shape[0]
+    out = np.empty((n_coils, 2, n))
+    for coil in range(n_coils):
+        if coil < dead_coils_per_end:
+            z_start = coil * pitch_dead
+            current_pitch = pitch_dead
+        elif coil < dead_coils_per_end + Na:
+            coil_in_active = coil - dead_coils_per_end
+            z_start = dead_coils_per_end * pitch_dead + coil_in_active * pitch_active
+            current_pitch = pitch_active
+        else:
+            coil_in_top = coil - dead_coils_per_end - Na
+            z_start = dead_coils_per_end * pitch_dead + Na * pitch_active + coil_in_top * pitch_dead
+            current_pitch = pitch_dead
+        half_pitch = current_pitch / 2
+        for i in range(n):
+            dz = half_t[i] * current_pitch / 2
+            out[coil, 0, i] = (z_start + dz) * scale
+            out[coil, 1, i] = (z_start + half_pitch + dz) * scale
+    return out
+
+
+@njit(inline='always')
+def _smoothstep01(x):
+    """0..1 平滑步进 (与 run_export.smoothstep01 一致)"""
+    t = min(max(x, 0.0), 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+
+@njit(cache=True, fastmath=True)
+def sample_suspension_z(num_segs, d_theta, theta_total, theta_closed, theta_ground, theta_trans,
+                        pitch_active, p_center, p_end, has_closed, is_uniform):
+    """
+    悬架弹簧中心线 Z 坐标: 节距积分 + 磨平端压平 (缩放前)
+
+    与 run_export.generate_suspension_centerline 的算法一致:
+    - 每段中点 theta_mid 处的节距 (均匀 / 并紧端权重 / 渐进节距) 积分得到 z
+    - theta_ground > 0 时两端各 theta_ground 范围内向 0 / z_end 平滑压平
+
+    返回: z[num_segs+1]
+    """
+    z = np.empty(num_segs + 1)
+    z[0] = 0.0
+    z_current = 0.0
+    two_pi = 2.0 * math.pi
+
+    for i in range(1, num_segs + 1):
+        theta_mid = (i - 0.5) * d_theta
+
+        if not has_closed:
+            p = pitch_active if is_uniform else p_center
+        elif is_uniform:
+            # 并紧端节距权重 (wPitch)
+            w = 1.0
+            if theta_closed > 0.0:
+                if theta_mid < theta_closed:
+                    w = _smoothstep01(theta_mid / theta_closed)
+                elif theta_mid > theta_total - theta_closed:
+                    w = _smoothstep01((theta_total - theta_mid) / theta_closed)
+            p = pitch_active * w
+        else:
+            # 渐进节距
+            if theta_mid < theta_closed:
+                p = p_end
+            elif theta_mid < theta_closed + theta_trans:
+                u = _smoothstep01((theta_mid - theta_closed) / theta_trans)
+                p = p_end + (p_center - p_end) * u
+            elif theta_mid > theta_total - (theta_closed + theta_trans):
+                if theta_mid < theta_total - theta_closed:
+                    u = _smoothstep01((theta_total - theta_closed - theta_mid) / theta_trans)
+                    p = p_end + (p_center - p_end) * u
+                else:
+                    p = p_end
+            else:
+                p = p_center
+
+        z_current += (p / two_pi) * d_theta
+        z[i] = z_current
+
+    if theta_ground > 0.0:
+        z_end = z[num_segs]
+        for i in range(num_segs + 1):
+            theta = i * d_theta
+            if theta < theta_ground:
+                wg = _smoothstep01(1.0 - theta / theta_ground)
+                z[i] = z[i] * (1.0 - wg)  # 向 0 靠拢
+            elif theta > theta_total - theta_ground:
+                wg = _smoothstep01(1.0 - (theta_total - theta) / theta_ground)
+                z[i] = z_end - (z_end - z[i]) * (1.0 - wg)  # 向 z_end 靠拢
+
+    return z
@@ -12,10 +12,15 @@ HookBuilder - Extension Spring Hook Geometry Builder for FreeCAD
 3. C¹ 连续：使用三次贝塞尔曲线保证过渡平滑
 """
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import List, Literal, Optional
 
+import numpy as np
+
+from _fast import NUMBA_AVAILABLE, sample_bezier
+
 try:
     import FreeCAD as App
     import Part
@@ -30,11 +35,12 @@ except ImportError:
 HookKind = Literal["machine", "side", "crossover", "extended", "doubleLoop"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class HookSpec:
     """
     Hook 规格定义
     每种 Hook 类型只需要定义这些参数，不需要重写几何逻辑
+    不可变 (frozen)，可在多次调用间安全共享
     """
     kind: HookKind
     
@@ -81,8 +87,9 @@ class HelixEndInfo:
 # Hook 规格工厂
 # =============================================================================
 
+@functools.lru_cache(maxsize=8)
 def get_hook_spec(kind: HookKind) -> HookSpec:
-    """获取 Hook 规格"""
+    """获取 Hook 规格 (按 kind 缓存，每种类型只构造一次)"""
     specs = {
         "machine": HookSpec(
             kind="machine",
@@ -154,24 +161,68 @@ def get_hook_spec(kind: HookKind) -> HookSpec:
 # 工具函数
 # =============================================================================
 
-def cubic_bezier(p0, p1, p2, p3, t):
-    """三次贝塞尔曲线插值"""
-    omt = 1.0 - t
-    return (p0 * (omt * omt * omt) + 
-            p1 * (3 * omt * omt * t) + 
-            p2 * (3 * omt * t * t) + 
-            p3 * (t * t * t))
-
-
 def clamp_radius(point, min_radius):
     """
     Radius clamp: 确保点不凹入线圈内部
     """
-    r = math.sqrt(point.x**2 + point.y**2)
-    if r < min_radius and r > 1e-8:
-        scale = min_radius / r
-        return App.Vector(point.x * scale, point.y * scale, point.z)
-    return point
+    # 先比较半径平方，绝大多数点无需钳制，可跳过 sqrt
+    x, y = point.x, point.y
+    r2 = x * x + y * y
+    if r2 >= min_radius * min_radius or r2 <= 1e-16:
+        return point
+    scale = min_radius / math.sqrt(r2)
+    return App.Vector(x * scale, y * scale, point.z)
+
+
+@functools.lru_cache(maxsize=32)
+def arc_trig_table(start_angle: float, total_angle: float, segments: int) -> tuple:
+    """
+    圆弧采样的 (cos θ_i, sin θ_i) 查找表, θ_i = start + total * i / segments
+    
+    只依赖 Hook 规格中的角度参数，与半径/位置无关，按参数缓存复用
+    """
+    table = []
+    for i in range(segments + 1):
+        theta = start_angle + total_angle * (i / segments)
+        table.append((math.cos(theta), math.sin(theta)))
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=64)
+def arc_basis(spec: HookSpec, segments: int, hook_radius: float) -> tuple:
+    """
+    Hook 环圆弧的缩放基系数 (r·cos θ_i, r·sin θ_i)
+    
+    按 (spec, segments, hook_radius) 缓存；批量导出同规格弹簧时，
+    每次调用只需与 hook_center / u / v 组合
+    """
+    total_angle = math.radians(spec.loop_angle_deg)
+    table = arc_trig_table(spec.loop_start_angle, total_angle, segments)
+    return tuple((hook_radius * c, hook_radius * s) for c, s in table)
+
+
+def clamp_radius_array(pts, min_radius):
+    """
+    clamp_radius 的向量化版本: 原地处理 (N, 3) 点数组
+    只对需要钳制的点开方
+    """
+    r2 = pts[:, 0] * pts[:, 0] + pts[:, 1] * pts[:, 1]
+    mask = (r2 < min_radius * min_radius) & (r2 > 1e-16)
+    if mask.any():
+        scale = min_radius / np.sqrt(r2[mask])
+        pts[mask, 0] *= scale
+        pts[mask, 1] *= scale
+    return pts
+
+
+def _as_array(p):
+    """App.Vector -> shape (3,) float64 数组"""
+    return np.array((p.x, p.y, p.z))
+
+
+def _to_vectors(arr):
+    """(N, 3) 数组 -> App.Vector 列表 (tolist 避免 numpy 标量装箱)"""
+    return [App.Vector(x, y, z) for x, y, z in arr.tolist()]
 
 
 def get_helix_end_info(helix_pts: List['App.Vector'], is_start: bool) -> HelixEndInfo:
@@ -185,26 +236,28 @@ def get_helix_end_info(helix_pts: List['App.Vector'], is_start: bool) -> HelixEn
         prev_point = helix_pts[-2]
         axis_dir = App.Vector(0, 0, 1)
     
+    # XY 平面方向使用 complex 计算，仅在返回时转换为 App.Vector
     # 径向方向
-    radial_dir = App.Vector(end_point.x, end_point.y, 0)
-    if radial_dir.Length < 1e-8:
-        radial_dir = App.Vector(1, 0, 0)
+    radial = complex(end_point.x, end_point.y)
+    radial_len = abs(radial)
+    if radial_len < 1e-8:
+        radial = 1 + 0j
     else:
-        radial_dir.normalize()
+        radial /= radial_len
     
     # 切线方向 (XY 平面投影)
-    tangent_dir = end_point.sub(prev_point)
-    tangent_dir.z = 0
-    if tangent_dir.Length < 1e-8:
-        tangent_dir = App.Vector(-radial_dir.y, radial_dir.x, 0)
+    tangent = complex(end_point.x - prev_point.x, end_point.y - prev_point.y)
+    tangent_len = abs(tangent)
+    if tangent_len < 1e-8:
+        tangent = radial * 1j  # 径向逆时针旋转 90°: (-ry, rx)
     else:
-        tangent_dir.normalize()
+        tangent /= tangent_len
     
     return HelixEndInfo(
         end_point=end_point,
         axis_dir=axis_dir,
-        radial_dir=radial_dir,
-        tangent_dir=tangent_dir
+        radial_dir=App.Vector(radial.real, radial.imag, 0),
+        tangent_dir=App.Vector(tangent.real, tangent.imag, 0)
     )
 
 
@@ -212,6 +265,106 @@ def get_helix_end_info(helix_pts: List['App.Vector'], is_start: bool) -> HelixEn
 # Hook 中心线构建器
 # =============================================================================
 
+@functools.lru_cache(maxsize=16)
+def specialize_hook_builder(spec: HookSpec):
+    """
+    按 HookSpec 生成专用的 Hook 中心线构建函数 (部分求值)
+    
+    center_mode 分支与各 factor 在此一次性解析为常量，
+    返回的 builder(end_info, wire_diameter, mean_radius, is_start)
+    在生成点时不再读取 spec 字段或判断模式
+    """
+    axial_gap_factor = spec.axial_gap_factor
+    hook_radius_factor = spec.hook_radius_factor
+    # on-axis: 环中心在轴线上，等价于径向偏移为 0
+    radial_offset_factor = 0.0 if spec.center_mode == "on-axis" else spec.radial_offset_factor
+    
+    def builder(end_info, wire_diameter, mean_radius, is_start):
+        d = wire_diameter
+        R = mean_radius
+        
+        end_pos = end_info.end_point
+        axis_dir = end_info.axis_dir
+        radial_dir = end_info.radial_dir
+        tangent_dir = end_info.tangent_dir
+        
+        # Hook 参数
+        hook_gap = d * axial_gap_factor
+        hook_radius = R * hook_radius_factor + d * 0.4
+        
+        # Hook 环圆心 (on-axis 时 offset = 0)
+        offset = d * radial_offset_factor
+        hook_center = App.Vector(
+            radial_dir.x * offset,
+            radial_dir.y * offset,
+            end_pos.z + axis_dir.z * hook_gap
+        )
+        
+        # Hook 平面基向量
+        # 不变量 (见 get_helix_end_info): axis_dir = (0,0,±1)，radial_dir 为 z=0 的单位向量，
+        # 因此 u = axis_dir，v = radial × axis 化简为 (ry·az, -rx·az, 0)，均为单位向量
+        az = axis_dir.z
+        ux, uy, uz = 0.0, 0.0, az
+        vx, vy, vz = radial_dir.y * az, -radial_dir.x * az, 0.0
+        
+        # === 生成 Hook 环圆弧点 ===
+        segments = 24
+        
+        # 循环外展开为标量，每个采样点只构造一个 App.Vector
+        cx, cy, cz = hook_center.x, hook_center.y, hook_center.z
+        loop_pts = [
+            App.Vector(cx + ux * rc + vx * rs, cy + uy * rc + vy * rs, cz + uz * rc + vz * rs)
+            for rc, rs in arc_basis(spec, segments, hook_radius)
+        ]
+        
+        # 端点与方向向量只转换一次，Segment A/B 共用
+        end_arr = _as_array(end_pos)
+        tangent_arr = _as_array(tangent_dir)
+        axis_arr = np.array((0.0, 0.0, az))
+        
+        # === Segment A: 沿切线的直线段 ===
+        seg_a_len = d * 1.0
+        seg_a_delta = tangent_arr * seg_a_len
+        
+        seg_a_steps = 10
+        ts = np.linspace(0.0, 1.0, seg_a_steps + 1)[:, None]
+        seg_a_arr = end_arr + ts * seg_a_delta
+        clamp_radius_array(seg_a_arr, R)
+        
+        # === Segment B: 贝塞尔过渡 ===
+        # P0 取未钳制的 Segment A 终点
+        P0 = end_arr + seg_a_delta
+        P3 = _as_array(loop_pts[0])
+        P1 = P0 + np.array((radial_dir.x, radial_dir.y, 0.0)) * (0.5 * d) + axis_arr * (0.5 * d)
+        P2 = P3 - axis_arr * (0.5 * d)
+        
+        seg_b_steps = 20
+        if NUMBA_AVAILABLE:
+            seg_b_arr = sample_bezier(P0, P1, P2, P3, seg_b_steps)[1:]
+        else:
+            # Bernstein 基函数向量化求值 (t = 1/steps .. 1)
+            ts = np.linspace(0.0, 1.0, seg_b_steps + 1)[1:, None]
+            t2 = ts * ts
+            mt = 1.0 - ts
+            mt2 = mt * mt
+            seg_b_arr = mt2 * mt * P0 + 3.0 * mt2 * ts * P1 + 3.0 * mt * t2 * P2 + t2 * ts * P3
+        clamp_radius_array(seg_b_arr, R)
+        
+        # === 组合最终中心线 ===
+        # 过渡段 (seg_a + seg_b) 在数组中拼接，只转换一次 App.Vector；
+        # 结果列表原地 extend，不产生中间列表
+        if is_start:
+            # 反向拼接；seg_a[:0:-1] 即反向后去掉最后一个点 (螺旋端点)
+            all_pts = loop_pts[::-1]
+            all_pts.extend(_to_vectors(np.concatenate((seg_b_arr[::-1], seg_a_arr[:0:-1]))))
+        else:
+            all_pts = _to_vectors(np.concatenate((seg_a_arr[1:], seg_b_arr)))
+            all_pts.extend(loop_pts)
+        return all_pts
+
+    return builder
+
+
 def build_hook_centerline(
     spec: HookSpec,
     end_info: HelixEndInfo,
@@ -232,83 +385,14 @@ def build_hook_centerline(
     返回:
     - Hook 中心线点列表
     """
-    d = wire_diameter
-    R = mean_radius
-    
-    end_pos = end_info.end_point
-    axis_dir = end_info.axis_dir
-    radial_dir = end_info.radial_dir
-    tangent_dir = end_info.tangent_dir
-    
-    # Hook 参数
-    hook_gap = d * spec.axial_gap_factor
-    hook_radius = R * spec.hook_radius_factor + d * 0.4
-    handle_length = d * spec.handle_length_factor
-    
-    # Hook 环圆心
-    if spec.center_mode == "on-axis":
-        hook_center = App.Vector(0, 0, end_pos.z + axis_dir.z * hook_gap)
-    else:
-        # radial-offset
-        offset = d * spec.radial_offset_factor
-        hook_center = App.Vector(
-            radial_dir.x * offset,
-            radial_dir.y * offset,
-            end_pos.z + axis_dir.z * hook_gap
-        )
-    
-    # Hook 平面基向量
-    u = App.Vector(axis_dir.x, axis_dir.y, axis_dir.z)
-    u.normalize()
-    v = radial_dir.cross(axis_dir)
-    v.normalize()
-    
-    # === 生成 Hook 环圆弧点 ===
-    loop_pts = []
-    start_angle = spec.loop_start_angle
-    total_angle = math.radians(spec.loop_angle_deg)
-    segments = 24
-    
-    for i in range(segments + 1):
-        t = i / segments
-        theta = start_angle + total_angle * t
-        p = (hook_center + 
-             u * (hook_radius * math.cos(theta)) + 
-             v * (hook_radius * math.sin(theta)))
-        loop_pts.append(p)
-    
-    # === Segment A: 沿切线的直线段 ===
-    seg_a_len = d * 1.0
-    seg_a_end = end_pos + tangent_dir * seg_a_len
-    
-    seg_a_pts = []
-    seg_a_steps = 10
-    for i in range(seg_a_steps + 1):
-        t = i / seg_a_steps
-        p = end_pos * (1 - t) + seg_a_end * t
-        p = clamp_radius(p, R)
-        seg_a_pts.append(p)
-    
-    # === Segment B: 贝塞尔过渡 ===
-    p0 = seg_a_end
-    p3 = loop_pts[0]
-    p1 = seg_a_end + radial_dir * (0.5 * d) + axis_dir * (0.5 * d)
-    p2 = loop_pts[0] - axis_dir * (0.5 * d)
-    
-    seg_b_pts = []
-    seg_b_steps = 20
-    for i in range(1, seg_b_steps + 1):
-        t = i / seg_b_steps
-        p = cubic_bezier(p0, p1, p2, p3, t)
-        p = clamp_radius(p, R)
-        seg_b_pts.append(p)
-    
-    # === 组合最终中心线 ===
-    if is_start:
-        all_pts = list(reversed(loop_pts)) + list(reversed(seg_b_pts)) + list(reversed(seg_a_pts))
-        return all_pts[:-1]  # 去掉最后一个点
-    else:
-        return seg_a_pts[1:] + seg_b_pts + loop_pts
+    builder = specialize_hook_builder(spec)
+    return builder(end_info, wire_diameter, mean_radius, is_start)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_hook_builder(hook_kind: HookKind):
+    """按 hook_kind 缓存专用构建函数：查 spec 与部分求值每种类型只做一次"""
+    return specialize_hook_builder(get_hook_spec(hook_kind))
 
 
 def build_hook_solid(
@@ -376,16 +460,16 @@ def build_extension_hooks(
     返回:
     - (start_hook_solid, end_hook_solid) 元组
     """
-    spec = get_hook_spec(hook_kind)
+    build_centerline = _get_hook_builder(hook_kind)
     
     # 底部钩
     start_info = get_helix_end_info(helix_pts, is_start=True)
-    start_centerline = build_hook_centerline(spec, start_info, wire_diameter, mean_radius, is_start=True)
+    start_centerline = build_centerline(start_info, wire_diameter, mean_radius, True)
     start_hook = build_hook_solid(start_centerline, wire_diameter)
     
     # 顶部钩
     end_info = get_helix_end_info(helix_pts, is_start=False)
-    end_centerline = build_hook_centerline(spec, end_info, wire_diameter, mean_radius, is_start=False)
+    end_centerline = build_centerline(end_info, wire_diameter, mean_radius, False)
     end_hook = build_hook_solid(end_centerline, wire_diameter)
     
     return start_hook, end_hook
@@ -36,6 +36,20 @@ except ImportError as e:
 
 import math
 import json
+import datetime
+import functools
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+# 调试日志 (默认不输出；参数归一化等高频路径的详细信息走 DEBUG 级别)
+logger = logging.getLogger(__name__)
+
+# Numba JIT 内核 (可选，未安装 numba 时走 NumPy 路径)
+from _fast import (NUMBA_AVAILABLE, sample_helix, sample_coil, sample_arc, sample_gb_coil_z,
+                   sample_suspension_z)
 
 # 导入 HookBuilder (可选，用于拉簧)
 try:
@@ -44,6 +58,13 @@ try:
 except ImportError:
     HOOK_BUILDER_AVAILABLE = False
 
+# TechDraw (可选，仅 PDF/SVG 工程图使用)
+try:
+    import TechDraw
+    TECHDRAW_AVAILABLE = True
+except ImportError:
+    TECHDRAW_AVAILABLE = False
+
 # =============================================================================
 # 辅助函数
 # =============================================================================
@@ -51,6 +72,88 @@ except ImportError:
 def vec(x,y,z): 
     return App.Vector(float(x), float(y), float(z))
 
+def vectors_from_array(arr):
+    """
+    (N, 3) float64 数组 -> App.Vector 列表
+    先 tolist() 转为 Python float，避免逐元素 numpy 标量装箱
+    """
+    return [App.Vector(x, y, z) for x, y, z in arr.tolist()]
+
+def array_from_vector(v):
+    """App.Vector -> shape (3,) float64 数组"""
+    return np.array((v.x, v.y, v.z))
+
+def _as_ndarray(points):
+    """
+    点 / 点列表 -> float64 数组
+    接受 (N, 3) 数组、单个 App.Vector 或 App.Vector 列表，已是数组时不复制
+    """
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=np.float64)
+    if hasattr(points, "x"):
+        return array_from_vector(points)
+    return np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64).reshape(-1, 3)
+
+@functools.lru_cache(maxsize=32)
+def _arc_trig_table(segments, start_angle, total_arc):
+    """
+    圆弧采样角的 (cos θ, sin θ) 表, shape (segments+1, 2)
+    只依赖 (段数, 起始角, 总弧度)，与半径/基向量无关，起止钩环共用同一张表
+    返回只读数组，调用方不得原地修改
+    """
+    theta = start_angle + total_arc * np.linspace(0.0, 1.0, segments + 1)
+    table = np.stack((np.cos(theta), np.sin(theta)), axis=1)
+    table.flags.writeable = False
+    return table
+
+def arc_points(center, radius, u, v, table):
+    """
+    按三角表批量生成圆弧点: center + r·cosθ·u + r·sinθ·v
+    写成 (N,2) @ (2,3) 的矩阵乘法形式
+    center/u/v 可以是 App.Vector 或 shape (3,) 数组
+    """
+    basis = np.vstack((_as_ndarray(u), _as_ndarray(v))) * radius
+    arr = table @ basis
+    arr += _as_ndarray(center)
+    return arr
+
+def sample_arc_points(center, radius, u, v, start_angle, total_arc, segments):
+    """
+    圆弧采样 (segments+1 个点)
+    Numba 可用时走 JIT 内核，否则用缓存三角表 + 矩阵乘法
+    """
+    if NUMBA_AVAILABLE:
+        out = np.empty((segments + 1, 3))
+        return sample_arc(_as_ndarray(center), _as_ndarray(u), _as_ndarray(v),
+                          float(radius), float(start_angle), float(total_arc), segments, out)
+    table = _arc_trig_table(segments, start_angle, total_arc)
+    return arc_points(center, radius, u, v, table)
+
+def coil_points(theta0, total_angle, z0, height, R_from, R_to, num_samples):
+    """
+    螺旋段采样 (num_samples+1 个点)，半径在 R_from → R_to 间线性插值
+    Numba 可用时写入预分配缓冲区，否则 NumPy 向量化
+    """
+    if NUMBA_AVAILABLE:
+        out = np.empty((num_samples + 1, 3))
+        return sample_coil(float(theta0), float(total_angle), float(z0), float(height),
+                           float(R_from), float(R_to), num_samples, out)
+    t = np.linspace(0.0, 1.0, num_samples + 1)
+    theta = theta0 + total_angle * t
+    R = R_from + (R_to - R_from) * t
+    return np.column_stack((R * np.cos(theta), R * np.sin(theta), z0 + height * t))
+
+def _safe_normalize_xy(x, y):
+    """
+    XY 平面方向归一化 (纯 Python float，不构造 App.Vector)
+    长度过小时退化为 +X 方向 (1, 0)
+    """
+    n = math.sqrt(x * x + y * y)
+    if n < 1e-8:
+        return 1.0, 0.0
+    inv = 1.0 / n
+    return x * inv, y * inv
+
 def unit(v):
     l = v.Length
     return v.multiply(1.0/l) if l > 1e-12 else vec(0,0,0)
@@ -64,23 +167,16 @@ def first_index_ge(L, target):
             return i
     return len(L)-1
 
-def rot_axis_angle(v, axis, deg):
-    """Rodrigues rotation formula"""
-    a = unit(axis)
-    th = math.radians(deg)
-    c = math.cos(th); s = math.sin(th)
-    return v.multiply(c) + a.cross(v).multiply(s) + a.multiply(a.dot(v)*(1-c))
-
 def make_basis_matrix(nx, bx, tx):
     """
     Build a 3x3 basis matrix whose columns are (n, b, t) in world coordinates.
-    FreeCAD's App.Matrix is 4x4; we fill the upper-left 3x3.
+    FreeCAD's App.Matrix is 4x4; the upper-left 3x3 is passed row-major to the
+    16-float constructor in one call instead of nine attribute writes.
     """
-    m = App.Matrix()
-    m.A11, m.A12, m.A13 = nx.x, bx.x, tx.x
-    m.A21, m.A22, m.A23 = nx.y, bx.y, tx.y
-    m.A31, m.A32, m.A33 = nx.z, bx.z, tx.z
-    return m
+    return App.Matrix(nx.x, bx.x, tx.x, 0.0,
+                      nx.y, bx.y, tx.y, 0.0,
+                      nx.z, bx.z, tx.z, 0.0,
+                      0.0, 0.0, 0.0, 1.0)
 
 def rotation_from_basis(n, b, t):
     """
@@ -93,124 +189,387 @@ def rotation_from_basis(n, b, t):
 # 参数化中心线生成器 (与 Three.js 同步)
 # =============================================================================
 
-def generate_compression_centerline(params):
+@dataclass(frozen=True)
+class SpringGeom:
+    """
+    压缩弹簧派生几何参数 (死圈 / 节距 / 有效高度)
+    中心线采样与解析螺旋路径共用同一份计算结果，避免两处公式分叉
+    """
+    R: float
+    d: float
+    L0: float
+    total_coils: float
+    active_coils: float
+    dead_coils: float
+    dead_coils_per_end: float
+    pitch_dead: float
+    Hb: float               # 有效区域高度 (自由状态)
+    Hb_compressed: float    # 压缩后有效高度
+    pitch_active: float     # 压缩后有效圈节距
+    
+    @classmethod
+    def from_params(cls, params):
+        """按 Three.js compressionSpringGeometry.ts 的算法从参数计算"""
+        total_coils = params.get("totalCoils", 10)
+        active_coils = params.get("activeCoils", 8)
+        mean_diameter = params.get("meanDiameter", 24.0)
+        wire_diameter = params.get("wireDiameter", 3.2)
+        free_length = params.get("freeLength", 50.0)
+        current_deflection = params.get("currentDeflection", 0.0)
+        
+        # 死圈计算
+        dead_coils = total_coils - active_coils
+        
+        # 节距计算
+        d = wire_diameter
+        pitch_dead = d  # 死圈节距 ≈ 线径
+        dead_height = dead_coils * pitch_dead
+        Hb = free_length - dead_height  # 有效区域高度 (自由状态)
+        
+        # 压缩后有效高度
+        Hb_compressed = max(Hb - current_deflection, active_coils * pitch_dead)
+        pitch_active = Hb_compressed / active_coils if active_coils > 0 else d
+        
+        return cls(
+            R=mean_diameter / 2.0,
+            d=d,
+            L0=free_length,
+            total_coils=total_coils,
+            active_coils=active_coils,
+            dead_coils=dead_coils,
+            dead_coils_per_end=dead_coils / 2.0,
+            pitch_dead=pitch_dead,
+            Hb=Hb,
+            Hb_compressed=Hb_compressed,
+            pitch_active=pitch_active,
+        )
+    
+    @property
+    def constant_pitch(self):
+        """
+        全长节距是否一致 (无死圈，或死圈节距与有效圈节距相同)
+        只有此时升角恒定，固定副法线扫掠的截面才与路径垂直
+        """
+        return (self.dead_coils_per_end <= 1e-9
+                or abs(self.pitch_dead - self.pitch_active) <= 1e-9 * max(self.pitch_active, 1.0))
+    
+    def z_at(self, n):
+        """
+        圈数 n (数组) 处的中心线高度与每圈升高 dz/dn
+        分段: 底部死圈 / 有效圈 (可压缩) / 顶部死圈
+        返回: (z, pitch)
+        """
+        bottom_dead_height = self.dead_coils_per_end * self.pitch_dead
+        top_start = self.total_coils - self.dead_coils_per_end
+        m_bot = n <= self.dead_coils_per_end
+        m_top = (n >= top_start) & ~m_bot
+        m_mid = ~(m_bot | m_top)
+        
+        z = np.empty_like(n)
+        # Case A: 底部死圈
+        z[m_bot] = self.pitch_dead * n[m_bot]
+        # Case C: 顶部死圈
+        z[m_top] = bottom_dead_height + self.Hb_compressed + (n[m_top] - top_start) * self.pitch_dead
+        # Case B: 有效圈 (可压缩)
+        z[m_mid] = bottom_dead_height + self.pitch_active * (n[m_mid] - self.dead_coils_per_end)
+        
+        pitch = np.where(m_mid, self.pitch_active, self.pitch_dead)
+        return z, pitch
+
+
+def generate_compression_centerline(params, geom=None):
     """
     生成压缩弹簧参数化中心线
     算法与 Three.js compressionSpringGeometry.ts 完全一致
     
-    返回: [(x, y, z), ...] 点列表, min_z, max_z
-    """
-    total_coils = params.get("totalCoils", 10)
-    active_coils = params.get("activeCoils", 8)
-    mean_diameter = params.get("meanDiameter", 24.0)
-    wire_diameter = params.get("wireDiameter", 3.2)
-    free_length = params.get("freeLength", 50.0)
-    current_deflection = params.get("currentDeflection", 0.0)
+    geom: 已算好的 SpringGeom (省略时由 params 计算)
+    返回: (N, 3) 点数组, min_z, max_z
+    """
+    if geom is None:
+        geom = SpringGeom.from_params(params)
+    
+    total_coils = geom.total_coils
+    dead_coils_per_end = geom.dead_coils_per_end
+    R = geom.R
+    pitch_dead = geom.pitch_dead
+    Hb_compressed = geom.Hb_compressed
+    pitch_active_compressed = geom.pitch_active
+    
+    # 采样参数: 按圈数自适应 (每圈 samplesPerCoil 点，默认 32，至少 64 点)，可由 numSamples 显式指定
+    num_samples = params.get("numSamples")
+    if not num_samples:
+        samples_per_coil = params.get("samplesPerCoil", 32)
+        num_samples = max(64, int(round(total_coils * samples_per_coil)))
+    num_samples = int(num_samples)
+    total_angle = 2.0 * math.pi * total_coils
     
-    # 死圈计算
-    dead_coils = total_coils - active_coils
-    dead_coils_per_end = dead_coils / 2.0
+    if NUMBA_AVAILABLE:
+        arr, min_z, max_z = sample_helix(
+            num_samples, total_angle, R, dead_coils_per_end, total_coils,
+            pitch_dead, pitch_active_compressed, Hb_compressed
+        )
+        return arr, float(min_z), float(max_z)
     
-    # 尺寸
-    R = mean_diameter / 2.0
-    d = wire_diameter
-    L0 = free_length
-    delta_x = current_deflection
+    # 向量化采样: 一次性计算所有 theta / 圈数
+    t = np.arange(num_samples + 1) / num_samples
+    theta = t * total_angle
+    n = t * total_coils  # 当前圈数 (直接由 t 缩放，省去除以 2π)
     
-    # 节距计算
-    pitch_dead = d  # 死圈节距 ≈ 线径
-    dead_height = dead_coils * pitch_dead
-    Hb = L0 - dead_height  # 有效区域高度 (自由状态)
+    # 根据所在区段计算 Z
+    z, _ = geom.z_at(n)
     
-    # 压缩后有效高度
-    Hb_compressed = max(Hb - delta_x, active_coils * pitch_dead)
-    pitch_active_compressed = Hb_compressed / active_coils if active_coils > 0 else d
+    # X/Y 参数化
+    x = R * np.cos(theta)
+    y = R * np.sin(theta)
     
-    # 采样参数
-    num_samples = 800
-    total_angle = 2.0 * math.pi * total_coils
+    arr = np.column_stack((x, y, z))
     
-    points = []
-    min_z = float('inf')
-    max_z = float('-inf')
+    return arr, float(z.min()), float(z.max())
+
+
+def make_compression_bspline_path(geom):
+    """
+    压缩弹簧 B-Spline 中心线 (稀疏插值 + 解析切线)
     
-    for i in range(num_samples + 1):
-        t = i / num_samples
-        theta = t * total_angle
-        n = theta / (2.0 * math.pi)  # 当前圈数
-        
-        # 根据所在区段计算 Z
-        if n <= dead_coils_per_end:
-            # Case A: 底部死圈
-            z = pitch_dead * n
-        elif n >= total_coils - dead_coils_per_end:
-            # Case C: 顶部死圈
-            n_dead_top = n - (total_coils - dead_coils_per_end)
-            bottom_dead_height = dead_coils_per_end * pitch_dead
-            z = bottom_dead_height + Hb_compressed + n_dead_top * pitch_dead
-        else:
-            # Case B: 有效圈 (可压缩)
-            n_active = n - dead_coils_per_end
-            bottom_dead_height = dead_coils_per_end * pitch_dead
-            z = bottom_dead_height + pitch_active_compressed * n_active
-        
-        # X/Y 参数化
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        
-        points.append(App.Vector(x, y, z))
-        min_z = min(min_z, z)
-        max_z = max(max_z, z)
+    每 1/4 圈一个插值点，死圈 / 有效圈交界前后 ±0.5 圈加密到 1/16 圈；
+    每个点给出螺旋线闭式切线 (TangentFlags 全为 True)，
+    插值线性方程组规模从 ~几百点降到 ~几十点
+    返回: B-Spline 曲线的 Edge
+    """
+    total_coils = geom.total_coils
+    n = np.arange(int(math.floor(total_coils * 4)) + 1) / 4.0
+    dense = np.arange(-8, 9) / 16.0
+    for n_joint in (geom.dead_coils_per_end, total_coils - geom.dead_coils_per_end):
+        n = np.concatenate((n, n_joint + dense))
+    n = np.concatenate((n, (total_coils,)))
+    n = np.unique(np.round(n[(n >= 0.0) & (n <= total_coils)], 9))
     
-    return points, min_z, max_z
+    theta = 2.0 * math.pi * n
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    z, pitch = geom.z_at(n)
+    pts = np.column_stack((geom.R * cos_t, geom.R * sin_t, z))
+    # d/dn (R cosθ, R sinθ, z)，θ = 2πn
+    tangents = np.column_stack((-2.0 * math.pi * geom.R * sin_t,
+                                2.0 * math.pi * geom.R * cos_t,
+                                pitch))
+    
+    bs = Part.BSplineCurve()
+    bs.interpolate(Points=vectors_from_array(pts),
+                   Tangents=vectors_from_array(tangents),
+                   TangentFlags=[True] * len(pts))
+    print(f"B-Spline interpolate (analytic tangents): {len(pts)} points")
+    return bs.toShape()
+
+
+def fuse_all(shapes):
+    """
+    多个实体一次性布尔合并 (multiFuse，所有交线只算一次)，避免逐段 fuse 的 O(N²) 开销
+    旧版 FreeCAD 无 multiFuse 或批量合并失败时回退为逐个 fuse
+    """
+    if len(shapes) == 1:
+        return shapes[0]
+    try:
+        return shapes[0].multiFuse(shapes[1:])
+    except Exception as e:
+        print(f"multiFuse failed: {e}, fusing pairwise")
+    result = shapes[0]
+    for shape in shapes[1:]:
+        result = result.fuse(shape)
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def make_grind_cutters(radius, height, bottom_top_z, top_bottom_z):
+    """
+    端面磨平切割体: 以 Z 轴为中心、半径略大于弹簧外径的圆柱
+    底部切割体顶面位于 bottom_top_z，顶部切割体底面位于 top_bottom_z
+    
+    切割体只比弹簧外圆大一圈，BOP 的包围盒预筛选能更早排除无关面对
+    (旧实现用 3 倍中径的方盒)
+    按尺寸缓存: 参数扫描中线径 / 中径 / 长度不变时只构建一次。
+    布尔运算不修改工具形状，返回的切割体可共享，调用方不得原地 translate / rotate
+    返回: (bottom_cutter, top_cutter)
+    """
+    bottom_cutter = Part.makeCylinder(radius, height, App.Vector(0, 0, bottom_top_z - height))
+    top_cutter = Part.makeCylinder(radius, height, App.Vector(0, 0, top_bottom_z))
+    return bottom_cutter, top_cutter
+
+
+def _cut_boxes(solid, bottom_box, top_box):
+    """两个切割盒一次布尔运算切除；旧版绑定不支持多工具 cut 时回退为顺序切割"""
+    try:
+        return solid.cut([bottom_box, top_box])
+    except TypeError as e:
+        print(f"Multi-tool cut unavailable ({e}), cutting sequentially")
+        return solid.cut(bottom_box).cut(top_box)
+
+
+def cut_both_ends(solid, bottom_box, top_box):
+    """
+    端面磨平: 两个切割盒一次布尔运算切除 (一次 BOP 求交，而非两次重建拓扑)
+    
+    不预先做 isValid / removeSplitter (BRepCheck 全量检查与面合并都很贵)，
+    只有布尔运算失败时才 removeSplitter 修复后重试一次
+    """
+    try:
+        return _cut_boxes(solid, bottom_box, top_box)
+    except Exception as e:
+        print(f"Ground-end cut failed ({e}), retrying after removeSplitter")
+    return _cut_boxes(solid.removeSplitter(), bottom_box, top_box)
+
+
+# BSplineCurve.interpolate / approximate 是否接受 [x, y, z] 序列作为点 (首次调用时探测)
+_BSPLINE_SEQ_POINTS = None
+
+
+def _bspline_fit(method, arr, **kwargs):
+    """
+    以 (N, 3) 数组调用 BSplineCurve.interpolate / approximate
+    绑定接受长度为 3 的序列时直接传 arr.tolist()，跳过逐点构造 App.Vector；
+    否则 (TypeError) 记住结果并回退到 App.Vector 列表
+    """
+    global _BSPLINE_SEQ_POINTS
+    if _BSPLINE_SEQ_POINTS is not False:
+        try:
+            method(arr.tolist(), **kwargs)
+            _BSPLINE_SEQ_POINTS = True
+            return
+        except TypeError:
+            _BSPLINE_SEQ_POINTS = False
+    method(vectors_from_array(arr), **kwargs)
+
+
+# B-Spline 拟合方式选择阈值
+_BSPLINE_APPROX_MAX_POINTS = 100    # 不超过此点数: 直接 approximate
+_BSPLINE_INTERP_MAX_POINTS = 400    # 超过此点数: 采样后 approximate (更快)
+_BSPLINE_MAX_TURN_COS = math.cos(math.radians(30.0))  # 相邻弦最大转角 30°
+
+
+def _is_smooth(arr):
+    """
+    点列是否适合精确插值: 无重合点，且相邻弦向量转角都小于 30°
+    (每个三元组一次点积；出现折角 / 重合点时 interpolate 易病态)
+    """
+    chords = np.diff(arr, axis=0)
+    lengths = np.linalg.norm(chords, axis=1)
+    if lengths.min() <= 1e-9:
+        return False
+    unit = chords / lengths[:, None]
+    cos_turn = np.einsum("ij,ij->i", unit[:-1], unit[1:])
+    return bool(cos_turn.min() >= _BSPLINE_MAX_TURN_COS)
+
+
+def _choose_fit(arr):
+    """按点数与平滑度预先选择拟合方式: 'approx' / 'interp' / 'approx_sampled'"""
+    n = len(arr)
+    if n <= _BSPLINE_APPROX_MAX_POINTS:
+        return "approx"
+    if n <= _BSPLINE_INTERP_MAX_POINTS and _is_smooth(arr):
+        return "interp"
+    return "approx_sampled"
 
 
 def make_bspline_from_points(points, max_degree=3):
     """
     从点列表创建 B-Spline 曲线
     
-    对于大量点，使用分段逼近以提高稳定性
+    拟合方式按点数与平滑度预先确定 (_choose_fit)，不再先试 interpolate 再回退:
+    - 少量点: 直接逼近
+    - 中等点数且平滑: 精确插值
+    - 大量点或有折角: 采样后高精度逼近
+    points 可以是 App.Vector 列表或 (N, 3) NumPy 数组
     """
-    if len(points) < 2:
+    arr = _as_ndarray(points)
+    
+    if len(arr) < 2:
         raise ValueError("Need at least 2 points for B-Spline")
     
-    # 如果点数较少，直接逼近
-    if len(points) <= 100:
+    fit = _choose_fit(arr)
+    
+    if fit == "approx":
         bs = Part.BSplineCurve()
-        bs.approximate(points, DegMax=max_degree, Tolerance=0.1)
+        _bspline_fit(bs.approximate, arr, DegMax=max_degree, Tolerance=0.1)
         return bs.toShape()
     
-    # 对于大量点，使用 interpolate 而不是 approximate
-    # interpolate 更稳定，但会精确通过所有点
-    try:
-        bs = Part.BSplineCurve()
-        bs.interpolate(points)
-        shape = bs.toShape()
-        print(f"B-Spline interpolate: {len(points)} points -> {len(shape.Edges)} edges")
-        return shape
-    except Exception as e:
-        print(f"B-Spline interpolate failed: {e}, trying approximate with sampling")
+    if fit == "interp":
+        # interpolate 精确通过所有点；预检查已排除病态输入，异常只作兜底
+        try:
+            bs = Part.BSplineCurve()
+            _bspline_fit(bs.interpolate, arr)
+            shape = bs.toShape()
+            print(f"B-Spline interpolate: {len(arr)} points -> {len(shape.Edges)} edges")
+            return shape
+        except Exception as e:
+            print(f"B-Spline interpolate failed: {e}, trying approximate with sampling")
     
-    # 备用：对点进行采样后再逼近
+    # 采样后再逼近
     # 目标：最多 300 个点，高精度
+    # 在数组上按步长切片 (末点不在切片中时补上)
     target_points = 300
-    sample_rate = max(1, len(points) // target_points)
-    sampled_points = [points[i] for i in range(0, len(points), sample_rate)]
-    # 确保包含最后一个点
-    if sampled_points[-1] != points[-1]:
-        sampled_points.append(points[-1])
+    sample_rate = max(1, len(arr) // target_points)
+    sampled = arr[::sample_rate]
+    if (len(arr) - 1) % sample_rate != 0:
+        sampled = np.vstack((sampled, arr[-1:]))
     
-    print(f"Sampled {len(points)} points to {len(sampled_points)} points")
+    print(f"Sampled {len(arr)} points to {len(sampled)} points")
     
     bs = Part.BSplineCurve()
-    bs.approximate(sampled_points, DegMax=max_degree, Tolerance=0.01)  # 高精度
+    _bspline_fit(bs.approximate, sampled, DegMax=max_degree, Tolerance=0.01)  # 高精度
     return bs.toShape()
 
 
-def sweep_wire_along_path(path_shape, wire_diameter):
+def helix_start_tangent(R, pitch):
+    """
+    起点在 +X、绕 Z 逆时针上升的螺旋线在起点的单位切线
+    d/dθ (R cosθ, R sinθ, pitch·θ/2π) 在 θ = 0 处为 (0, R, pitch/2π)
+    """
+    return App.Vector(0, R, pitch / (2.0 * math.pi)).normalize()
+
+
+def make_circle_profile(path_wire, wire_diameter, start_tangent=None):
+    """
+    在路径起点创建垂直于起始切线的圆截面 Wire
+    起点与切线只求一次，调用方在各扫掠备用方法之间复用返回的 Wire
+    
+    start_tangent: 已知的解析起始切线 (如 helix_start_tangent)；
+    省略时才对首条边求导 (tangentAt)
+    """
+    start_point = path_wire.Vertexes[0].Point
+    if start_tangent is not None:
+        tangent = start_tangent
+    else:
+        first_edge = path_wire.Edges[0]
+        tangent = first_edge.tangentAt(first_edge.FirstParameter)
+    circle = Part.makeCircle(wire_diameter / 2.0, start_point, tangent)
+    return Part.Wire([circle])
+
+
+def pipe_shell_binormal(path_wire, profile_wire, binormal_axis):
+    """
+    固定副法线模式扫掠 (BRepOffsetAPI_MakePipeShell::SetMode(BiNormal))
+    截面姿态由切线与固定轴直接确定，不依赖路径曲率，
+    避免 Frenet 标架在曲率趋零处 (副法线 0/0) 失效
+    仅适用于轴线沿 binormal_axis 的等节距圆柱螺旋: 升角变化时 (死圈/有效圈交界、
+    变节距、变中径) 截面保持起点倾角，不再垂直于路径，圆截面被扫成椭圆，应改用 Frenet
+    返回: Solid (失败时抛出异常)
+    """
+    sweeper = Part.BRepOffsetAPI.MakePipeShell(path_wire)
+    sweeper.setBiNormalMode(binormal_axis)
+    sweeper.add(profile_wire)
+    sweeper.build()
+    sweeper.makeSolid()
+    return sweeper.shape()
+
+
+def sweep_wire_along_path(path_shape, wire_diameter, binormal_axis=None, start_tangent=None):
     """
     沿路径扫掠圆截面生成实体
     使用 Part.makeSweepSurface 或 Part.Wire.makePipe
+    
+    binormal_axis: 螺旋轴方向 (App.Vector)；给定时优先用固定副法线模式扫掠，
+    仅适用于升角恒定的纯螺旋 (等节距、等中径，不含钩环)，其余路径保持 None 走 Frenet
+    start_tangent: 路径起点的解析切线，传给 make_circle_profile
     """
     if hasattr(path_shape, 'Edges'):
         edges = path_shape.Edges
@@ -219,26 +578,32 @@ def sweep_wire_along_path(path_shape, wire_diameter):
     
     path_wire = Part.Wire(edges)
     
-    # 获取起点和切线
-    start_point = path_wire.Vertexes[0].Point
-    first_edge = path_wire.Edges[0]
-    tangent = first_edge.tangentAt(first_edge.FirstParameter)
-    
-    # 创建圆截面
+    # 所有备用方法共用同一个路径与圆截面，只构建一次
     radius = wire_diameter / 2.0
-    circle = Part.makeCircle(radius, start_point, tangent)
-    circle_wire = Part.Wire([circle])
+    circle_wire = make_circle_profile(path_wire, wire_diameter, start_tangent)
+    
+    # 方法0: 固定副法线扫掠 (螺旋路径)
+    if binormal_axis is not None:
+        try:
+            solid = pipe_shell_binormal(path_wire, circle_wire, binormal_axis)
+            valid = solid.isValid()
+            print(f"BiNormal pipe result: ShapeType={solid.ShapeType}, Volume={solid.Volume:.2f}, isValid={valid}")
+            if valid:
+                return solid
+        except Exception as e:
+            print(f"BiNormal pipe failed: {e}")
     
     # 方法1: makePipeShell (生成有效的 Solid，支持布尔运算)
     try:
         solid = path_wire.makePipeShell([circle_wire], True, True)
-        print(f"makePipeShell result: ShapeType={solid.ShapeType}, Volume={solid.Volume:.2f}, isValid={solid.isValid()}")
-        if solid.isValid():
+        valid = solid.isValid()
+        print(f"makePipeShell result: ShapeType={solid.ShapeType}, Volume={solid.Volume:.2f}, isValid={valid}")
+        if valid:
             return solid
         # 如果无效，尝试修复
         fixed = solid.removeSplitter()
         if fixed.isValid():
-            print(f"makePipeShell fixed: isValid={fixed.isValid()}")
+            print("makePipeShell fixed: isValid=True")
             return fixed
         return solid
     except Exception as e:
@@ -260,7 +625,6 @@ def sweep_wire_along_path(path_shape, wire_diameter):
     
     # 方法3: 使用 BRepOffsetAPI
     try:
-        from FreeCAD import Base
         sweeper = Part.BRepOffsetAPI.MakePipeShell(path_wire)
         sweeper.setFrenetMode(True)  # Frenet 模式
         sweeper.add(circle_wire)
@@ -288,7 +652,15 @@ def sweep_wire_along_path(path_shape, wire_diameter):
     except Exception as e:
         print(f"makeTube on wire failed: {e}")
     
-    # 方法5: 最后备用 - 逐段扫掠并融合
+    # 方法5: 整条路径非 Frenet makePipeShell (一次扫掠，无需逐段融合)
+    try:
+        solid = path_wire.makePipeShell([circle_wire], True, False)
+        print(f"makePipeShell (non-Frenet) result: ShapeType={solid.ShapeType}, Volume={solid.Volume:.2f}")
+        return solid
+    except Exception as e:
+        print(f"makePipeShell (non-Frenet) failed: {e}")
+    
+    # 方法6: 最后备用 - 逐段扫掠并融合
     print("Warning: Using edge-by-edge sweep (may have gaps)")
     try:
         shapes = []
@@ -296,13 +668,8 @@ def sweep_wire_along_path(path_shape, wire_diameter):
             tube = Part.makeTube(edge, radius)
             shapes.append(tube)
         if shapes:
-            result = shapes[0]
             print(f"Edge-by-edge: starting with {len(shapes)} segments")
-            for i, s in enumerate(shapes[1:]):
-                try:
-                    result = result.fuse(s)
-                except Exception as fe:
-                    print(f"Fuse segment {i+1} failed: {fe}")
+            result = fuse_all(shapes)
             print(f"Edge-by-edge result: ShapeType={result.ShapeType}, Volume={result.Volume:.2f}")
             return result
     except Exception as e:
@@ -315,6 +682,58 @@ def sweep_wire_along_path(path_shape, wire_diameter):
 # 压缩弹簧生成器 (与 Three.js 同步，带端面磨平)
 # =============================================================================
 
+def make_compression_helix_path(R, active_coils, dead_coils_per_end, pitch_dead, pitch_active):
+    """
+    压缩弹簧解析中心线: 底部死圈 / 有效圈 / 顶部死圈 三段等节距螺旋线首尾相接
+    与 generate_compression_centerline 的分段 Z 算法一致，但不做采样与 B-Spline 拟合
+    
+    每段由 Part.makeHelix 生成 (起点在 +X)，绕 Z 旋转到上一段的终止角并平移到起始高度
+    返回: Part.Wire
+    """
+    segments = (
+        (dead_coils_per_end, pitch_dead),   # 底部死圈
+        (active_coils, pitch_active),       # 有效圈
+        (dead_coils_per_end, pitch_dead),   # 顶部死圈
+    )
+    
+    edges = []
+    turns_done = 0.0
+    z0 = 0.0
+    for turns, pitch in segments:
+        if turns <= 1e-9 or pitch <= 1e-9:
+            continue
+        height = turns * pitch
+        helix = Part.makeHelix(pitch, height, R)
+        helix.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1), 360.0 * turns_done)
+        helix.translate(App.Vector(0, 0, z0))
+        edges.extend(helix.Edges)
+        turns_done += turns
+        z0 += height
+    
+    if not edges:
+        raise ValueError("Degenerate compression spring: no helix segments")
+    return Part.Wire(edges)
+
+
+def _compression_centerline_params(params):
+    """
+    压缩弹簧中心线参数 (自由状态，currentDeflection = 0)
+    采样密度 numSamples / samplesPerCoil 原样透传给 generate_compression_centerline，
+    调用方可在精度与速度间取舍 (二者也在 _compression_cache_key 中)
+    """
+    Na = params.get("activeCoils", 8)
+    return {
+        "totalCoils": params.get("totalCoils", Na + 2),
+        "activeCoils": Na,
+        "meanDiameter": params.get("meanDiameter", 24.0),
+        "wireDiameter": params.get("wireDiameter", 3.2),
+        "freeLength": params.get("freeLength", 50.0),
+        "currentDeflection": 0.0,
+        "numSamples": params.get("numSamples"),
+        "samplesPerCoil": params.get("samplesPerCoil", 32),
+    }
+
+
 def make_compression_spring_parametric(params):
     """
     使用与 Three.js compressionSpringGeometry.ts 完全相同的参数化算法
@@ -331,55 +750,75 @@ def make_compression_spring_parametric(params):
     L0 = params.get("freeLength", 50.0)
     ground_ends = params.get("groundEnds", True)
     
-    R = Dm / 2.0
     wire_radius = d / 2.0
     
-    # === 与 Three.js 完全一致的参数计算 ===
-    dead_coils = Nt - Na
-    dead_coils_per_end = dead_coils / 2.0
-    
-    pitch_dead = d  # 死圈节距 = 线径 (紧密)
-    dead_height = dead_coils * pitch_dead
-    Hb = L0 - dead_height  # 有效区域高度
-    pitch_active = Hb / Na if Na > 0 else d  # 有效圈节距
+    # === 与 Three.js 完全一致的参数计算 (与中心线采样共用 SpringGeom) ===
+    centerline_params = _compression_centerline_params(params)
+    geom = SpringGeom.from_params(centerline_params)
+    R = geom.R
+    dead_coils_per_end = geom.dead_coils_per_end
+    pitch_dead = geom.pitch_dead  # 死圈节距 = 线径 (紧密)
+    pitch_active = geom.pitch_active  # 有效圈节距
     
     print(f"Parameters: Nt={Nt}, Na={Na}, dead_coils_per_end={dead_coils_per_end}")
     print(f"Pitch: dead={pitch_dead:.2f}, active={pitch_active:.2f}")
     
-    # === 使用参数化中心线生成点 (与 Three.js 一致) ===
-    points, min_z, max_z = generate_compression_centerline({
-        "totalCoils": Nt,
-        "activeCoils": Na,
-        "meanDiameter": Dm,
-        "wireDiameter": d,
-        "freeLength": L0,
-        "currentDeflection": 0.0,
-    })
-    
-    # 创建 B-Spline 路径
-    path = make_bspline_from_points(points)
-    path_wire = Part.Wire([path])
+    # === 路径: 默认用解析螺旋线 (死圈 / 有效圈 / 死圈 三段)，useBSplinePath 时走采样 + B-Spline ===
+    path_wire = None
+    if not params.get("useBSplinePath", False):
+        try:
+            path_wire = make_compression_helix_path(R, Na, dead_coils_per_end, pitch_dead, pitch_active)
+            print(f"Analytic helix path: {len(path_wire.Edges)} edges")
+        except Exception as e:
+            print(f"Analytic helix path failed: {e}, falling back to B-Spline")
     
-    # 获取起点和切线
-    start_point = path_wire.Vertexes[0].Point
-    first_edge = path_wire.Edges[0]
-    tangent = first_edge.tangentAt(first_edge.FirstParameter)
+    if path_wire is None:
+        # 稀疏插值点 + 解析切线的 B-Spline，失败时回退到密集采样拟合
+        try:
+            path = make_compression_bspline_path(geom)
+        except Exception as e:
+            print(f"Reduced B-Spline path failed: {e}, using dense centerline samples")
+            # 使用参数化中心线生成点 (与 Three.js 一致)
+            points, min_z, max_z = generate_compression_centerline(centerline_params, geom)
+            path = make_bspline_from_points(points)
+        path_wire = Part.Wire([path])
     
-    # 创建圆截面
-    circle = Part.makeCircle(wire_radius, start_point, tangent)
-    circle_wire = Part.Wire([circle])
+    # 创建圆截面 (起点切线由螺旋线闭式给出，首段为死圈时用死圈节距)
+    pitch_start = pitch_dead if dead_coils_per_end > 1e-9 else pitch_active
+    circle_wire = make_circle_profile(path_wire, d, helix_start_tangent(R, pitch_start))
     
     # 扫掠生成实体
     spring_solid = None
     
+    # 方法0: 固定副法线扫掠 (轴线沿 Z 的螺旋，不依赖 Frenet 标架)
+    # 仅在全长等节距时使用；死圈节距不同时升角在交界处变化，截面会偏离垂直
+    if geom.constant_pitch:
+        try:
+            spring_solid = pipe_shell_binormal(path_wire, circle_wire, App.Vector(0, 0, 1))
+            if not spring_solid.isValid():
+                spring_solid = None
+            else:
+                print("BiNormal pipe succeeded")
+        except Exception as e:
+            print(f"BiNormal pipe failed: {e}")
+    
     # 方法1: makePipeShell
-    try:
-        spring_solid = path_wire.makePipeShell([circle_wire], True, True)
-        print("makePipeShell succeeded")
-    except Exception as e:
-        print(f"makePipeShell failed: {e}")
+    if spring_solid is None:
+        try:
+            spring_solid = path_wire.makePipeShell([circle_wire], True, True)
+            print("makePipeShell succeeded")
+        except Exception as e:
+            print(f"makePipeShell failed: {e}")
+    
+    # 方法2: 非 Frenet makePipeShell (整条路径一次扫掠)
+    if spring_solid is None:
+        try:
+            spring_solid = path_wire.makePipeShell([circle_wire], True, False)
+            print("makePipeShell (non-Frenet) succeeded")
+        except Exception as e:
+            print(f"makePipeShell (non-Frenet) failed: {e}")
     
-    # 方法2: 逐边 makeTube
+    # 方法3: 逐边 makeTube
     if spring_solid is None:
         try:
             shapes = []
@@ -387,9 +826,7 @@ def make_compression_spring_parametric(params):
                 tube = Part.makeTube(edge, wire_radius)
                 shapes.append(tube)
             if shapes:
-                spring_solid = shapes[0]
-                for s in shapes[1:]:
-                    spring_solid = spring_solid.fuse(s)
+                spring_solid = fuse_all(shapes)
                 print("Edge-by-edge makeTube succeeded")
         except Exception as e:
             print(f"makeTube failed: {e}")
@@ -400,40 +837,29 @@ def make_compression_spring_parametric(params):
         # 工程级容差 - 解决 OCC/FreeCAD 布尔运算稳健性问题
         EPS = max(0.05 * d, 0.05)
         
-        # 修复形状 - 提高布尔运算成功率
-        if not spring_solid.isValid():
-            print(f"[Compression] Spring shape is invalid, attempting to fix...")
-            spring_solid = spring_solid.removeSplitter()
-        
         grind_depth = 0.3 * d  # 与 Three.js 一致
         
         # 使用中心线 Z 范围 (0 到 L0)，而不是 BoundBox
         bottom_cut_z = grind_depth
         top_cut_z = L0 - grind_depth
         
-        box_size = Dm * 3
-        box_height = d * 5  # 足够高的盒子
-        
-        # 底部切割盒 - 必须穿透弹簧实体
-        bottom_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, grind_depth + EPS - box_height)
-        )
+        cutter_r = Dm / 2.0 + d  # 比弹簧外圆 (R + d/2) 再大 d/2
+        box_height = d * 5  # 足够高的切割体
         
-        # 顶部切割盒 - 必须穿透弹簧实体
-        top_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, L0 - grind_depth - EPS)
+        # 上下两个切割体 - 必须穿透弹簧实体 (按尺寸缓存)
+        bottom_box, top_box = make_grind_cutters(
+            cutter_r, box_height, grind_depth + EPS, L0 - grind_depth - EPS
         )
         
         try:
-            # 验证几何交集
-            bottom_common = spring_solid.common(bottom_box)
-            top_common = spring_solid.common(top_box)
-            print(f"[Compression] Common volume: bottom={bottom_common.Volume:.2f}, top={top_common.Volume:.2f}")
+            # 验证几何交集 (纯诊断用的布尔运算，仅 DEBUG 级别执行)
+            if logger.isEnabledFor(logging.DEBUG):
+                bottom_common = spring_solid.common(bottom_box)
+                top_common = spring_solid.common(top_box)
+                logger.debug("[Compression] Common volume: bottom=%.2f, top=%.2f",
+                             bottom_common.Volume, top_common.Volume)
             
-            cut_result = spring_solid.cut(bottom_box)
-            cut_result = cut_result.cut(top_box)
+            cut_result = cut_both_ends(spring_solid, bottom_box, top_box)
             
             # 如果结果是 Compound，取最大的 Solid
             if cut_result.ShapeType == "Compound" and cut_result.Solids:
@@ -447,7 +873,53 @@ def make_compression_spring_parametric(params):
     return spring_solid
 
 
+# 压缩弹簧实体缓存: 参数扫描 / 仿真帧中同一组参数反复生成时直接复用 (LRU，最多 64 个)
+_COMPRESSION_CACHE = OrderedDict()
+_COMPRESSION_CACHE_SIZE = 64
+
+
+def _compression_cache_key(params):
+    """
+    按几何参数生成缓存键
+    线径取 4 位小数；中径 / 自由长度按线径的 1% 量化 (低于建模精度)，
+    仿真 / 参数扫描传入的浮点抖动仍能命中同一项；圈数取 4 位小数
+    """
+    Na = params.get("activeCoils", 8)
+    d = round(params.get("wireDiameter", 3.2), 4)
+    q = max(d * 0.01, 1e-4)
+    return (
+        d,
+        round(params.get("meanDiameter", 24.0) / q),
+        round(Na, 4),
+        round(params.get("totalCoils", Na + 2), 4),
+        round(params.get("freeLength", 50.0) / q),
+        bool(params.get("groundEnds", True)),
+        bool(params.get("useBSplinePath", False)),
+        params.get("numSamples"),
+        params.get("samplesPerCoil"),
+    )
+
+
 def make_compression_spring(params):
+    """
+    生成压缩弹簧 (带 LRU 缓存，命中时返回缓存实体的副本)
+    """
+    key = _compression_cache_key(params)
+    cached = _COMPRESSION_CACHE.get(key)
+    if cached is not None:
+        _COMPRESSION_CACHE.move_to_end(key)
+        print("[Compression] Using cached solid")
+        return cached.copy()
+    
+    spring_solid = _make_compression_spring(params)
+    if spring_solid is not None and not spring_solid.isNull():
+        _COMPRESSION_CACHE[key] = spring_solid.copy()
+        if len(_COMPRESSION_CACHE) > _COMPRESSION_CACHE_SIZE:
+            _COMPRESSION_CACHE.popitem(last=False)
+    return spring_solid
+
+
+def _make_compression_spring(params):
     """
     生成压缩弹簧 - 使用与 Three.js 同步的参数化算法
     """
@@ -459,54 +931,36 @@ def make_compression_spring(params):
     # 备用：BSpline 方法
     d = params.get("wireDiameter", 3.2)
     Dm = params.get("meanDiameter", 24.0)
-    Na = params.get("activeCoils", 8)
-    Nt = params.get("totalCoils", Na + 2)
     L0 = params.get("freeLength", 50.0)
     ground_ends = params.get("groundEnds", True)
     
-    centerline_params = {
-        "totalCoils": Nt,
-        "activeCoils": Na,
-        "meanDiameter": Dm,
-        "wireDiameter": d,
-        "freeLength": L0,
-        "currentDeflection": 0.0,
-    }
+    centerline_params = _compression_centerline_params(params)
     
-    points, min_z, max_z = generate_compression_centerline(centerline_params)
+    geom = SpringGeom.from_params(centerline_params)
+    points, min_z, max_z = generate_compression_centerline(centerline_params, geom)
     path = make_bspline_from_points(points)
-    spring_solid = sweep_wire_along_path(path, d)
+    # 固定副法线只用于等节距螺旋，否则走 Frenet 保持截面垂直于路径
+    binormal_axis = App.Vector(0, 0, 1) if geom.constant_pitch else None
+    spring_solid = sweep_wire_along_path(path, d, binormal_axis=binormal_axis)
     
     if ground_ends:
         # 工程级容差 - 解决 OCC/FreeCAD 布尔运算稳健性问题
         EPS = max(0.05 * d, 0.05)
         
-        # 修复形状
-        if spring_solid and not spring_solid.isValid():
-            spring_solid = spring_solid.removeSplitter()
-        
         grind_depth = 0.3 * d
         bottom_cut_z = grind_depth
         top_cut_z = L0 - grind_depth
         
-        box_size = Dm * 3
+        cutter_r = Dm / 2.0 + d
         box_height = d * 5
         
-        # 底部切割盒 - 必须穿透弹簧实体
-        bottom_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, grind_depth + EPS - box_height)
-        )
-        
-        # 顶部切割盒 - 必须穿透弹簧实体
-        top_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, L0 - grind_depth - EPS)
+        # 上下两个切割体 - 必须穿透弹簧实体 (按尺寸缓存)
+        bottom_box, top_box = make_grind_cutters(
+            cutter_r, box_height, grind_depth + EPS, L0 - grind_depth - EPS
         )
         
         try:
-            cut_result = spring_solid.cut(bottom_box)
-            cut_result = cut_result.cut(top_box)
+            cut_result = cut_both_ends(spring_solid, bottom_box, top_box)
             
             # 如果结果是 Compound，取最大的 Solid
             if cut_result.ShapeType == "Compound" and cut_result.Solids:
@@ -524,27 +978,53 @@ def make_compression_spring(params):
 # 拉伸弹簧生成器 (与 Three.js extensionSpringGeometry.ts 同步)
 # =============================================================================
 
-def generate_helix_points(R, L, turns, num_samples, left_handed=False):
-    """生成螺旋线点"""
+def helix_num_samples(R, L, turns, wire_diameter=None, min_samples=200):
+    """
+    按弧长自适应的螺旋采样点数
+    
+    每圈弧长 = sqrt((2πR)² + pitch²)，点距约等于线径，
+    每圈点数限制在 20~36 之间 (不超过原先固定的每圈 36 点)
+    未给出线径时按每圈 36 点
+    """
+    if turns <= 0:
+        return min_samples
+    if wire_diameter and wire_diameter > 0:
+        pitch = L / turns
+        per_turn_length = math.sqrt((2.0 * math.pi * R) ** 2 + pitch * pitch)
+        points_per_turn = clamp(int(per_turn_length / wire_diameter), 20, 36)
+    else:
+        points_per_turn = 36
+    return max(min_samples, int(turns * points_per_turn))
+
+
+def generate_helix_points(R, L, turns, num_samples=None, left_handed=False, wire_diameter=None):
+    """
+    生成螺旋线点，返回 (N, 3) 数组
+    num_samples 为 None 时按 helix_num_samples 自适应
+    """
+    if num_samples is None:
+        num_samples = helix_num_samples(R, L, turns, wire_diameter)
     sign = -1 if left_handed else 1
-    points = []
-    for i in range(num_samples + 1):
-        t = float(i) / num_samples
-        theta = 2.0 * math.pi * turns * t * sign
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        z = L * t
-        points.append(App.Vector(x, y, z))
-    return points
-
-
-def cubic_bezier(p0, p1, p2, p3, t):
-    """三次贝塞尔曲线插值"""
-    omt = 1.0 - t
-    return (p0 * (omt * omt * omt) + 
-            p1 * (3 * omt * omt * t) + 
-            p2 * (3 * omt * t * t) + 
-            p3 * (t * t * t))
+    return coil_points(0.0, 2.0 * math.pi * turns * sign, 0.0, L, R, R, num_samples)
+
+
+def _bernstein_basis(ts):
+    """
+    三次 Bernstein 基矩阵 B, shape (N, 4)
+    贝塞尔曲线批量求值: B @ P, 其中 P = vstack(p0, p1, p2, p3) (4, 3)
+    """
+    omt = 1.0 - ts
+    return np.stack((omt * omt * omt, 3.0 * omt * omt * ts, 3.0 * omt * ts * ts, ts * ts * ts), axis=1)
+
+
+# 钩子过渡段固定 24 段 (t = 1/24 .. 1)，基矩阵在导入时算好，所有钩子共用
+_TS24 = np.arange(1, 25) / 24.0
+_BERN24 = _bernstein_basis(_TS24)
+_BERN24.flags.writeable = False
+
+# 拉簧钩环圆弧段数；单个钩子中心线点数 = 过渡段 24 点 + 钩环 36 点 (去掉与过渡段重合的首点)
+_HOOK_LOOP_SEGMENTS = 36
+EXTENSION_HOOK_POINTS = len(_TS24) + _HOOK_LOOP_SEGMENTS
 
 
 def clamp_radius(point, min_radius):
@@ -552,11 +1032,13 @@ def clamp_radius(point, min_radius):
     Radius clamp: 确保点不凹入线圈内部
     如果点的 XY 距离小于 min_radius，则投影到该半径上
     """
-    r = math.sqrt(point.x**2 + point.y**2)
-    if r < min_radius and r > 1e-8:
-        scale = min_radius / r
-        return App.Vector(point.x * scale, point.y * scale, point.z)
-    return point
+    # 先比较半径平方，绝大多数点无需钳制，可跳过 sqrt
+    x, y = point.x, point.y
+    r2 = x * x + y * y
+    if r2 >= min_radius * min_radius or r2 <= 1e-16:
+        return point
+    scale = min_radius / math.sqrt(r2)
+    return App.Vector(x * scale, y * scale, point.z)
 
 
 # NOTE: generate_extension_body_centerline is defined later with full Three.js alignment
@@ -573,23 +1055,14 @@ def generate_hook_loop(hook_center, hook_radius, u, v, angle_deg, start_angle=-m
     - angle_deg: 环弧度数 (例如 270)
     - start_angle: 起始角度 (默认 -π/2)
     - num_points: 采样点数 (默认 20)
-    """
-    pts = []
-    total_angle = math.radians(angle_deg)
-    segments = num_points
-    
-    for i in range(segments + 1):
-        t = i / segments
-        theta = start_angle + total_angle * t
-        p = (hook_center + 
-             u * (hook_radius * math.cos(theta)) + 
-             v * (hook_radius * math.sin(theta)))
-        pts.append(p)
     
-    return pts
+    返回: (num_points+1, 3) 数组
+    """
+    return sample_arc_points(hook_center, hook_radius, u, v,
+                             start_angle, math.radians(angle_deg), num_points)
 
 
-def build_extension_hook_centerline(end_pos, prev_pos, params, is_start):
+def build_extension_hook_centerline(end_pos, prev_pos, params, is_start, out=None):
     """
     生成拉簧钩子中心线 - 与 Three.js HookBuilder.ts 完全同步
     
@@ -601,6 +1074,10 @@ def build_extension_hook_centerline(end_pos, prev_pos, params, is_start):
     - handleLengthFactor: 2.0
     
     结构: 贝塞尔过渡段 + 钩环圆弧
+    
+    end_pos / prev_pos 可以是 App.Vector 或 shape (3,) 数组
+    out: 可选的 (EXTENSION_HOOK_POINTS, 3) 缓冲区 (如整条中心线数组的切片)，结果直接写入
+    返回: (EXTENSION_HOOK_POINTS, 3) 数组 (给定 out 时即 out)
     """
     d = params.get("wireDiameter", 2.0)
     OD = params.get("outerDiameter", 18.0)
@@ -622,87 +1099,68 @@ def build_extension_hook_centerline(end_pos, prev_pos, params, is_start):
     
     is_end = not is_start
     
+    end_pos = _as_ndarray(end_pos)
+    prev_pos = _as_ndarray(prev_pos)
+    
     # 轴向方向
-    spring_axis_dir = App.Vector(0, 0, 1 if is_end else -1)
+    spring_axis_dir = np.array((0.0, 0.0, 1.0 if is_end else -1.0))
     
     # 径向方向: 从轴线到端点的 XY 投影
-    radial_dir = App.Vector(end_pos.x, end_pos.y, 0)
-    if radial_dir.Length < 1e-8:
-        radial_dir = App.Vector(1, 0, 0)
-    else:
-        radial_dir.normalize()
-    
-    # 螺旋线切线方向 (3D)
-    helix_tangent = end_pos.sub(prev_pos)
-    helix_tangent.normalize()
+    rx, ry = _safe_normalize_xy(float(end_pos[0]), float(end_pos[1]))
     
     # === Hook 环平面基向量 (axis-plane 类型) ===
     # u = 轴向 (拉力方向)
-    # v = radial × axis (切向)
-    u = App.Vector(spring_axis_dir.x, spring_axis_dir.y, spring_axis_dir.z)
-    u.normalize()
-    v = radial_dir.cross(spring_axis_dir)
-    v.normalize()
+    # v = radial × axis (切向)；radial ⊥ axis 且均为单位向量，叉积无需再归一化
+    u = spring_axis_dir
+    az = spring_axis_dir[2]
+    v = np.array((ry * az, -rx * az, 0.0))
     
     # === Hook 环圆心 (在轴线上) ===
-    loop_center = App.Vector(0, 0, end_pos.z + (hook_gap if is_end else -hook_gap))
+    loop_center = np.array((0.0, 0.0, end_pos[2] + (hook_gap if is_end else -hook_gap)))
     
     # === 生成 Hook 环圆弧点 ===
     total_arc = math.radians(loop_angle_deg)
-    loop_segments = 36  # 高精度
-    hook_loop_pts = []
-    
-    for i in range(loop_segments + 1):
-        t = i / loop_segments
-        theta = loop_start_angle + total_arc * t
-        cos_theta = math.cos(theta)
-        sin_theta = math.sin(theta)
-        
-        p = loop_center + u * (hook_radius * cos_theta) + v * (hook_radius * sin_theta)
-        hook_loop_pts.append(p)
+    loop_segments = _HOOK_LOOP_SEGMENTS  # 高精度
+    # NumPy 路径下三角表按 (段数, 起始角, 弧度) 缓存，起止两个钩子共用
+    hook_loop_arr = sample_arc_points(loop_center, hook_radius, u, v,
+                                      loop_start_angle, total_arc, loop_segments)
     
     # === 贝塞尔过渡段 (C¹ 连续) ===
-    attach_point = hook_loop_pts[0]
+    attach_point = hook_loop_arr[0]
     
-    # 螺旋线端点的切线方向
-    if is_end:
-        helix_tangent_dir = end_pos.sub(prev_pos)
-    else:
-        helix_tangent_dir = prev_pos.sub(end_pos)
-        helix_tangent_dir = helix_tangent_dir * (-1)
-    helix_tangent_dir.normalize()
+    # 螺旋线端点的切线方向 (起止钩子均为 end - prev)
+    tx, ty, tz = (end_pos - prev_pos).tolist()
+    inv_len = 1.0 / math.sqrt(tx * tx + ty * ty + tz * tz)
+    helix_tangent_dir = np.array((tx * inv_len, ty * inv_len, tz * inv_len))
     
     # 钩环起点的切线方向
     hook_tangent = u * (-math.sin(loop_start_angle)) + v * math.cos(loop_start_angle)
-    hook_tangent.normalize()
+    hook_tangent /= np.linalg.norm(hook_tangent)
     
     # 贝塞尔控制点
     control1 = end_pos + helix_tangent_dir * handle_length
     control2 = attach_point - hook_tangent * handle_length
     
-    # 生成过渡段点
-    transition_pts = []
-    transition_segments = 24  # 高精度
-    
-    for i in range(1, transition_segments + 1):
-        t = i / transition_segments
-        p = cubic_bezier(end_pos, control1, control2, attach_point, t)
-        transition_pts.append(p)
+    # 生成过渡段点 (24 段高精度，预计算基矩阵 @ 控制点)
+    transition_arr = _BERN24 @ np.vstack((end_pos, control1, control2, attach_point))
     
     # 确保最后一个点精确连接
-    if transition_pts:
-        transition_pts[-1] = attach_point
+    transition_arr[-1] = attach_point
     
-    # === 组合最终中心线 ===
+    # === 组合最终中心线 (按切片写入输出缓冲区，不做中间拼接) ===
+    if out is None:
+        out = np.empty((EXTENSION_HOOK_POINTS, 3))
+    n_trans = len(transition_arr)
     if is_end:
         # End Hook: 过渡段 + 钩环 (去掉第一个点避免重复)
-        return transition_pts + hook_loop_pts[1:]
+        out[:n_trans] = transition_arr
+        out[n_trans:] = hook_loop_arr[1:]
     else:
         # Start Hook: 反转顺序
-        reversed_hook_pts = list(reversed(hook_loop_pts))
-        reversed_transition_pts = list(reversed(transition_pts))
-        # 钩环 (去掉最后一个点) + 过渡段
-        return reversed_hook_pts[:-1] + reversed_transition_pts
+        # 钩环 (反转后去掉最后一个点) + 过渡段 (反转)
+        out[:loop_segments] = hook_loop_arr[:0:-1]
+        out[loop_segments:] = transition_arr[::-1]
+    return out
 
 
 def normalize_extension_params(geom: dict) -> dict:
@@ -716,8 +1174,10 @@ def normalize_extension_params(geom: dict) -> dict:
     
     这个函数确保所有关键参数都有有效值
     """
-    # json is already imported at module level
-    print(f"[normalize] Input params: {json.dumps(geom, indent=2)}")
+    # 输入参数 dump 较贵 (json.dumps)，仅在 DEBUG 开启时序列化
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("[normalize] Input params: %s", json.dumps(geom, indent=2))
     
     d = geom.get("wireDiameter", 2.0)
     
@@ -738,7 +1198,8 @@ def normalize_extension_params(geom: dict) -> dict:
         mean_d = geom.get("meanDiameter")
         if mean_d is not None and mean_d > 0:
             OD = mean_d + d
-            print(f"[normalize] Converted meanDiameter {mean_d} to outerDiameter {OD}")
+            if debug:
+                logger.debug("[normalize] Converted meanDiameter %s to outerDiameter %s", mean_d, OD)
         else:
             OD = 18.0  # 默认值
             print(f"[normalize] WARNING: outerDiameter missing, using default {OD}")
@@ -754,11 +1215,13 @@ def normalize_extension_params(geom: dict) -> dict:
             # 假设钩子各占约 2*d 的长度
             hook_allowance = 4 * d
             body_len = max(free_len - hook_allowance, Na * d)
-            print(f"[normalize] Calculated bodyLength from freeLength: {body_len}")
+            if debug:
+                logger.debug("[normalize] Calculated bodyLength from freeLength: %s", body_len)
         else:
             # 密绕：pitch = d
             body_len = Na * d
-            print(f"[normalize] Using close-wound bodyLength: {body_len}")
+            if debug:
+                logger.debug("[normalize] Using close-wound bodyLength: %s", body_len)
     
     result = {
         **geom,
@@ -768,10 +1231,36 @@ def normalize_extension_params(geom: dict) -> dict:
         "outerDiameter": OD,
     }
     
-    print(f"[normalize] Output params: wireDiameter={d}, activeCoils={Na}, bodyLength={body_len}, outerDiameter={OD}")
+    if debug:
+        logger.debug("[normalize] Output params: wireDiameter=%s, activeCoils=%s, bodyLength=%s, outerDiameter=%s",
+                     d, Na, body_len, OD)
     return result
 
 
+@functools.lru_cache(maxsize=8)
+def _body_centerline_cached(d, OD, Na, current_extension):
+    """
+    拉簧本体中心线的缓存核心 (参数均为可哈希标量)
+    
+    同一弹簧的主流程与备用流程会以相同参数重复调用，命中缓存后不再重新采样
+    返回只读数组，调用方不得原地修改
+    """
+    R = (OD - d) / 2.0
+    
+    # === 与 Three.js 完全一致 ===
+    # 拉簧在自由状态（Δx=0）时线圈紧密贴合
+    # solidBodyLength = activeCoils × wireDiameter（线圈贴紧时的长度）
+    # 拉伸后才出现节距
+    extended_length = Na * d + current_extension
+    
+    # 采样参数: 按弧长自适应，点距约一个线径 (每圈 20~36 点，至少 200 点)
+    num_samples = helix_num_samples(R, extended_length, Na, d)
+    
+    arr = coil_points(0.0, 2.0 * math.pi * Na, 0.0, extended_length, R, R, num_samples)
+    arr.flags.writeable = False
+    return arr, extended_length
+
+
 def generate_extension_body_centerline(params):
     """
     生成拉簧本体中心线（紧密螺旋）
@@ -781,45 +1270,22 @@ def generate_extension_body_centerline(params):
       - 拉伸后长度 = solidBodyLength + currentExtension
       - 线圈总圈数 = activeCoils
     
-    返回: (points, z_min, z_max)
+    返回: (points (N, 3) 只读数组, z_min, z_max)
     """
-    d = params.get("wireDiameter", 2.0)
-    OD = params.get("outerDiameter", 18.0)
-    Na = params.get("activeCoils", 10)
-    current_extension = params.get("currentExtension", 0.0)
-    
-    Dm = OD - d
-    R = Dm / 2.0
-    
-    # === 与 Three.js 完全一致 ===
-    # 拉簧在自由状态（Δx=0）时线圈紧密贴合
-    # solidBodyLength = activeCoils × wireDiameter（线圈贴紧时的长度）
-    solid_body_length = Na * d
-    
-    # 拉伸后才出现节距
-    extended_length = solid_body_length + current_extension
-    
-    # 采样参数 - 高精度
-    # 每圈约 36 个点，保证平滑
-    num_samples = max(200, int(Na * 36))
-    total_angle = 2.0 * math.pi * Na
-    
-    points = []
-    for i in range(num_samples + 1):
-        t = i / num_samples
-        theta = t * total_angle
-        z = t * extended_length
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        points.append(App.Vector(x, y, z))
-    
-    return points, 0.0, extended_length
+    arr, extended_length = _body_centerline_cached(
+        params.get("wireDiameter", 2.0),
+        params.get("outerDiameter", 18.0),
+        params.get("activeCoils", 10),
+        params.get("currentExtension", 0.0),
+    )
+    return arr, 0.0, extended_length
 
 
 def smoothstep01(x):
     """0到1之间的平滑步进函数"""
-    t = max(0, min(1, x))
-    return t * t * (3 - 2 * t)
+    # 条件表达式钳制，省去 max/min 两次内建函数调用
+    t = 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+    return t * t * (3.0 - 2.0 * t)
 
 
 def wPitch(theta, thetaClosed, thetaTotal):
@@ -833,29 +1299,130 @@ def wPitch(theta, thetaClosed, thetaTotal):
     return 1
 
 
+def _smoothstep_integral(x):
+    """smoothstep01 在 [0, x] 上的积分 (0 <= x <= 1): ∫(3u² - 2u³)du = x³ - x⁴/2"""
+    x3 = x * x * x
+    return x3 - 0.5 * x3 * x
+
+
 def numericAvgWPitch(thetaClosed, thetaTotal, segments=200):
-    """数值计算 wPitch 的平均值，用于反推 pitchActive"""
+    """
+    wPitch 在 [0, thetaTotal] 上的平均值，用于反推 pitchActive
+    
+    wPitch 是两端 smoothstep 过渡 + 中间常数 1，按闭式积分计算 (不再做数值求积)；
+    两端过渡区不重叠时 (2·thetaClosed <= thetaTotal) 每端贡献 thetaClosed/2，
+    平均值为 1 - thetaClosed/thetaTotal
+    segments: 保留参数，与旧的数值求积接口兼容
+    """
     if thetaTotal <= 0: return 1
-    total = 0
-    dTheta = thetaTotal / segments
-    for i in range(segments):
-        theta = (i + 0.5) * dTheta
-        total += wPitch(theta, thetaClosed, thetaTotal)
-    return total / segments
-
-
-def groundWeight(theta, thetaGround, thetaTotal):
-    """计算磨平权重"""
-    if thetaGround <= 0: return 0
-    if theta < thetaGround:
-        u = 1 - theta / thetaGround
-        return smoothstep01(u)
-    if theta > thetaTotal - thetaGround:
-        u = 1 - (thetaTotal - theta) / thetaGround
-        return smoothstep01(u)
-    return 0
+    if thetaClosed <= 0: return 1
+    tc, tt = thetaClosed, thetaTotal
+    if 2 * tc <= tt:
+        return 1.0 - tc / tt
+    if tc >= tt:
+        # 全程处于底端上升段
+        return tc * _smoothstep_integral(tt / tc) / tt
+    # 两段重叠: [0, tc) 为上升段，[tc, tt] 为下降段 (只覆盖下降段的前一部分)
+    return (0.5 * tc + tc * _smoothstep_integral((tt - tc) / tc)) / tt
+
+
+def _smoothstep01_array(x):
+    """smoothstep01 的数组版本"""
+    t = np.clip(x, 0.0, 1.0)
+    return t * t * (3 - 2 * t)
 
 
+def _suspension_z(num_segs, d_theta, theta_total, theta_closed, theta_ground, theta_trans,
+                  pitch_active, p_center, p_end, has_closed, is_uniform):
+    """
+    悬架弹簧中心线 Z 坐标 (NumPy 向量化，与 _fast.sample_suspension_z 一致)
+    各段中点节距一次算出后 cumsum 积分，再按掩码做两端压平
+    返回: z[num_segs+1] (缩放前)
+    """
+    theta_mid = (np.arange(1, num_segs + 1) - 0.5) * d_theta
+    
+    if not has_closed:
+        p = np.full(num_segs, float(pitch_active if is_uniform else p_center))
+    elif is_uniform:
+        # 并紧端节距权重 (wPitch)
+        w = np.ones(num_segs)
+        if theta_closed > 0:
+            lo = theta_mid < theta_closed
+            hi = ~lo & (theta_mid > theta_total - theta_closed)
+            w[lo] = _smoothstep01_array(theta_mid[lo] / theta_closed)
+            w[hi] = _smoothstep01_array((theta_total - theta_mid[hi]) / theta_closed)
+        p = pitch_active * w
+    else:
+        # 渐进节距: 并紧端 p_end，过渡段平滑升到 p_center
+        p = np.full(num_segs, float(p_center))
+        end_lo = theta_mid < theta_closed
+        trans_lo = ~end_lo & (theta_mid < theta_closed + theta_trans)
+        upper = ~(end_lo | trans_lo) & (theta_mid > theta_total - (theta_closed + theta_trans))
+        trans_hi = upper & (theta_mid < theta_total - theta_closed)
+        end_hi = upper & ~trans_hi
+        p[end_lo | end_hi] = p_end
+        if theta_trans > 0:
+            u = _smoothstep01_array((theta_mid[trans_lo] - theta_closed) / theta_trans)
+            p[trans_lo] = p_end + (p_center - p_end) * u
+            u = _smoothstep01_array((theta_total - theta_closed - theta_mid[trans_hi]) / theta_trans)
+            p[trans_hi] = p_end + (p_center - p_end) * u
+    
+    z = np.empty(num_segs + 1)
+    z[0] = 0.0
+    np.cumsum((p / (2.0 * math.pi)) * d_theta, out=z[1:])
+    
+    # 磨平处理: 两端 theta_ground 范围内向 0 / z_end 平滑压平
+    if theta_ground > 0:
+        z_end = z[-1]
+        theta = np.arange(num_segs + 1) * d_theta
+        lo = theta < theta_ground
+        hi = ~lo & (theta > theta_total - theta_ground)
+        wg = _smoothstep01_array(1 - theta[lo] / theta_ground)
+        z[lo] = z[lo] * (1.0 - wg)
+        wg = _smoothstep01_array(1 - (theta_total - theta[hi]) / theta_ground)
+        z[hi] = z_end - (z_end - z[hi]) * (1.0 - wg)
+    
+    return z
+
+
+# 中心线缓存: 参数对话框反复设置相同几何时直接复用采样结果 (LRU，最多 32 个)
+_CENTERLINE_CACHE = OrderedDict()
+_CENTERLINE_CACHE_SIZE = 32
+
+
+def _freeze_params(value):
+    """参数 dict / list 递归转为可哈希的规范元组 (dict 按键排序)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_params(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_params(v) for v in value)
+    return value
+
+
+def cache_centerline(fn):
+    """
+    中心线生成函数的 LRU 缓存装饰器，按完整参数 dict 的规范形式作键
+    返回 (points, min_z, max_z)，points 为只读数组，调用方不得原地修改
+    """
+    @functools.wraps(fn)
+    def wrapper(params):
+        key = (fn.__name__, _freeze_params(params))
+        cached = _CENTERLINE_CACHE.get(key)
+        if cached is not None:
+            _CENTERLINE_CACHE.move_to_end(key)
+            return cached
+        
+        points, min_z, max_z = fn(params)
+        points.flags.writeable = False
+        result = (points, min_z, max_z)
+        _CENTERLINE_CACHE[key] = result
+        if len(_CENTERLINE_CACHE) > _CENTERLINE_CACHE_SIZE:
+            _CENTERLINE_CACHE.popitem(last=False)
+        return result
+    return wrapper
+
+
+@cache_centerline
 def generate_suspension_centerline(params):
     """
     生成悬架弹簧/减震器弹簧中心线点集
@@ -890,108 +1457,67 @@ def generate_suspension_centerline(params):
     w_avg = numericAvgWPitch(theta_closed, theta_total, num_segs)
     pitch_active = L0 / (Nt * max(w_avg, 0.1))
     
-    # 1. 积分生成 Z 坐标
-    z_raw = [0.0]
-    z_current = 0.0
-    
-    for i in range(1, num_segs + 1):
-        theta_mid = (i - 0.5) * d_theta
-        
-        # 计算该位置的节距权重
-        w = wPitch(theta_mid, theta_closed, theta_total)
-        
-        # 处理渐进节距 (Two-Stage/Three-Stage)
-        p_center = pitch_prof.get("pitchCenter", pitch_active)
-        if p_center <= 0: p_center = pitch_active
-        
-        p_end = pitch_prof.get("pitchEnd", p_center * 0.15)
-        
-        trans_turns = pitch_prof.get("transitionTurns", 0.75)
-        theta_trans = 2.0 * math.pi * trans_turns
-        
-        p = pitch_active # 默认
-        
-        if not has_closed:
-            p = p_center if pitch_prof.get("mode") != "uniform" else pitch_active
-        else:
-            # 权重化的节距
-            if pitch_prof.get("mode") == "uniform":
-                p = pitch_active * w
-            else:
-                # 渐进模式
-                if theta_mid < theta_closed:
-                    p = p_end
-                elif theta_mid < theta_closed + theta_trans:
-                    u = smoothstep01((theta_mid - theta_closed) / theta_trans)
-                    p = p_end + (p_center - p_end) * u
-                elif theta_mid > theta_total - (theta_closed + theta_trans):
-                    if theta_mid < theta_total - theta_closed:
-                        u = smoothstep01((theta_total - theta_closed - theta_mid) / theta_trans)
-                        p = p_end + (p_center - p_end) * u
-                    else:
-                        p = p_end
-                else:
-                    p = p_center
-        
-        z_current += (p / (2.0 * math.pi)) * d_theta
-        z_raw.append(z_current)
-        
-    z_end = z_raw[-1]
+    # 节距剖面参数 (与采样位置无关，循环外取一次)
+    p_center = pitch_prof.get("pitchCenter", pitch_active)
+    if p_center <= 0: p_center = pitch_active
+    p_end = pitch_prof.get("pitchEnd", p_center * 0.15)
+    trans_turns = pitch_prof.get("transitionTurns", 0.75)
+    theta_trans = 2.0 * math.pi * trans_turns
+    is_uniform = pitch_prof.get("mode") == "uniform"
+    
+    # 1-2. 节距积分生成 Z 坐标 + 磨平处理 (Flattening)
+    #      Numba 可用时走 JIT 内核，否则 NumPy 向量化
+    if NUMBA_AVAILABLE:
+        z_flattened = sample_suspension_z(
+            num_segs, d_theta, theta_total, theta_closed, theta_ground, theta_trans,
+            pitch_active, p_center, p_end, has_closed, is_uniform
+        )
+    else:
+        z_flattened = _suspension_z(
+            num_segs, d_theta, theta_total, theta_closed, theta_ground, theta_trans,
+            pitch_active, p_center, p_end, has_closed, is_uniform
+        )
     
-    # 2. 磨平处理 (Flattening)
-    z_flattened = []
-    for i in range(num_segs + 1):
-        theta = i * d_theta
-        z = z_raw[i]
-        
-        if end_type == "closed_ground" and theta_ground > 0:
-            wg = groundWeight(theta, theta_ground, theta_total)
-            if theta < theta_ground:
-                z = z * (1.0 - wg) # 向 0 靠拢
-            elif theta > theta_total - theta_ground:
-                z = z_end - (z_end - z) * (1.0 - wg) # 向 z_end 靠拢
-        
-        z_flattened.append(z)
-        
     # 3. 修正 Z 缩放
     total_h_flat = z_flattened[-1] - z_flattened[0]
     scale_z = L0 / total_h_flat if total_h_flat > 1e-6 else 1.0
     
-    # 4. 生成 3D 点
-    points = []
-    for i in range(num_segs + 1):
-        theta = i * d_theta
-        
-        # 计算该位置的中径 Dm
-        t_pos = theta / theta_total
-        mode_d = diam_prof.get("mode", "constant")
-        dm_start = diam_prof.get("DmStart", 100.0)
-        dm_mid = diam_prof.get("DmMid", 120.0)
-        dm_end = diam_prof.get("DmEnd", 100.0)
-        
-        if mode_d == "constant":
-            dm = dm_start
-        elif mode_d == "conical":
-            dm = dm_start + (dm_end - dm_start) * t_pos
-        elif mode_d == "barrel":
-            if t_pos < 0.5:
-                u = smoothstep01(t_pos / 0.5)
-                dm = dm_start + (dm_mid - dm_start) * u
-            else:
-                u = smoothstep01((t_pos - 0.5) / 0.5)
-                dm = dm_mid + (dm_end - dm_mid) * u
-        else:
-            dm = dm_start
-            
-        R_pos = dm / 2.0
-        x = R_pos * math.cos(theta)
-        y = R_pos * math.sin(theta)
-        z = (z_flattened[i] - z_flattened[0]) * scale_z
-        
-        points.append(App.Vector(x, y, z))
+    # 4. 生成 3D 点 (预分配 (N, 3) 数组)
+    mode_d = diam_prof.get("mode", "constant")
+    dm_start = diam_prof.get("DmStart", 100.0)
+    dm_mid = diam_prof.get("DmMid", 120.0)
+    dm_end = diam_prof.get("DmEnd", 100.0)
+    
+    theta = np.arange(num_segs + 1) * d_theta
+    t_pos = theta / theta_total
+    
+    # 计算各位置的中径 Dm
+    if mode_d == "conical":
+        dm = dm_start + (dm_end - dm_start) * t_pos
+    elif mode_d == "barrel":
+        # 前半段 DmStart → DmMid，后半段 DmMid → DmEnd (np.where 一次选择，无布尔索引拷贝)
+        first = t_pos < 0.5
+        u = _smoothstep01_array(np.where(first, t_pos, t_pos - 0.5) / 0.5)
+        dm = np.where(first,
+                      dm_start + (dm_mid - dm_start) * u,
+                      dm_mid + (dm_end - dm_mid) * u)
+    else:
+        dm = np.full_like(t_pos, dm_start)
+    
+    # 各列经 ufunc out= 直接写入输出数组，不生成 cos / sin / z 的中间数组
+    R_pos = dm / 2.0
+    points = np.empty((num_segs + 1, 3))
+    x, y, z = points[:, 0], points[:, 1], points[:, 2]
+    np.cos(theta, out=x)
+    x *= R_pos
+    np.sin(theta, out=y)
+    y *= R_pos
+    np.subtract(z_flattened, z_flattened[0], out=z)
+    z *= scale_z
         
     return points, 0.0, L0
 
+@cache_centerline
 def generate_variable_pitch_centerline(params):
     """
     生成变节距压缩弹簧中心线
@@ -1012,47 +1538,36 @@ def generate_variable_pitch_centerline(params):
     dead_coils = total_coils - active_coils
     dead_coils_per_end = dead_coils / 2.0
     
-    points = []
-    min_z = float('inf')
-    max_z = float('-inf')
+    # 有效区分段: 累计圈数 -> 累计高度 的分段线性关系 (与采样位置无关)
+    seg_coils = [seg.get('coils', 0) for seg in segments]
+    seg_heights = [seg.get('coils', 0) * seg.get('pitch', 0) for seg in segments]
+    cum_n = np.concatenate(((0.0,), np.cumsum(seg_coils)))
+    cum_z = np.concatenate(((0.0,), np.cumsum(seg_heights)))
+    active_height = cum_z[-1]
+    
+    # 预分配 (N, 3) 数组，一次性计算所有 theta / 圈数
+    t = np.arange(num_samples + 1) / num_samples
+    theta_all = t * total_angle
+    n = t * total_coils
+    points = np.empty((num_samples + 1, 3))
+    points[:, 0] = R * np.cos(theta_all)
+    points[:, 1] = R * np.sin(theta_all)
+    
+    bottom_dead_height = dead_coils_per_end * d
+    top_start = total_coils - dead_coils_per_end
+    points[:, 2] = np.where(
+        n <= dead_coils_per_end,
+        n * d,                                                          # 底部死圈
+        np.where(
+            n >= top_start,
+            bottom_dead_height + active_height + (n - top_start) * d,   # 顶部死圈
+            # 有效区: 按分段节距插值 (超出分段总圈数时保持在有效区顶部)
+            bottom_dead_height + np.interp(n - dead_coils_per_end, cum_n, cum_z),
+        ),
+    )
     
-    for i in range(num_samples + 1):
-        t = i / num_samples
-        theta = t * total_angle
-        n = theta / (2.0 * math.pi)
-        
-        z = 0
-        if n <= dead_coils_per_end:
-            z = n * d
-        elif n >= total_coils - dead_coils_per_end:
-            active_height = 0
-            for seg in segments:
-                active_height += seg.get('coils', 0) * seg.get('pitch', 0)
-            
-            n_top = n - (total_coils - dead_coils_per_end)
-            z = dead_coils_per_end * d + active_height + n_top * d
-        else:
-            n_active = n - dead_coils_per_end
-            z = dead_coils_per_end * d
-            
-            curr_n = 0
-            for seg in segments:
-                s_coils = seg.get('coils', 0)
-                s_pitch = seg.get('pitch', 0)
-                if curr_n + s_coils >= n_active:
-                    z += (n_active - curr_n) * s_pitch
-                    break
-                else:
-                    z += s_coils * s_pitch
-                    curr_n += s_coils
-        
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        
-        p = App.Vector(x, y, z)
-        points.append(p)
-        min_z = min(min_z, z)
-        max_z = max(max_z, z)
+    min_z = float(points[:, 2].min())
+    max_z = float(points[:, 2].max())
         
     return points, min_z, max_z
 
@@ -1068,31 +1583,24 @@ def make_variable_pitch_compression_spring(params):
     
     points, min_z, max_z = generate_variable_pitch_centerline(params)
     path = make_bspline_from_points(points)
+    # 变节距路径升角不恒定，不用固定副法线 (Frenet 保持截面垂直于路径)
     spring_solid = sweep_wire_along_path(path, d)
     
     if ground_ends and spring_solid:
         EPS = max(0.05 * d, 0.05)
-        if not spring_solid.isValid():
-            spring_solid = spring_solid.removeSplitter()
         
         grind_depth = 0.3 * d
         
-        box_size = Dm * 3
+        cutter_r = Dm / 2.0 + d
         box_height = d * 5
         
-        bottom_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, grind_depth + EPS - box_height)
-        )
-        
-        top_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, max_z - grind_depth - EPS)
+        # 上下两个切割体 - 必须穿透弹簧实体 (按尺寸缓存)
+        bottom_box, top_box = make_grind_cutters(
+            cutter_r, box_height, grind_depth + EPS, max_z - grind_depth - EPS
         )
         
         try:
-            cut_result = spring_solid.cut(bottom_box)
-            cut_result = cut_result.cut(top_box)
+            cut_result = cut_both_ends(spring_solid, bottom_box, top_box)
             if cut_result.ShapeType == "Compound" and cut_result.Solids:
                 cut_result = max(cut_result.Solids, key=lambda s: s.Volume)
             spring_solid = cut_result
@@ -1114,32 +1622,25 @@ def make_suspension_spring(params):
     
     # 2. 创建 B-Spline 路径并进行平面扫掠
     path = make_bspline_from_points(points)
+    # 变节距 / 变中径，升角不恒定，不用固定副法线 (Frenet 保持截面垂直于路径)
     spring_solid = sweep_wire_along_path(path, d)
     
     # 3. 处理磨平 (端部切削)
     if end_type == "closed_ground" and spring_solid:
         EPS = max(0.05 * d, 0.05)
-        if not spring_solid.isValid():
-            spring_solid = spring_solid.removeSplitter()
         
         grind_depth = d * 0.4
-        dm_start = params.get("diameterProfile", {}).get("DmStart", 100.0)
-        box_size = dm_start * 4
+        # 中径沿轴向变化 (锥形 / 鼓形)，取中心线的最大半径
+        cutter_r = float(np.hypot(points[:, 0], points[:, 1]).max()) + d
         box_height = d * 6
         
-        bottom_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, grind_depth + EPS - box_height)
-        )
-        
-        top_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, max_z - grind_depth - EPS)
+        # 上下两个切割体 - 必须穿透弹簧实体 (按尺寸缓存)
+        bottom_box, top_box = make_grind_cutters(
+            cutter_r, box_height, grind_depth + EPS, max_z - grind_depth - EPS
         )
         
         try:
-            cut_result = spring_solid.cut(bottom_box)
-            cut_result = cut_result.cut(top_box)
+            cut_result = cut_both_ends(spring_solid, bottom_box, top_box)
             
             if cut_result.ShapeType == "Compound" and cut_result.Solids:
                 cut_result = max(cut_result.Solids, key=lambda s: s.Volume)
@@ -1182,8 +1683,9 @@ def make_extension_spring(params):
     solid_body_length = Na * d
     extended_length = solid_body_length + current_extension
     
-    print(f"Extension Spring (normalized): d={d}, OD={OD}, Dm={Dm}, Na={Na}, hookType={hook_type}")
-    print(f"Body: solidBodyLength={solid_body_length:.2f} (Na*d), extended={extended_length:.2f}")
+    logger.debug("Extension Spring (normalized): d=%s, OD=%s, Dm=%s, Na=%s, hookType=%s",
+                 d, OD, Dm, Na, hook_type)
+    logger.debug("Body: solidBodyLength=%.2f (Na*d), extended=%.2f", solid_body_length, extended_length)
     
     # === 工程正确方案: 统一中心线 + 单次扫掠 (C¹ 连续) ===
     # 不使用 fuse，而是将钩子和主体的中心线合并后一次性扫掠
@@ -1192,13 +1694,15 @@ def make_extension_spring(params):
     # === 备用方案: 统一中心线 + 单次扫掠 ===
     # 避免 fuse 操作导致的体积为 0 问题
     
+    # === 1) 本体中心线 ===
+    # 在 try 之外只采样一次，主流程与备用流程共用
+    helix_pts, z_min, z_max = generate_extension_body_centerline(params)
+    
     try:
-        # === 1) 本体中心线 ===
-        helix_pts, z_min, z_max = generate_extension_body_centerline(params)
         if len(helix_pts) < 3:
             raise RuntimeError("Helix points too few for extension spring")
         
-        print(f"Generated {len(helix_pts)} helix points, z_range=[{z_min:.2f}, {z_max:.2f}]")
+        logger.debug("Generated %d helix points, z_range=[%.2f, %.2f]", len(helix_pts), z_min, z_max)
         
         # 本体起点/终点（用于钩子过渡）
         start_pos = helix_pts[0]
@@ -1207,33 +1711,21 @@ def make_extension_spring(params):
         start_prev = helix_pts[1]
         end_prev = helix_pts[-2]
         
-        # === 2) 钩子中心线 ===
-        start_hook_pts = build_extension_hook_centerline(
-            start_pos, start_prev, params, is_start=True
+        # === 2) 钩子 + 本体合并为一条中心线 ===
+        # 预分配整条中心线数组，本体与上下钩子按切片直接写入，不做逐段拼接
+        # 底钩是从钩尖到螺旋起点的顺序（反向），顶钩是从螺旋终点到钩尖的顺序（正向）
+        H = EXTENSION_HOOK_POINTS
+        centerline_pts = np.empty((len(helix_pts) - 2 + 2 * H, 3))
+        centerline_pts[H:-H] = helix_pts[1:-1]  # 去掉首尾，与钩子端连接
+        build_extension_hook_centerline(
+            start_pos, start_prev, params, is_start=True, out=centerline_pts[:H]
         )
-        end_hook_pts = build_extension_hook_centerline(
-            end_pos, end_prev, params, is_start=False
+        build_extension_hook_centerline(
+            end_pos, end_prev, params, is_start=False, out=centerline_pts[-H:]
         )
         
-        print(f"Hook centerlines: start={len(start_hook_pts)} pts, end={len(end_hook_pts)} pts")
-        
-        # === 3) 合并中心线 ===
-        # 注意：build_extension_hook_centerline 已经处理了端点，这里需要正确拼接
-        # start_hook_pts 是从钩尖到螺旋起点的顺序（反向）
-        # end_hook_pts 是从螺旋终点到钩尖的顺序（正向）
-        
-        if len(start_hook_pts) > 0 and len(end_hook_pts) > 0:
-            # 完整中心线: 底钩 + 螺旋体(去首尾) + 顶钩
-            centerline_pts = (
-                list(start_hook_pts) +
-                helix_pts[1:-1] +  # 去掉首尾，与钩子端连接
-                list(end_hook_pts)
-            )
-            print(f"Unified centerline: {len(centerline_pts)} points (with hooks)")
-        else:
-            # 如果钩子生成失败，只用螺旋体
-            centerline_pts = helix_pts
-            print(f"Unified centerline: {len(centerline_pts)} points (body only)")
+        logger.debug("Hook centerlines: start=%d pts, end=%d pts", H, H)
+        logger.debug("Unified centerline: %d points (with hooks)", len(centerline_pts))
         
         # === 4) 生成 B-Spline 路径并扫掠 ===
         path = make_bspline_from_points(centerline_pts)
@@ -1242,10 +1734,13 @@ def make_extension_spring(params):
         if spring_solid is None or spring_solid.isNull():
             raise RuntimeError("Extension spring sweep failed (null shape)")
         
-        # 验证形状
-        print(f"Final shape: ShapeType={spring_solid.ShapeType}, Volume={spring_solid.Volume:.2f}, Area={spring_solid.Area:.2f}")
+        # 验证形状 (Volume / Area 需要计算质量属性，诊断输出仅 DEBUG 级别执行)
+        volume = spring_solid.Volume
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final shape: ShapeType=%s, Volume=%.2f, Area=%.2f",
+                         spring_solid.ShapeType, volume, spring_solid.Area)
         
-        if spring_solid.Volume <= 0:
+        if volume <= 0:
             raise RuntimeError(f"Extension spring has zero volume")
         
         print("Extension spring generated successfully (unified centerline, Three.js-synced)")
@@ -1259,7 +1754,7 @@ def make_extension_spring(params):
     # === 备用方案: 只生成螺旋体（无钩子）===
     print("Trying fallback: body only (no hooks)")
     try:
-        helix_pts, _, _ = generate_extension_body_centerline(params)
+        # 复用上面已生成的本体中心线
         path = make_bspline_from_points(helix_pts)
         spring_solid = sweep_wire_along_path(path, d)
         
@@ -1281,54 +1776,35 @@ def make_simple_hook(attach_point, body_radius, wire_diameter, hook_radius, hook
     这是一个快速实现，后续可以添加过渡段
     """
     d = wire_diameter
-    wire_radius = d / 2.0
     
     # 轴向方向
-    axis_dir = App.Vector(0, 0, -1 if is_start else 1)
+    az = -1.0 if is_start else 1.0
     
     # 径向方向
-    radial_dir = App.Vector(attach_point.x, attach_point.y, 0)
-    if radial_dir.Length < 1e-8:
-        radial_dir = App.Vector(1, 0, 0)
-    else:
-        radial_dir.normalize()
+    rx, ry = _safe_normalize_xy(attach_point.x, attach_point.y)
     
     # 钩环圆心 (在轴线上)
-    hook_center = App.Vector(0, 0, attach_point.z + axis_dir.z * hook_gap)
+    hook_center = np.array((0.0, 0.0, attach_point.z + az * hook_gap))
     
-    # 钩环平面基向量
-    u = App.Vector(axis_dir.x, axis_dir.y, axis_dir.z)
-    u.normalize()
-    v = radial_dir.cross(axis_dir)
-    v.normalize()
+    # 钩环平面基向量: u = 轴向, v = radial × axis (均为单位向量)
+    u = np.array((0.0, 0.0, az))
+    v = np.array((ry * az, -rx * az, 0.0))
     
     # 生成钩环圆弧点
-    pts = []
     start_angle = -math.pi / 2
     total_angle = math.radians(angle_deg)
     segments = 24
-    
-    for i in range(segments + 1):
-        t = i / segments
-        theta = start_angle + total_angle * t
-        p = (hook_center + 
-             u * (hook_radius * math.cos(theta)) + 
-             v * (hook_radius * math.sin(theta)))
-        pts.append(p)
+    pts = sample_arc_points(hook_center, hook_radius, u, v, start_angle, total_angle, segments)
     
     # 添加过渡点 (从 attach_point 到钩环起点)
-    transition_pts = []
-    hook_start = pts[0]
-    for i in range(5):
-        t = i / 4.0
-        p = attach_point * (1 - t) + hook_start * t
-        transition_pts.append(p)
+    t = np.linspace(0.0, 1.0, 5)[:, None]
+    transition_pts = (1.0 - t) * array_from_vector(attach_point) + t * pts[0]
     
     # 合并: 过渡 + 钩环
     if is_start:
-        all_pts = list(reversed(pts)) + list(reversed(transition_pts[1:]))
+        all_pts = np.concatenate((pts[::-1], transition_pts[:0:-1]))
     else:
-        all_pts = transition_pts[1:] + pts
+        all_pts = np.concatenate((transition_pts[1:], pts))
     
     if len(all_pts) < 3:
         return None
@@ -1338,14 +1814,8 @@ def make_simple_hook(attach_point, body_radius, wire_diameter, hook_radius, hook
         path = make_bspline_from_points(all_pts)
         path_wire = Part.Wire([path])
         
-        # 获取起点和切线
-        start_point = path_wire.Vertexes[0].Point
-        first_edge = path_wire.Edges[0]
-        tangent = first_edge.tangentAt(first_edge.FirstParameter)
-        
         # 创建圆截面
-        circle = Part.makeCircle(wire_radius, start_point, tangent)
-        circle_wire = Part.Wire([circle])
+        circle_wire = make_circle_profile(path_wire, d)
         
         # 扫掠
         hook_solid = path_wire.makePipeShell([circle_wire], True, True)
@@ -1477,6 +1947,8 @@ def generate_torsion_body_centerline(params):
     与 Three.js generateTorsionBodyCenterline 完全一致：
       - 使用 calculateHelixTotalAngle 计算总角度（控制腿夹角）
       - Z = t * L，其中 L = pitch * actualCoils
+    
+    返回: (points (N, 3) 数组, total_angle)
     """
     d = params["wireDiameter"]
     Dm = params["meanDiameter"]
@@ -1501,14 +1973,8 @@ def generate_torsion_body_centerline(params):
     samples_per_turn = 90
     num_samples = max(500, int(actual_coils * samples_per_turn))
 
-    pts = []
-    for i in range(num_samples + 1):
-        t = i / num_samples
-        theta = t * total_angle
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        z = t * body_length  # ✅ 与 Three.js 一致：z = t * L
-        pts.append(App.Vector(x, y, z))
+    # z = t * L (与 Three.js 一致)，theta = t * total_angle
+    pts = coil_points(0.0, total_angle, 0.0, body_length, R, R, num_samples)
 
     print(f"[torsion body] {len(pts)} points, R={R}, pitch={pitch}, bodyLength={body_length:.2f}")
     print(f"[torsion body] actual_coils={actual_coils:.2f}")
@@ -1537,8 +2003,9 @@ def make_torsion_spring(params):
     if len(body_pts) < 3:
         raise RuntimeError("Not enough points for torsion spring body")
 
-    start_pos = body_pts[0]
-    end_pos = body_pts[-1]
+    # 端点转为 App.Vector，供腿部直线 Edge 使用
+    start_pos = vec(*body_pts[0])
+    end_pos = vec(*body_pts[-1])
     
     winding = params["windingDirection"]
     dir_mult = -1.0 if winding == "left" else 1.0
@@ -1679,35 +2146,22 @@ def make_spiral_torsion_spring(params):
     hook_side_segments = 6
     hook_top_segments = 40   # 增加 U 钩顶部圆弧采样
     
-    Z = App.Vector(0, 0, 1)
+    Z = np.array((0.0, 0.0, 1.0))
     
     print(f"[spiral_torsion] Di={Di}, Do={Do}, N={N}, b={b}, t={t}")
     print(f"[spiral_torsion] inner_leg={inner_leg_length:.2f}, outer_leg={outer_leg_length:.2f}")
     
+    # 点列全部以 (N, 3) 数组计算，App.Vector 只在 make_bspline_from_points 边界构造
     # ========================================
     # 1. 螺旋部分点列 (阿基米德螺线)
     # ========================================
-    spiral_pts = []
-    for i in range(spiral_pts_count + 1):
-        u = i / spiral_pts_count
-        theta = u * total_angle
-        r = inner_radius + a * theta
-        angle = theta if handedness == "ccw" else -theta
-        x = r * math.cos(angle)
-        y = r * math.sin(angle)
-        spiral_pts.append(App.Vector(x, y, 0))
-    
-    # 螺旋切线
-    def get_spiral_tangent(idx):
-        if idx == 0:
-            return (spiral_pts[1] - spiral_pts[0]).normalize()
-        elif idx == len(spiral_pts) - 1:
-            return (spiral_pts[-1] - spiral_pts[-2]).normalize()
-        else:
-            return (spiral_pts[idx + 1] - spiral_pts[idx - 1]).normalize()
+    theta = np.arange(spiral_pts_count + 1) / spiral_pts_count * total_angle
+    r = inner_radius + a * theta
+    angle = theta if handedness == "ccw" else -theta
+    spiral_pts = np.column_stack((r * np.cos(angle), r * np.sin(angle), np.zeros_like(r)))
     
-    t_spiral_start = get_spiral_tangent(0)
-    t_spiral_end = get_spiral_tangent(len(spiral_pts) - 1)
+    # 螺旋首末端切线 (相邻点差分)
+    t_spiral_start, t_spiral_end = _unit_rows(spiral_pts[[1, -1]] - spiral_pts[[0, -2]])
     
     p_start = spiral_pts[0]
     p_end = spiral_pts[-1]
@@ -1716,126 +2170,111 @@ def make_spiral_torsion_spring(params):
     # 2. 内端固定臂 - 直线穿过轴心 + 小弧过渡
     # ========================================
     # 径向内方向 (指向轴心)
-    radial_in = App.Vector(-p_start.x, -p_start.y, 0)
-    if radial_in.Length > 1e-12:
-        radial_in.normalize()
+    radial_in = np.array((-p_start[0], -p_start[1], 0.0))
+    if np.linalg.norm(radial_in) > 1e-12:
+        radial_in = radial_in / np.linalg.norm(radial_in)
     else:
-        radial_in = App.Vector(-1, 0, 0)
+        radial_in = np.array((-1.0, 0.0, 0.0))
     
     # 内端直线切线 (从轴心往外)
-    t_inner_leg = radial_in * (-1)
+    t_inner_leg = -radial_in
     
     # 计算小弧参数
-    dot_inner = t_inner_leg.dot(t_spiral_start)
+    dot_inner = float(t_inner_leg @ t_spiral_start)
     inner_arc_angle = math.acos(max(-1, min(1, dot_inner)))
     
     # 小弧旋转轴
-    inner_arc_axis = t_inner_leg.cross(t_spiral_start)
-    if inner_arc_axis.Length < 1e-12:
+    inner_arc_axis = np.cross(t_inner_leg, t_spiral_start)
+    if np.linalg.norm(inner_arc_axis) < 1e-12:
         inner_arc_axis = Z
     else:
-        inner_arc_axis.normalize()
+        inner_arc_axis = inner_arc_axis / np.linalg.norm(inner_arc_axis)
     
     # 圆弧圆心 (从 p_start 反推，确保圆弧终点在 p_start)
-    n_arc_at_end = inner_arc_axis.cross(t_spiral_start)
-    n_arc_at_end.normalize()
+    n_arc_at_end = np.cross(inner_arc_axis, t_spiral_start)
+    n_arc_at_end = n_arc_at_end / np.linalg.norm(n_arc_at_end)
     arc_center = p_start + n_arc_at_end * inner_arc_radius
     
-    # 圆弧起点
-    n_arc_at_start = App.Vector(n_arc_at_end.x, n_arc_at_end.y, n_arc_at_end.z)
-    # 绕 inner_arc_axis 旋转 -inner_arc_angle
-    rot = App.Rotation(inner_arc_axis, math.degrees(-inner_arc_angle))
-    n_arc_at_start = rot.multVec(n_arc_at_start) * (-1)
+    # 圆弧起点: n_arc_at_end 绕 inner_arc_axis 旋转 -inner_arc_angle 后取反
+    n_arc_at_start = -rot_axis_angle_rows(n_arc_at_end, inner_arc_axis, math.degrees(-inner_arc_angle))
     p_arc_start = arc_center + n_arc_at_start * inner_arc_radius
     
     # 直线终点 (往轴心方向延伸)
     p_inner_end = p_arc_start + radial_in * inner_leg_length
     
-    # 生成内端点列
-    inner_pts = []
-    
     # 2a. 内端直线
-    for i in range(inner_leg_segments):
-        u = i / inner_leg_segments
-        p = p_inner_end + (p_arc_start - p_inner_end) * u
-        inner_pts.append(p)
+    u = (np.arange(inner_leg_segments) / inner_leg_segments)[:, None]
+    inner_leg_pts = p_inner_end + (p_arc_start - p_inner_end) * u
     
-    # 2b. 内端小弧
+    # 2b. 内端小弧 (radius_vec 绕 inner_arc_axis 旋转 phi，Rodrigues 公式按 phi 数组批量展开)
     radius_vec = p_arc_start - arc_center
-    for i in range(1, inner_arc_segments + 1):
-        phi = (i / inner_arc_segments) * inner_arc_angle
-        rot = App.Rotation(inner_arc_axis, math.degrees(phi))
-        p = arc_center + rot.multVec(radius_vec)
-        inner_pts.append(p)
+    phi = (np.arange(1, inner_arc_segments + 1) / inner_arc_segments * inner_arc_angle)[:, None]
+    a_dot_r = float(inner_arc_axis @ radius_vec)
+    inner_arc_pts = (arc_center + radius_vec * np.cos(phi)
+                     + np.cross(inner_arc_axis, radius_vec) * np.sin(phi)
+                     + inner_arc_axis * (a_dot_r * (1 - np.cos(phi))))
     
     # ========================================
     # 3. 外端几何 - 直臂 + 90°折弯 + 侧边 + 顶部
     # ========================================
     # 外端局部坐标系
-    ex = App.Vector(t_spiral_end.x, t_spiral_end.y, t_spiral_end.z)
-    ex.normalize()
+    ex = t_spiral_end
     
     # 径向外方向
-    R_end = App.Vector(p_end.x, p_end.y, 0)
-    if R_end.Length > 1e-12:
-        R_end.normalize()
+    R_end = np.array((p_end[0], p_end[1], 0.0))
+    if np.linalg.norm(R_end) > 1e-12:
+        R_end = R_end / np.linalg.norm(R_end)
     else:
-        R_end = App.Vector(1, 0, 0)
+        R_end = np.array((1.0, 0.0, 0.0))
     
     # ey = R 投影到 ⟂ex 平面
-    ey = R_end - ex * R_end.dot(ex)
-    if ey.Length < 1e-9:
-        ey = App.Vector(-ex.y, ex.x, 0)
-    ey.normalize()
+    ey = R_end - ex * float(R_end @ ex)
+    if np.linalg.norm(ey) < 1e-9:
+        ey = np.array((-ex[1], ex[0], 0.0))
+    ey = ey / np.linalg.norm(ey)
     
     # 右手系修正
-    if ex.cross(ey).dot(Z) < 0:
-        ey = ey * (-1)
-    
-    ez = Z
+    if float(np.cross(ex, ey) @ Z) < 0:
+        ey = -ey
     
-    outer_pts = []
+    outer_segments = []
     
     # 3a. 外端直臂 (不包含起点 p_end，因为它已在 spiral_pts 末尾)
     leg_len = max(outer_leg_length - bend_radius, 0)
     Q0 = p_end + ex * leg_len  # 直臂终点 = 折弯起点
     
-    for i in range(1, outer_leg_segments + 1):
-        u = (i / outer_leg_segments) * leg_len
-        p = p_end + ex * u
-        outer_pts.append(p)
+    u = (np.arange(1, outer_leg_segments + 1) / outer_leg_segments * leg_len)[:, None]
+    outer_segments.append(p_end + ex * u)
     
     # 3b. 90° 折弯圆角 (从 i=1 开始，因为 i=0 的点就是 Q0，已在直臂末尾)
-    for i in range(1, bend_segments + 1):
-        phi = (i / bend_segments) * (math.pi / 2)
-        p = Q0 + ex * (bend_radius * math.sin(phi)) + ey * (bend_radius * (1 - math.cos(phi)))
-        outer_pts.append(p)
+    phi = (np.arange(1, bend_segments + 1) / bend_segments * (math.pi / 2))[:, None]
+    bend_pts = Q0 + ex * (bend_radius * np.sin(phi)) + ey * (bend_radius * (1 - np.cos(phi)))
+    outer_segments.append(bend_pts)
     
-    end_bend = outer_pts[-1]  # 折弯终点
+    end_bend = bend_pts[-1]  # 折弯终点
     
     # 3c. 侧边直线 (从 i=1 开始，因为 i=0 的点就是 end_bend)
     side_len = max(hook_depth - bend_radius, 0)
     Q1 = end_bend + ey * side_len  # 侧边终点
     
     if side_len > 0:
-        for i in range(1, hook_side_segments + 1):
-            u = i / hook_side_segments
-            p = end_bend + (Q1 - end_bend) * u
-            outer_pts.append(p)
+        u = (np.arange(1, hook_side_segments + 1) / hook_side_segments)[:, None]
+        outer_segments.append(end_bend + (Q1 - end_bend) * u)
     
     # 3d. 顶部直线 (hookTopMode = "line")
     g = hook_gap
     Q2 = Q1 - ex * g
     
-    for i in range(1, hook_top_segments + 1):
-        u = i / hook_top_segments
-        p = Q1 + (Q2 - Q1) * u
-        outer_pts.append(p)
+    u = (np.arange(1, hook_top_segments + 1) / hook_top_segments)[:, None]
+    outer_segments.append(Q1 + (Q2 - Q1) * u)
+    
+    outer_pts = np.concatenate(outer_segments)
+    inner_pts = np.concatenate((inner_leg_pts, inner_arc_pts))
     
     # ========================================
     # 4. 合并所有点列
     # ========================================
-    all_pts = inner_pts + spiral_pts + outer_pts
+    all_pts = np.concatenate((inner_pts, spiral_pts, outer_pts))
     
     mark(f"points generated: {len(all_pts)} (inner={len(inner_pts)}, spiral={len(spiral_pts)}, outer={len(outer_pts)})")
     
@@ -1944,7 +2383,7 @@ def generate_conical_centerline(params):
         }
     
     返回:
-        (centerline_pts, min_z, max_z)
+        (centerline_pts (N, 3) 数组, min_z, max_z)
     
     工业级设计 (DIN / GB 标准):
     - Dead Coils: 密绕端圈，pitch → ε (不为0)
@@ -2005,26 +2444,25 @@ def generate_conical_centerline(params):
     print(f"[Conical] dead_turns_per_end={dead_turns_per_end:.2f}, dead_height={dead_height_per_end:.2f}")
     print(f"[Conical] active_length={active_length:.2f}, active_pitch={active_pitch:.2f}")
     
-    centerline_pts = []
+    segments = []  # 各段 (N, 3) 点数组，最后一次性拼接
     current_theta = 0.0
     current_z = 0.0
     
+    def coil_segment(theta0, z0, turns, height, R_from, R_to, num_samples, skip_first):
+        """生成一段螺旋点 (半径在 R_from → R_to 间线性插值)"""
+        pts = coil_points(theta0, 2.0 * math.pi * turns * sign, z0, height, R_from, R_to, num_samples)
+        return pts[1:] if skip_first else pts
+    
     # ================================================================
     # 1. Bottom Dead Coil (密绕，半径 = R_large)
     # ================================================================
     if has_dead_coils and dead_turns_per_end > 0:
         num_samples = max(20, int(dead_turns_per_end * steps_per_turn))
-        for i in range(num_samples + 1):
-            t = i / float(num_samples)
-            theta = current_theta + 2.0 * math.pi * dead_turns_per_end * t * sign
-            z = current_z + DEAD_PITCH * dead_turns_per_end * t
-            
-            # 底部死圈: 半径固定为大端
-            R = R_large
-            
-            x = R * math.cos(theta)
-            y = R * math.sin(theta)
-            centerline_pts.append(App.Vector(x, y, z))
+        # 底部死圈: 半径固定为大端
+        segments.append(coil_segment(
+            current_theta, current_z, dead_turns_per_end, DEAD_PITCH * dead_turns_per_end,
+            R_large, R_large, num_samples, skip_first=False
+        ))
         
         # 更新起点
         current_theta += 2.0 * math.pi * dead_turns_per_end * sign
@@ -2036,20 +2474,11 @@ def generate_conical_centerline(params):
     active_start_z = current_z
     num_samples = max(200, int(Na * steps_per_turn))
     
-    for i in range(num_samples + 1):
-        t = i / float(num_samples)
-        theta = current_theta + 2.0 * math.pi * Na * t * sign
-        z = current_z + active_length * t
-        
-        # 半径线性插值: 大端 → 小端
-        R = R_large + (R_small - R_large) * t
-        
-        x = R * math.cos(theta)
-        y = R * math.sin(theta)
-        
-        # 避免与底部死圈最后一点重复
-        if i > 0 or not has_dead_coils:
-            centerline_pts.append(App.Vector(x, y, z))
+    # 半径线性插值: 大端 → 小端；有死圈时跳过首点，避免与底部死圈最后一点重复
+    segments.append(coil_segment(
+        current_theta, current_z, Na, active_length,
+        R_large, R_small, num_samples, skip_first=has_dead_coils
+    ))
     
     # 更新起点
     current_theta += 2.0 * math.pi * Na * sign
@@ -2060,20 +2489,14 @@ def generate_conical_centerline(params):
     # ================================================================
     if has_dead_coils and dead_turns_per_end > 0:
         num_samples = max(20, int(dead_turns_per_end * steps_per_turn))
-        for i in range(num_samples + 1):
-            t = i / float(num_samples)
-            theta = current_theta + 2.0 * math.pi * dead_turns_per_end * t * sign
-            z = current_z + DEAD_PITCH * dead_turns_per_end * t
-            
-            # 顶部死圈: 半径固定为小端
-            R = R_small
-            
-            x = R * math.cos(theta)
-            y = R * math.sin(theta)
-            
-            # 避免与活动圈最后一点重复
-            if i > 0:
-                centerline_pts.append(App.Vector(x, y, z))
+        # 顶部死圈: 半径固定为小端；跳过首点，避免与活动圈最后一点重复
+        segments.append(coil_segment(
+            current_theta, current_z, dead_turns_per_end, DEAD_PITCH * dead_turns_per_end,
+            R_small, R_small, num_samples, skip_first=True
+        ))
+    
+    # 各段一次性拼接为 (N, 3) 数组，App.Vector 在 make_bspline_from_points 中构造
+    centerline_pts = np.concatenate(segments)
     
     min_z = 0.0
     max_z = L0
@@ -2125,6 +2548,7 @@ def make_conical_spring(params):
     path_shape = make_bspline_from_points(centerline_pts)
     
     # 扫掠生成实体
+    # 中径沿轴向变化，升角不恒定，不用固定副法线 (Frenet 保持截面垂直于路径)
     spring_solid = sweep_wire_along_path(path_shape, d)
     
     if spring_solid is None or spring_solid.isNull():
@@ -2138,12 +2562,6 @@ def make_conical_spring(params):
         # ============================================================
         EPS = max(0.05 * d, 0.05)  # 工程级容差
         
-        # 修复形状 - 提高布尔运算成功率
-        if not spring_solid.isValid():
-            print(f"[Conical] Spring shape is invalid, attempting to fix...")
-            spring_solid = spring_solid.removeSplitter()
-            print(f"[Conical] After removeSplitter: isValid={spring_solid.isValid()}")
-        
         # 使用中心线的 min_z/max_z（而不是 BoundBox）
         # 因为 BoundBox 包含了圆截面的延伸，不是实际的切割位置
         # min_z 和 max_z 是中心线的 Z 范围，代表弹簧的"工程"高度
@@ -2155,41 +2573,34 @@ def make_conical_spring(params):
         # 顶部切割：切掉 Z > (L0 - grind_depth) 的部分
         top_cut_z = L0 - grind_depth
         
-        box_size = D_large_outer * 3
-        box_height = d * 5  # 足够高的盒子，确保覆盖圆截面延伸
+        cutter_r = D_large_outer / 2.0 + d  # 大端外圆再留 d 余量
+        box_height = d * 5  # 足够高的切割体，确保覆盖圆截面延伸
         
         # 底部切割盒 - 切掉 Z < grind_depth 的部分
         # 盒子从 Z = -很大 到 Z = grind_depth + EPS
-        bottom_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, grind_depth + EPS - box_height)
-        )
-        
         # 顶部切割盒 - 切掉 Z > (L0 - grind_depth) 的部分
         # 盒子从 Z = L0 - grind_depth - EPS 到 Z = 很大
-        top_box = Part.makeBox(
-            box_size, box_size, box_height,
-            App.Vector(-box_size/2, -box_size/2, L0 - grind_depth - EPS)
+        bottom_box, top_box = make_grind_cutters(
+            cutter_r, box_height, grind_depth + EPS, L0 - grind_depth - EPS
         )
         
         try:
             bb = spring_solid.BoundBox
-            print(f"[Conical] Spring BoundBox: Z={bb.ZMin:.2f} to {bb.ZMax:.2f}, isValid={spring_solid.isValid()}")
+            print(f"[Conical] Spring BoundBox: Z={bb.ZMin:.2f} to {bb.ZMax:.2f}")
             print(f"[Conical] Cutting at: bottom={bottom_cut_z:.2f}, top={top_cut_z:.2f}")
             print(f"[Conical] Bottom box Z: {bottom_box.BoundBox.ZMin:.2f} to {bottom_box.BoundBox.ZMax:.2f}")
             print(f"[Conical] Top box Z: {top_box.BoundBox.ZMin:.2f} to {top_box.BoundBox.ZMax:.2f}")
             
-            # 验证几何交集
-            bottom_common = spring_solid.common(bottom_box)
-            top_common = spring_solid.common(top_box)
-            print(f"[Conical] Common volume: bottom={bottom_common.Volume:.2f}, top={top_common.Volume:.2f}")
-            
-            # 执行切割
-            cut_result = spring_solid.cut(bottom_box)
-            print(f"[Conical] After bottom cut: Z={cut_result.BoundBox.ZMin:.2f} to {cut_result.BoundBox.ZMax:.2f}")
+            # 验证几何交集 (纯诊断用的布尔运算，仅 DEBUG 级别执行)
+            if logger.isEnabledFor(logging.DEBUG):
+                bottom_common = spring_solid.common(bottom_box)
+                top_common = spring_solid.common(top_box)
+                logger.debug("[Conical] Common volume: bottom=%.2f, top=%.2f",
+                             bottom_common.Volume, top_common.Volume)
             
-            cut_result = cut_result.cut(top_box)
-            print(f"[Conical] After top cut: Z={cut_result.BoundBox.ZMin:.2f} to {cut_result.BoundBox.ZMax:.2f}")
+            # 执行切割 (两端一次完成)
+            cut_result = cut_both_ends(spring_solid, bottom_box, top_box)
+            print(f"[Conical] After cut: Z={cut_result.BoundBox.ZMin:.2f} to {cut_result.BoundBox.ZMax:.2f}")
             
             # 如果结果是 Compound，取最大的 Solid
             if cut_result.ShapeType == "Compound" and cut_result.Solids:
@@ -2211,50 +2622,65 @@ def make_conical_spring(params):
 # 与 Three.js arcSpringGeometry.ts / arcBackbone.ts 完全同步
 # =============================================================================
 
+def _unit_rows(v):
+    """(N, 3) 数组逐行归一化，长度过小的行置零 (与 unit() 一致)"""
+    l = np.linalg.norm(v, axis=1, keepdims=True)
+    return np.divide(v, l, out=np.zeros_like(v), where=l > 1e-12)
+
+def rot_axis_angle_rows(v, axis, deg):
+    """
+    Rodrigues 旋转 (批量): v (N, 3) 绕 axis 旋转 deg 度
+    axis 为 shape (3,) 的公共轴或 (N, 3) 的逐行轴
+    """
+    a = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    th = math.radians(deg)
+    c = math.cos(th); s = math.sin(th)
+    a_dot_v = np.sum(a * v, axis=-1, keepdims=True)
+    return v * c + np.cross(a, v) * s + a * (a_dot_v * (1 - c))
+
 def build_arc_backbone_frames(r, alphaDeg, samples, profile, bowLeanDeg=0.0, bowPlaneTiltDeg=0.0):
     """
     计算弧形弹簧骨架帧 (Position, Tangent, Normal, Binormal)
     支持 ARC 和 BOW 两种轮廓
+    
+    所有采样点一次性向量化计算
+    返回: (P, T, N, B)，各为 (samples, 3) float64 数组
     """
-    frames = []
     a0 = -math.radians(alphaDeg) * 0.5
     a1 =  math.radians(alphaDeg) * 0.5
 
-    axisZ = vec(0, 0, 1)
-
-    for i in range(samples):
-        u = i / (samples - 1)
-        th = a0 + (a1 - a0) * u
-
-        # base arc in XY
-        p = vec(r * math.cos(th), r * math.sin(th), 0.0)
-        t = unit(vec(-math.sin(th), math.cos(th), 0.0))
-        n = unit(vec(-math.cos(th), -math.sin(th), 0.0))
-        b = unit(t.cross(n))
-
-        if profile == "BOW":
-            # plane tilt: rotate (n,b) around local tangent t
-            if abs(bowPlaneTiltDeg) > 1e-9:
-                n = unit(rot_axis_angle(n, t, bowPlaneTiltDeg))
-                b = unit(t.cross(n))
-
-            # lean: rotate entire frame about global Z
-            if abs(bowLeanDeg) > 1e-9:
-                p = rot_axis_angle(p, axisZ, bowLeanDeg)
-                t = unit(rot_axis_angle(t, axisZ, bowLeanDeg))
-                n = unit(rot_axis_angle(n, axisZ, bowLeanDeg))
-                b = unit(rot_axis_angle(b, axisZ, bowLeanDeg))
-
-        frames.append((p, t, n, b))
-    return frames
-
-def accumulated_lengths(frames):
-    L = [0.0] * len(frames)
-    Ltot = 0.0
-    for i in range(1, len(frames)):
-        Ltot += (frames[i][0] - frames[i-1][0]).Length
-        L[i] = Ltot
-    return L, Ltot
+    th = a0 + (a1 - a0) * (np.arange(samples) / (samples - 1))
+    cos_th = np.cos(th)
+    sin_th = np.sin(th)
+    zeros = np.zeros(samples)
+
+    # base arc in XY
+    p = np.column_stack((r * cos_th, r * sin_th, zeros))
+    t = np.column_stack((-sin_th, cos_th, zeros))
+    n = np.column_stack((-cos_th, -sin_th, zeros))
+    b = _unit_rows(np.cross(t, n))
+
+    if profile == "BOW":
+        # plane tilt: rotate (n,b) around local tangent t
+        if abs(bowPlaneTiltDeg) > 1e-9:
+            n = _unit_rows(rot_axis_angle_rows(n, t, bowPlaneTiltDeg))
+            b = _unit_rows(np.cross(t, n))
+
+        # lean: rotate entire frame about global Z
+        if abs(bowLeanDeg) > 1e-9:
+            axisZ = np.array((0.0, 0.0, 1.0))
+            p = rot_axis_angle_rows(p, axisZ, bowLeanDeg)
+            t = _unit_rows(rot_axis_angle_rows(t, axisZ, bowLeanDeg))
+            n = _unit_rows(rot_axis_angle_rows(n, axisZ, bowLeanDeg))
+            b = _unit_rows(rot_axis_angle_rows(b, axisZ, bowLeanDeg))
+
+    return p, t, n, b
+
+def accumulated_lengths(positions):
+    """骨架各点的累积弧长 (列表) 与总长"""
+    seg = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+    L = np.concatenate(([0.0], np.cumsum(seg)))
+    return L.tolist(), float(L[-1])
 
 def blended_anchor_turns_map(L, Ltot, d, n_active, deadStart, deadEnd, k, capRatio=0.95):
     """
@@ -2334,8 +2760,8 @@ def make_arc_spring(params, doc=None, fileStem="ArcSpring"):
     makeSolid = bool(params.get("solid", True))
 
     # 1. 生成骨架
-    frames = build_arc_backbone_frames(r, alphaDeg, samples, profile, bowLeanDeg, bowPlaneTiltDeg)
-    L, Ltot = accumulated_lengths(frames)
+    P, Tf, Nf, Bf = build_arc_backbone_frames(r, alphaDeg, samples, profile, bowLeanDeg, bowPlaneTiltDeg)
+    L, Ltot = accumulated_lengths(P)
 
     # 2. 生成圈数映射
     T_map, totalCoils, Ls, Le, Lb = blended_anchor_turns_map(
@@ -2346,8 +2772,8 @@ def make_arc_spring(params, doc=None, fileStem="ArcSpring"):
     iL = first_index_ge(L, Ls)
     iR = first_index_ge(L, Lb)
 
-    nL, bL = frames[iL][2], frames[iL][3]
-    nR, bR = frames[iR][2], frames[iR][3]
+    nL, bL = Nf[iL], Bf[iL]
+    nR, bR = Nf[iR], Bf[iR]
 
     # ---- build oriented sections for loft ----
     Rcoil = D * 0.5
@@ -2356,11 +2782,9 @@ def make_arc_spring(params, doc=None, fileStem="ArcSpring"):
     # Pass 1: Generate all points on the helical path
     # Note: Removed Axial Lock (nv/bv freezing) - the BSpline sweep handles orientation naturally
     # The T_map already controls pitch (tight spacing in dead zones)
-    pts = []
-    for i, (p, t, nv, bv) in enumerate(frames):
-        phi = 2.0 * math.pi * T_map[i] + phase_rad
-        q = p + nv.multiply(math.cos(phi) * Rcoil) + bv.multiply(math.sin(phi) * Rcoil)
-        pts.append(q)
+    phi = 2.0 * math.pi * np.asarray(T_map) + phase_rad
+    Q = P + Nf * (np.cos(phi) * Rcoil)[:, None] + Bf * (np.sin(phi) * Rcoil)[:, None]
+    pts = vectors_from_array(Q)
 
 
     # Pass 2: Create Spine as Smooth BSpline (eliminates fold lines)
@@ -2440,6 +2864,44 @@ def make_arc_spring(params, doc=None, fileStem="ArcSpring"):
 # TechDraw 工程图生成 - 使用 FreeCAD 真实投影
 # =============================================================================
 
+def f2(x, digits=2):
+    """
+    SVG 数值格式化: 保留 digits 位小数并去掉末尾无效的 0
+    例如 12.50 -> "12.5", 3.00 -> "3", -0.00 -> "0"
+    """
+    text = f"{x:.{digits}f}".rstrip('0').rstrip('.')
+    return "0" if text == "-0" else text
+
+
+# TechDraw 投影缓存: 同一次导出中 PDF 与 SVG 共用同一个 shape，投影只算一次 (LRU，最多 8 个)
+_PROJ_CACHE = OrderedDict()
+_PROJ_CACHE_SIZE = 8
+
+
+def _cached_project(shape, direction):
+    """
+    TechDraw.projectToSVG 的缓存包装
+    key = (shape.hashCode(), 方向)；hashCode 由底层 TShape + Location 决定，
+    spring_obj.Shape 每次返回新的 Python 包装对象也能命中 (不能用 id(shape))
+    hashCode 来自 TShape 地址，形体释放后地址可能被新形体复用，
+    因此缓存项同时保存 shape，命中时再用 isSame() 确认是同一形体
+    """
+    key = (shape.hashCode(), (direction.x, direction.y, direction.z))
+    cached = _PROJ_CACHE.get(key)
+    if cached is not None and cached[0].isSame(shape):
+        _PROJ_CACHE.move_to_end(key)
+        return cached[1]
+    
+    if not TECHDRAW_AVAILABLE:
+        raise ImportError("TechDraw module not available")
+    svg = TechDraw.projectToSVG(shape, direction)
+    _PROJ_CACHE[key] = (shape, svg)
+    _PROJ_CACHE.move_to_end(key)
+    if len(_PROJ_CACHE) > _PROJ_CACHE_SIZE:
+        _PROJ_CACHE.popitem(last=False)
+    return svg
+
+
 def generate_techdraw_projection(shape, direction, scale=1.0):
     """
     使用 FreeCAD TechDraw.projectToSVG 生成真实的 2D 投影
@@ -2452,8 +2914,7 @@ def generate_techdraw_projection(shape, direction, scale=1.0):
     返回: SVG 路径字符串
     """
     try:
-        import TechDraw
-        svg = TechDraw.projectToSVG(shape, direction)
+        svg = _cached_project(shape, direction)
         
         # 添加缩放变换
         if scale != 1.0:
@@ -2465,9 +2926,8 @@ def generate_techdraw_projection(shape, direction, scale=1.0):
         return ""
 
 
-def generate_extension_characteristic_svg():
-    """生成拉簧特性曲线 SVG"""
-    return '''<!-- 拉簧特性线 (从初拉力开始) -->
+# 特性线图模板 (模块级常量; 压簧模板调用时只做 str.format 替换)
+_EXT_CHAR_SVG = '''<!-- 拉簧特性线 (从初拉力开始) -->
       <!-- 初拉力点 -->
       <circle cx="0" cy="28" r="1" fill="black"/>
       <text x="2" y="26" class="small-text">F0</text>
@@ -2488,45 +2948,55 @@ def generate_extension_characteristic_svg():
       <text x="42" y="7" class="small-text">Fmax</text>'''
 
 
-def generate_compression_characteristic_svg(L0, L1, L2, max_deflection, F1, F2, Fs):
-    """生成压簧特性曲线 SVG"""
-    x1 = min((L0-L1)/max_deflection * 40, 35)
-    y1 = max(35 - F1/max(Fs, 1) * 30, 5)
-    x2 = min((L0-L2)/max_deflection * 40, 38)
-    y2 = max(35 - F2/max(Fs, 1) * 30, 5)
-    
-    return f'''<!-- 压簧特性线 -->
+def generate_extension_characteristic_svg():
+    """生成拉簧特性曲线 SVG"""
+    return _EXT_CHAR_SVG
+
+
+_COMP_CHAR_SVG_TPL = '''<!-- 压簧特性线 -->
       <line x1="0" y1="35" x2="40" y2="5" class="medium"/>
       
       <!-- 工作点标注 -->
       <line x1="{x1}" y1="35" x2="{x1}" y2="{y1}" class="extra-thin" stroke-dasharray="2,1"/>
       <circle cx="{x1}" cy="{y1}" r="1" fill="black"/>
-      <text x="{x1 + 2}" y="{y1 - 2}" class="small-text">F1={F1:.0f}</text>
+      <text x="{x1_text}" y="{y1_text}" class="small-text">F1={F1:.0f}</text>
       
       <line x1="{x2}" y1="35" x2="{x2}" y2="{y2}" class="extra-thin" stroke-dasharray="2,1"/>
       <circle cx="{x2}" cy="{y2}" r="1" fill="black"/>
-      <text x="{x2 + 2}" y="{y2 - 2}" class="small-text">F2={F2:.0f}</text>
+      <text x="{x2_text}" y="{y2_text}" class="small-text">F2={F2:.0f}</text>
       
       <circle cx="40" cy="5" r="1" fill="black"/>
       <text x="42" y="7" class="small-text">Fs={Fs:.0f}</text>'''
 
 
-def generate_tech_requirements_svg(spring_type, L0_tol, L0):
-    """生成技术要求 SVG"""
-    if spring_type == "extension":
-        return '''<text class="note-text">
+def generate_compression_characteristic_svg(L0, L1, L2, max_deflection, F1, F2, Fs):
+    """生成压簧特性曲线 SVG"""
+    x1 = min((L0-L1)/max_deflection * 40, 35)
+    y1 = max(35 - F1/max(Fs, 1) * 30, 5)
+    x2 = min((L0-L2)/max_deflection * 40, 38)
+    y2 = max(35 - F2/max(Fs, 1) * 30, 5)
+    
+    return _COMP_CHAR_SVG_TPL.format(
+        x1=f2(x1), y1=f2(y1), x1_text=f2(x1 + 2), y1_text=f2(y1 - 2),
+        x2=f2(x2), y2=f2(y2), x2_text=f2(x2 + 2), y2_text=f2(y2 - 2),
+        F1=F1, F2=F2, Fs=Fs
+    )
+
+
+# 技术要求 / 参数表模板 (模块级常量，调用时只做 str.format 替换)
+_EXT_TECH_REQ_TPL = '''<text class="note-text">
       <tspan x="0" dy="5">1. 材料: 碳素弹簧钢丝 C级 GB/T 4357</tspan>
       <tspan x="0" dy="4">2. 热处理: 去应力退火 250-300C</tspan>
       <tspan x="0" dy="4">3. 表面处理: 发黑或镀锌</tspan>
       <tspan x="0" dy="4">4. 钩子形式: 机器钩 (Machine Hook)</tspan>
       <tspan x="0" dy="4">5. 旋向: 右旋</tspan>
-      <tspan x="0" dy="4">6. 体长公差: +/-''' + f'{L0_tol:.1f}' + '''mm</tspan>
+      <tspan x="0" dy="4">6. 体长公差: +/-{L0_tol:.1f}mm</tspan>
       <tspan x="0" dy="4">7. 刚度公差: +/-10%</tspan>
       <tspan x="0" dy="4">8. 初拉力公差: +/-15%</tspan>
       <tspan x="0" dy="4">9. 执行标准: GB/T 2089</tspan>
     </text>'''
-    elif spring_type == "arc" or spring_type == "arcSpring":
-        return '''<text class="note-text">
+
+_ARC_TECH_REQ = '''<text class="note-text">
       <tspan x="0" dy="5">1. 材料: 碳素弹簧钢丝 C级 GB/T 4357</tspan>
       <tspan x="0" dy="4">2. 热处理: 去应力退火 250-300C</tspan>
       <tspan x="0" dy="4">3. 表面处理: 发黑或镀锌</tspan>
@@ -2534,25 +3004,20 @@ def generate_tech_requirements_svg(spring_type, L0_tol, L0):
       <tspan x="0" dy="4">5. 旋向: 右旋</tspan>
       <tspan x="0" dy="4">6. 执行标准: 工艺规范 Q/ISRI-001</tspan>
     </text>'''
-    else:
-        return '''<text class="note-text">
+
+_COMP_TECH_REQ_TPL = '''<text class="note-text">
       <tspan x="0" dy="5">1. 材料: 碳素弹簧钢丝 C级 GB/T 4357</tspan>
       <tspan x="0" dy="4">2. 热处理: 去应力退火 250-300C</tspan>
       <tspan x="0" dy="4">3. 表面处理: 发黑或镀锌</tspan>
       <tspan x="0" dy="4">4. 两端并紧磨平，磨削量 3/4 圈</tspan>
       <tspan x="0" dy="4">5. 旋向: 右旋</tspan>
-      <tspan x="0" dy="4">6. 自由长度公差: +/-''' + f'{L0_tol:.1f}' + '''mm</tspan>
+      <tspan x="0" dy="4">6. 自由长度公差: +/-{L0_tol:.1f}mm</tspan>
       <tspan x="0" dy="4">7. 刚度公差: +/-10%</tspan>
-      <tspan x="0" dy="4">8. 垂直度: ''' + f'{L0*0.03:.1f}' + '''mm</tspan>
+      <tspan x="0" dy="4">8. 垂直度: {L0_vert:.1f}mm</tspan>
       <tspan x="0" dy="4">9. 执行标准: GB/T 1239.2</tspan>
     </text>'''
 
-
-def generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate):
-    """生成参数表 SVG"""
-    if spring_type == "extension":
-        initial_force = spring_rate * 0.1 * L0
-        return f'''<text class="small-text">
+_EXT_PARAMS_TPL = '''<text class="small-text">
       <tspan x="3" dy="15">线径 d</tspan><tspan x="45" dy="0">{d:.2f} mm</tspan>
       <tspan x="3" dy="4">中径 D</tspan><tspan x="45" dy="0">{Dm:.1f} mm</tspan>
       <tspan x="3" dy="4">外径 D2</tspan><tspan x="45" dy="0">{OD:.1f} mm</tspan>
@@ -2563,17 +3028,17 @@ def generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_acti
       <tspan x="3" dy="4">刚度 k</tspan><tspan x="45" dy="0">{spring_rate:.2f} N/mm</tspan>
       <tspan x="3" dy="4">初拉力 F0</tspan><tspan x="45" dy="0">{initial_force:.1f} N</tspan>
     </text>'''
-    elif spring_type == "arc" or spring_type == "arcSpring":
-        return f'''<text class="small-text">
+
+_ARC_PARAMS_TPL = '''<text class="small-text">
       <tspan x="3" dy="15">线径 d</tspan><tspan x="45" dy="0">{d:.2f} mm</tspan>
       <tspan x="3" dy="4">中径 D</tspan><tspan x="45" dy="0">{Dm:.1f} mm</tspan>
-      <tspan x="3" dy="4">弧半径 R</tspan><tspan x="45" dy="0">{geometry.get("arcRadius", 0):.1f} mm</tspan>
-      <tspan x="3" dy="4">弧角度 α</tspan><tspan x="45" dy="0">{geometry.get("arcAlpha", 0):.1f} °</tspan>
+      <tspan x="3" dy="4">弧半径 R</tspan><tspan x="45" dy="0">{arc_radius:.1f} mm</tspan>
+      <tspan x="3" dy="4">弧角度 α</tspan><tspan x="45" dy="0">{arc_alpha:.1f} °</tspan>
       <tspan x="3" dy="4">有效圈数 n</tspan><tspan x="45" dy="0">{Na}</tspan>
       <tspan x="3" dy="4">刚度 k</tspan><tspan x="45" dy="0">{spring_rate:.2f} N/mm</tspan>
     </text>'''
-    else:
-        return f'''<text class="small-text">
+
+_COMP_PARAMS_TPL = '''<text class="small-text">
       <tspan x="3" dy="15">线径 d</tspan><tspan x="45" dy="0">{d:.2f} mm</tspan>
       <tspan x="3" dy="4">中径 D</tspan><tspan x="45" dy="0">{Dm:.1f} mm</tspan>
       <tspan x="3" dy="4">外径 D2</tspan><tspan x="45" dy="0">{OD:.1f} mm</tspan>
@@ -2585,118 +3050,52 @@ def generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_acti
     </text>'''
 
 
-def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
+@functools.lru_cache(maxsize=64)
+def generate_tech_requirements_svg(spring_type, L0_tol, L0):
+    """生成技术要求 SVG"""
+    if spring_type == "extension":
+        return _EXT_TECH_REQ_TPL.format(L0_tol=L0_tol)
+    elif spring_type == "arc" or spring_type == "arcSpring":
+        return _ARC_TECH_REQ
+    else:
+        return _COMP_TECH_REQ_TPL.format(L0_tol=L0_tol, L0_vert=L0 * 0.03)
+
+
+@functools.lru_cache(maxsize=64)
+def generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate,
+                              arc_radius=0.0, arc_alpha=0.0):
     """
-    生成标准 2D 工程图 SVG - 使用 FreeCAD TechDraw 真实投影
-    
-    包含:
-    - 主视图: FreeCAD TechDraw 真实投影 (前视图)
-    - 俯视图: FreeCAD TechDraw 真实投影 (顶视图)
-    - 特性线图: 力-位移三角形 (含 F1, F2, Fs)
-    - 标准尺寸标注 (带公差)
-    - 技术要求
-    - GB/T 10609.1 标题栏
+    生成参数表 SVG
+    arc_radius / arc_alpha 仅用于弧形弹簧 (geometry 中的 arcRadius / arcAlpha)
     """
-    import datetime
-    import TechDraw
-    
-    # 获取参数
-    d = geometry.get("wireDiameter", 3.2)
-    Dm = geometry.get("meanDiameter", 24.0)
-    OD = geometry.get("outerDiameter", Dm + d)
-    ID = OD - 2 * d
-    Na = geometry.get("activeCoils", 8)
-    Nt = geometry.get("totalCoils", Na + 2)
-    
-    # 根据弹簧类型确定长度参数
     if spring_type == "extension":
-        # 拉簧：紧密缠绕
-        L0 = Na * d
-        pitch_active = d
-    else:
-        # 压簧
-        L0 = geometry.get("freeLength", 50.0)
-        dead_coils = Nt - Na
-        pitch_dead = d
-        dead_height = dead_coils * pitch_dead
-        pitch_active = (L0 - dead_height) / Na if Na > 0 else d
-    
-    # 计算弹簧刚度 (GB/T 1239.6)
-    G = 79300  # MPa, 弹簧钢剪切模量
-    spring_rate = (G * d**4) / (8 * Dm**3 * Na) if Na > 0 else 0
-    
-    # 计算特性参数
-    Hs = Nt * d  # 并紧高度
-    max_deflection = max(L0 - Hs, 1.0)
-    Fs = spring_rate * max_deflection if spring_rate > 0 else 0
-    
-    # 工作状态参数 (示例)
-    if spring_type == "arc" or spring_type == "arcSpring":
-        # 弧形弹簧简化的特性参数
-        L1, L2, F1, F2, Fs = 0, 0, 0, 0, 0
+        initial_force = spring_rate * 0.1 * L0
+        return _EXT_PARAMS_TPL.format(d=d, Dm=Dm, OD=OD, ID=ID, L0=L0, Na=Na,
+                                      spring_rate=spring_rate, initial_force=initial_force)
+    elif spring_type == "arc" or spring_type == "arcSpring":
+        return _ARC_PARAMS_TPL.format(d=d, Dm=Dm, arc_radius=arc_radius, arc_alpha=arc_alpha,
+                                      Na=Na, spring_rate=spring_rate)
     else:
-        L1 = L0 * 0.85  # 安装长度
-        L2 = L0 * 0.70  # 工作长度
-        F1 = spring_rate * (L0 - L1)  # 安装力
-        F2 = spring_rate * (L0 - L2)  # 工作力
-    
-    # 公差
-    L0_tol = L0 * 0.02  # ±2%
-    k_tol = spring_rate * 0.10  # ±10%
-    
-    # 页面尺寸 (A4 横向)
-    page_width = 297
-    page_height = 210
-    margin = 8
-    
-    # 获取弹簧形状的边界框
-    shape = spring_obj.Shape
-    bbox = shape.BoundBox
-    shape_width = max(bbox.XLength, bbox.YLength)
-    shape_height = bbox.ZLength
-    
-    # 计算缩放 - 适配页面
-    available_height = 90
-    available_width = 50
-    scale = min(available_height / shape_height, available_width / shape_width) * 0.85
-    
-    # === 使用 FreeCAD TechDraw 生成真实投影 ===
-    print("Generating TechDraw projections...")
-    
-    # 前视图 (Y 方向)
-    front_svg = TechDraw.projectToSVG(shape, App.Vector(0, 1, 0))
-    print(f"Front view SVG: {len(front_svg)} chars")
-    
-    # 俯视图 (Z 方向)  
-    top_svg = TechDraw.projectToSVG(shape, App.Vector(0, 0, 1))
-    print(f"Top view SVG: {len(top_svg)} chars")
-    
-    # 侧视图 (X 方向)
-    side_svg = TechDraw.projectToSVG(shape, App.Vector(1, 0, 0))
-    print(f"Side view SVG: {len(side_svg)} chars")
-    
-    # 生成 SVG
-    svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" 
-     width="{page_width}mm" height="{page_height}mm" 
-     viewBox="0 0 {page_width} {page_height}"
-     style="background: white;">
-  
-  <defs>
+        return _COMP_PARAMS_TPL.format(d=d, Dm=Dm, OD=OD, ID=ID, L0=L0, Na=Na, Nt=Nt,
+                                       pitch_active=pitch_active)
+
+
+# SVG 样式 / 箭头 / 剖面线定义 (固定内容，模块级常量)
+_SVG_DEFS = '''  <defs>
     <style>
-      .thick {{ stroke: black; stroke-width: 0.5; fill: none; }}
-      .medium {{ stroke: black; stroke-width: 0.35; fill: none; }}
-      .thin {{ stroke: black; stroke-width: 0.25; fill: none; }}
-      .extra-thin {{ stroke: black; stroke-width: 0.18; fill: none; }}
-      .centerline {{ stroke: black; stroke-width: 0.18; stroke-dasharray: 12,3,2,3; fill: none; }}
-      .hidden {{ stroke: black; stroke-width: 0.25; stroke-dasharray: 3,1.5; fill: none; }}
-      .dimension {{ stroke: black; stroke-width: 0.18; fill: none; }}
-      .hatch {{ stroke: black; stroke-width: 0.1; fill: none; }}
-      .dim-text {{ font-family: 'SimSun', Arial, sans-serif; font-size: 3.5px; fill: black; }}
-      .title-text {{ font-family: 'SimHei', Arial, sans-serif; font-size: 5px; fill: black; font-weight: bold; }}
-      .label-text {{ font-family: 'SimSun', Arial, sans-serif; font-size: 3px; fill: black; }}
-      .note-text {{ font-family: 'SimSun', Arial, sans-serif; font-size: 2.8px; fill: black; }}
-      .small-text {{ font-family: 'SimSun', Arial, sans-serif; font-size: 2.2px; fill: black; }}
+      .thick { stroke: black; stroke-width: 0.5; fill: none; }
+      .medium { stroke: black; stroke-width: 0.35; fill: none; }
+      .thin { stroke: black; stroke-width: 0.25; fill: none; }
+      .extra-thin { stroke: black; stroke-width: 0.18; fill: none; }
+      .centerline { stroke: black; stroke-width: 0.18; stroke-dasharray: 12,3,2,3; fill: none; }
+      .hidden { stroke: black; stroke-width: 0.25; stroke-dasharray: 3,1.5; fill: none; }
+      .dimension { stroke: black; stroke-width: 0.18; fill: none; }
+      .hatch { stroke: black; stroke-width: 0.1; fill: none; }
+      .dim-text { font-family: 'SimSun', Arial, sans-serif; font-size: 3.5px; fill: black; }
+      .title-text { font-family: 'SimHei', Arial, sans-serif; font-size: 5px; fill: black; font-weight: bold; }
+      .label-text { font-family: 'SimSun', Arial, sans-serif; font-size: 3px; fill: black; }
+      .note-text { font-family: 'SimSun', Arial, sans-serif; font-size: 2.8px; fill: black; }
+      .small-text { font-family: 'SimSun', Arial, sans-serif; font-size: 2.2px; fill: black; }
     </style>
     <!-- 标准尺寸箭头 (实心三角形, 30°) -->
     <marker id="dim-arrow" markerWidth="3" markerHeight="2" refX="3" refY="1" orient="auto">
@@ -2710,76 +3109,132 @@ def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
       <line x1="0" y1="0" x2="0" y2="2" class="hatch"/>
     </pattern>
   </defs>
+'''
+
+
+def _emit_header(out, page_width, page_height, margin):
+    """SVG 头部: 样式、箭头/剖面线定义、图框"""
+    out.write(f'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" 
+     width="{page_width}mm" height="{page_height}mm" 
+     viewBox="0 0 {page_width} {page_height}"
+     style="background: white;">
   
+{_SVG_DEFS}  
   <!-- 图框 -->
   <rect x="{margin}" y="{margin}" width="{page_width - 2*margin}" height="{page_height - 2*margin}" class="thick"/>
   <rect x="{margin + 5}" y="{margin + 5}" width="{page_width - 2*margin - 10}" height="{page_height - 2*margin - 10}" class="thin"/>
   
-  <!-- ==================== 主视图 (FreeCAD TechDraw 真实投影) ==================== -->
+''')
+
+
+# 尺寸标注模板 (水平 / 竖直尺寸线 + 两条尺寸界线 + 文字)
+# e0 / e1 为尺寸界线在垂直于尺寸线方向的起止坐标
+_DIM_HORIZ_TPL = '''    <g transform="translate({cx}, {cy})">
+      <line x1="{x0}" y1="{e0}" x2="{x0}" y2="{e1}" class="extra-thin"/>
+      <line x1="{x1}" y1="{e0}" x2="{x1}" y2="{e1}" class="extra-thin"/>
+      <line x1="{x0}" y1="0" x2="{x1}" y2="0" class="dimension" marker-start="url(#dim-arrow-rev)" marker-end="url(#dim-arrow)"/>
+      <text x="0" y="{ty}" class="dim-text" text-anchor="middle">{label}</text>
+    </g>'''
+
+_DIM_VERT_TPL = '''    <g transform="translate({cx}, {cy})">
+      <line x1="{e0}" y1="{y0}" x2="{e1}" y2="{y0}" class="extra-thin"/>
+      <line x1="{e0}" y1="{y1}" x2="{e1}" y2="{y1}" class="extra-thin"/>
+      <line x1="0" y1="{y0}" x2="0" y2="{y1}" class="dimension" marker-start="url(#dim-arrow-rev)" marker-end="url(#dim-arrow)"/>
+      <text x="3" y="1" class="dim-text">{label}</text>
+    </g>'''
+
+
+def _emit_front_view(out, front_svg, scale, shape_height, bbox, OD, d, L0_tol, gb_offset=None):
+    """
+    主视图: 投影 + 总长/外径/线径标注
+    gb_offset 为 None 时 front_svg 是 TechDraw 投影 (模型坐标，需缩放);
+    否则 front_svg 是 generate_gb_spring_svg 的解析画法 (已乘 scale，轴线竖直)，
+    旋转 90° 为轴线水平并沿轴线平移 gb_offset
+    (必须是旋转 (x, y) → (y, -x)，不能用转置: 转置是镜像，会把右旋画成左旋)
+    """
+    if gb_offset is None:
+        view_group = f'<g transform="scale({f2(scale, 4)}, -{f2(scale, 4)})" stroke="black" stroke-width="{f2(0.3/scale, 4)}" fill="none">'
+        view_title, view_source, view_label = "FreeCAD TechDraw 真实投影", "FreeCAD 投影的 SVG (前视图)", "主视图 (FreeCAD)"
+    else:
+        view_group = f'<g transform="matrix(0, -1, 1, 0, {f2(gb_offset)}, 0)">'
+        view_title, view_source, view_label = "工程图标准画法", "标准画法的 SVG (前视图)", "主视图 (标准画法)"
+    
+    # 总长 L (上方，水平) / 外径 D (右侧，竖直)
+    dim_length = _DIM_HORIZ_TPL.format_map({
+        'cx': f2((bbox.ZMin + bbox.ZMax) / 2 * scale), 'cy': f2(-OD/2 * scale - 12),
+        'x0': f2(-shape_height * scale / 2), 'x1': f2(shape_height * scale / 2),
+        'e0': 8, 'e1': -2, 'ty': -3, 'label': f'L={shape_height:.1f}+/-{L0_tol:.1f}'})
+    dim_diameter = _DIM_VERT_TPL.format_map({
+        'cx': f2(shape_height * scale / 2 + 12), 'cy': 0,
+        'y0': f2(-OD/2 * scale), 'y1': f2(OD/2 * scale),
+        'e0': -8, 'e1': 2, 'label': f'D={OD:.1f}'})
+    
+    out.write(f'''  <!-- ==================== 主视图 ({view_title}) ==================== -->
   <!-- 弹簧是横向放置的 (轴线水平)，所以 shape_height 是水平长度，shape_width 是垂直高度 -->
   <g transform="translate(75, 70)">
-    <!-- FreeCAD 投影的 SVG (前视图) -->
-    <g transform="scale({scale}, -{scale})" stroke="black" stroke-width="{0.3/scale}" fill="none">
+    <!-- {view_source} -->
+    {view_group}
       {front_svg}
     </g>
     
     <!-- 中心线 (水平) -->
-    <line x1="{-shape_height * scale / 2 - 15}" y1="0" x2="{shape_height * scale / 2 + 15}" y2="0" class="centerline"/>
+    <line x1="{f2(-shape_height * scale / 2 - 15)}" y1="0" x2="{f2(shape_height * scale / 2 + 15)}" y2="0" class="centerline"/>
     
     <!-- 尺寸标注: 总长度 L (上方，水平方向) -->
     <!-- shape_height = bbox.ZLength 是弹簧的实际长度 -->
     <!-- bbox.ZMin 和 bbox.ZMax 确定弹簧的实际位置，需要计算中心偏移 -->
-    <g transform="translate({(bbox.ZMin + bbox.ZMax) / 2 * scale}, {-OD/2 * scale - 12})">
-      <line x1="{-shape_height * scale / 2}" y1="8" x2="{-shape_height * scale / 2}" y2="-2" class="extra-thin"/>
-      <line x1="{shape_height * scale / 2}" y1="8" x2="{shape_height * scale / 2}" y2="-2" class="extra-thin"/>
-      <line x1="{-shape_height * scale / 2}" y1="0" x2="{shape_height * scale / 2}" y2="0" class="dimension" marker-start="url(#dim-arrow-rev)" marker-end="url(#dim-arrow)"/>
-      <text x="0" y="-3" class="dim-text" text-anchor="middle">L={shape_height:.1f}+/-{L0_tol:.1f}</text>
-    </g>
+{dim_length}
     
     <!-- 尺寸标注: 外径 D (右侧，垂直方向) -->
-    <g transform="translate({shape_height * scale / 2 + 12}, 0)">
-      <line x1="-8" y1="{-OD/2 * scale}" x2="2" y2="{-OD/2 * scale}" class="extra-thin"/>
-      <line x1="-8" y1="{OD/2 * scale}" x2="2" y2="{OD/2 * scale}" class="extra-thin"/>
-      <line x1="0" y1="{-OD/2 * scale}" x2="0" y2="{OD/2 * scale}" class="dimension" marker-start="url(#dim-arrow-rev)" marker-end="url(#dim-arrow)"/>
-      <text x="3" y="1" class="dim-text">D={OD:.1f}</text>
-    </g>
+{dim_diameter}
     
     <!-- 尺寸标注: 线径 d (左下引出线) -->
-    <g transform="translate({-shape_height * scale / 2 - 5}, {OD/2 * scale - d * scale})">
+    <g transform="translate({f2(-shape_height * scale / 2 - 5)}, {f2(OD/2 * scale - d * scale)})">
       <line x1="5" y1="0" x2="-10" y2="8" class="extra-thin"/>
       <line x1="-10" y1="8" x2="-20" y2="8" class="extra-thin"/>
       <text x="-27" y="-6" class="dim-text" text-anchor="end">d={d:.2f}</text>
     </g>
     
     <!-- 视图标记 -->
-    <text x="0" y="{shape_height * scale / 2 + 22}" class="label-text" text-anchor="middle">主视图 (FreeCAD)</text>
+    <text x="0" y="{f2(shape_height * scale / 2 + 22)}" class="label-text" text-anchor="middle">{view_label}</text>
   </g>
   
-  <!-- ==================== 俯视图 (在主视图右方对齐，Y轴对齐) ==================== -->
+''')
+
+
+def _emit_top_view(out, top_svg, scale, shape_height, OD):
+    """俯视图: TechDraw 投影 + 外径标注"""
+    dim_diameter = _DIM_HORIZ_TPL.format_map({
+        'cx': 0, 'cy': f2(OD/2 * scale + 10),
+        'x0': f2(-OD/2 * scale), 'x1': f2(OD/2 * scale),
+        'e0': -6, 'e1': 2, 'ty': 5, 'label': f'D={OD:.1f}'})
+    
+    out.write(f'''  <!-- ==================== 俯视图 (在主视图右方对齐，Y轴对齐) ==================== -->
   <!-- 主视图中心在 y=70，俯视图也应该在 y=70 -->
-  <g transform="translate({75 + shape_height * scale / 2 + OD * scale / 2 + 30}, 70)">
+  <g transform="translate({f2(75 + shape_height * scale / 2 + OD * scale / 2 + 30)}, 70)">
     <!-- FreeCAD 投影的 SVG (俯视图/端面图) -->
-    <g transform="scale({scale}, {scale})" stroke="black" stroke-width="{0.3/scale}" fill="none">
+    <g transform="scale({f2(scale, 4)}, {f2(scale, 4)})" stroke="black" stroke-width="{f2(0.3/scale, 4)}" fill="none">
       {top_svg}
     </g>
     
     <!-- 中心线 -->
-    <line x1="{-OD/2 * scale - 8}" y1="0" x2="{OD/2 * scale + 8}" y2="0" class="centerline"/>
-    <line x1="0" y1="{-OD/2 * scale - 8}" x2="0" y2="{OD/2 * scale + 8}" class="centerline"/>
+    <line x1="{f2(-OD/2 * scale - 8)}" y1="0" x2="{f2(OD/2 * scale + 8)}" y2="0" class="centerline"/>
+    <line x1="0" y1="{f2(-OD/2 * scale - 8)}" x2="0" y2="{f2(OD/2 * scale + 8)}" class="centerline"/>
     
     <!-- 尺寸标注: 外径 -->
-    <g transform="translate(0, {OD/2 * scale + 10})">
-      <line x1="{-OD/2 * scale}" y1="-6" x2="{-OD/2 * scale}" y2="2" class="extra-thin"/>
-      <line x1="{OD/2 * scale}" y1="-6" x2="{OD/2 * scale}" y2="2" class="extra-thin"/>
-      <line x1="{-OD/2 * scale}" y1="0" x2="{OD/2 * scale}" y2="0" class="dimension" marker-start="url(#dim-arrow-rev)" marker-end="url(#dim-arrow)"/>
-      <text x="0" y="5" class="dim-text" text-anchor="middle">D={OD:.1f}</text>
-    </g>
+{dim_diameter}
     
     <!-- 视图标记 -->
-    <text x="0" y="{OD/2 * scale + 20}" class="label-text" text-anchor="middle">俯视图</text>
+    <text x="0" y="{f2(OD/2 * scale + 20)}" class="label-text" text-anchor="middle">俯视图</text>
   </g>
   
-  <!-- ==================== 特性线图 ==================== -->
+''')
+
+
+def _emit_char_curve(out, spring_type, L0, L1, L2, max_deflection, F1, F2, Fs, spring_rate, k_tol):
+    """特性线图"""
+    out.write(f'''  <!-- ==================== 特性线图 ==================== -->
   <g transform="translate(220, 15)">
     <rect x="0" y="0" width="65" height="55" class="thin"/>
     <text x="30" y="8" class="label-text" text-anchor="middle" font-weight="bold">{"拉伸特性曲线" if spring_type == "extension" else "压缩特性曲线"}</text>
@@ -2802,7 +3257,12 @@ def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
     <text x="30" y="52" class="small-text" text-anchor="middle">k={spring_rate:.2f}±{k_tol:.2f} N/mm</text>
   </g>
   
-  <!-- ==================== 技术要求 ==================== -->
+''')
+
+
+def _emit_tech_requirements(out, spring_type, margin, L0_tol, L0):
+    """技术要求"""
+    out.write(f'''  <!-- ==================== 技术要求 ==================== -->
   <g transform="translate({margin + 8}, 135)">
     <text class="label-text" font-weight="bold">
       <tspan x="0" dy="0">技术要求:</tspan>
@@ -2810,16 +3270,27 @@ def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
     {generate_tech_requirements_svg(spring_type, L0_tol, L0)}
   </g>
   
-  <!-- ==================== 参数表 ==================== -->
+''')
+
+
+def _emit_params_table(out, spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate,
+                       arc_radius=0.0, arc_alpha=0.0):
+    """参数表"""
+    out.write(f'''  <!-- ==================== 参数表 ==================== -->
   <g transform="translate(210, 75)">
     <rect x="0" y="0" width="75" height="{"58" if spring_type == "extension" else "50"}" class="thin"/>
     <text x="37.5" y="7" class="label-text" text-anchor="middle" font-weight="bold">{"拉簧参数" if spring_type == "extension" else "弹簧参数"}</text>
     <line x1="0" y1="9" x2="75" y2="9" class="extra-thin"/>
     
-    {generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate)}
+    {generate_params_table_svg(spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate, arc_radius, arc_alpha)}
   </g>
   
-  <!-- ==================== 标题栏 (GB/T 10609.1) ==================== -->
+''')
+
+
+def _emit_title_block(out, spring_type, Na, Nt, scale, page_width, page_height, margin, today_str):
+    """标题栏 (GB/T 10609.1)"""
+    out.write(f'''  <!-- ==================== 标题栏 (GB/T 10609.1) ==================== -->
   <g transform="translate({margin + 5}, {page_height - margin - 25})">
     <!-- 外框 -->
     <rect x="0" y="0" width="{page_width - 2*margin - 10}" height="20" class="thick"/>
@@ -2841,7 +3312,7 @@ def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
     <text x="180" y="7" class="small-text" text-anchor="middle">比例</text>
     <text x="215" y="7" class="small-text" text-anchor="middle">日期</text>
     <text x="250" y="7" class="small-text" text-anchor="middle">张次</text>
-  '''
+  ''')
     # 计算标题和图号
     if spring_type == "arc" or spring_type == "arcSpring":
         title = "弧形弹簧"
@@ -2853,33 +3324,259 @@ def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt):
         title = "压缩弹簧"
         doc_no = f"CP-{Nt:02d}{Na:02d}"
 
-    svg_content += f'''
+    out.write(f'''
     <text x="25" y="17" class="title-text" text-anchor="middle">{title}</text>
     <text x="75" y="17" class="small-text" text-anchor="middle">60Si2MnA</text>
     <text x="130" y="17" class="small-text" text-anchor="middle">{doc_no}</text>
     <text x="180" y="17" class="small-text" text-anchor="middle">{scale:.1f}:1</text>
-    <text x="215" y="17" class="small-text" text-anchor="middle">{datetime.date.today()}</text>
+    <text x="215" y="17" class="small-text" text-anchor="middle">{today_str}</text>
     <text x="250" y="17" class="small-text" text-anchor="middle">1/1</text>
   </g>
   
-</svg>'''
+</svg>''')
+
+
+# 工程图默认投影的视图 (侧视图不在图纸中使用，不投影)
+TECHDRAW_DEFAULT_VIEWS = frozenset({"front", "top"})
+
+
+@dataclass(frozen=True)
+class DrawingParams:
+    """
+    工程图参数 (由 geometry 一次性解析得到)
+    main() 中只构造一次，PDF / SVG 两种图纸共用，各区块直接取用已算好的值
+    """
+    d: float
+    Dm: float
+    OD: float
+    ID: float
+    Na: int
+    Nt: int
+    L0: float
+    pitch_active: float
+    spring_rate: float
+    max_deflection: float
+    L1: float
+    L2: float
+    F1: float
+    F2: float
+    Fs: float
+    L0_tol: float
+    k_tol: float
+    arc_radius: float = 0.0
+    arc_alpha: float = 0.0
+    
+    @classmethod
+    def from_geometry(cls, geometry, spring_type):
+        """从设计 JSON 的 geometry 计算图纸所需的全部参数"""
+        # 获取参数
+        d = geometry.get("wireDiameter", 3.2)
+        Dm = geometry.get("meanDiameter", 24.0)
+        OD = geometry.get("outerDiameter", Dm + d)
+        ID = OD - 2 * d
+        Na = geometry.get("activeCoils", 8)
+        Nt = geometry.get("totalCoils", Na + 2)
+        
+        # 根据弹簧类型确定长度参数
+        if spring_type == "extension":
+            # 拉簧：紧密缠绕
+            L0 = Na * d
+            pitch_active = d
+        else:
+            # 压簧
+            L0 = geometry.get("freeLength", 50.0)
+            dead_coils = Nt - Na
+            pitch_dead = d
+            dead_height = dead_coils * pitch_dead
+            pitch_active = (L0 - dead_height) / Na if Na > 0 else d
+        
+        # 计算弹簧刚度 (GB/T 1239.6)
+        G = 79300  # MPa, 弹簧钢剪切模量
+        spring_rate = (G * d**4) / (8 * Dm**3 * Na) if Na > 0 else 0
+        
+        # 计算特性参数
+        Hs = Nt * d  # 并紧高度
+        max_deflection = max(L0 - Hs, 1.0)
+        Fs = spring_rate * max_deflection if spring_rate > 0 else 0
+        
+        # 工作状态参数 (示例)
+        if spring_type == "arc" or spring_type == "arcSpring":
+            # 弧形弹簧简化的特性参数
+            L1, L2, F1, F2, Fs = 0, 0, 0, 0, 0
+        else:
+            L1 = L0 * 0.85  # 安装长度
+            L2 = L0 * 0.70  # 工作长度
+            F1 = spring_rate * (L0 - L1)  # 安装力
+            F2 = spring_rate * (L0 - L2)  # 工作力
+        
+        # 公差
+        L0_tol = L0 * 0.02  # ±2%
+        k_tol = spring_rate * 0.10  # ±10%
+        
+        return cls(d=d, Dm=Dm, OD=OD, ID=ID, Na=Na, Nt=Nt, L0=L0,
+                   pitch_active=pitch_active, spring_rate=spring_rate,
+                   max_deflection=max_deflection, L1=L1, L2=L2, F1=F1, F2=F2, Fs=Fs,
+                   L0_tol=L0_tol, k_tol=k_tol,
+                   arc_radius=geometry.get("arcRadius", 0), arc_alpha=geometry.get("arcAlpha", 0))
+
+
+def generate_techdraw(doc, spring_obj, geometry, spring_type, output_path, fmt,
+                      views=TECHDRAW_DEFAULT_VIEWS, params=None):
+    """
+    生成标准 2D 工程图 SVG - 使用 FreeCAD TechDraw 真实投影
+    
+    包含:
+    - 主视图: FreeCAD TechDraw 真实投影 (前视图)
+    - 俯视图: FreeCAD TechDraw 真实投影 (顶视图)
+    - 特性线图: 力-位移三角形 (含 F1, F2, Fs)
+    - 标准尺寸标注 (带公差)
+    - 技术要求
+    - GB/T 10609.1 标题栏
+    
+    views: 需要 TechDraw 投影的视图集合 ("front" / "top")，未列出的视图留空、不投影
+    params: 已解析的 DrawingParams；为 None 时由 geometry 计算
+    """
+    if params is None:
+        params = DrawingParams.from_geometry(geometry, spring_type)
+    p = params
+    d, Dm, OD, ID, Na, Nt = p.d, p.Dm, p.OD, p.ID, p.Na, p.Nt
+    L0, pitch_active, spring_rate = p.L0, p.pitch_active, p.spring_rate
+    max_deflection, L1, L2, F1, F2, Fs = p.max_deflection, p.L1, p.L2, p.F1, p.F2, p.Fs
+    L0_tol, k_tol = p.L0_tol, p.k_tol
+    
+    # 页面尺寸 (A4 横向)
+    page_width = 297
+    page_height = 210
+    margin = 8
+    
+    # 获取弹簧形状的边界框
+    shape = spring_obj.Shape
+    bbox = shape.BoundBox
+    shape_width = max(bbox.XLength, bbox.YLength)
+    shape_height = bbox.ZLength
+    
+    # 计算缩放 - 适配页面
+    available_height = 90
+    available_width = 50
+    scale = min(available_height / shape_height, available_width / shape_width) * 0.85
+    
+    # === 使用 FreeCAD TechDraw 生成真实投影 ===
+    print("Generating TechDraw projections...")
+    
+    # 前视图 (Y 方向)
+    # 压簧是单一扫掠圆柱螺旋，轮廓可解析画出 (GB 标准画法)，跳过 TechDraw 的 HLR 消隐
+    front_svg = ""
+    gb_offset = None
+    if "front" in views:
+        if spring_type == "compression":
+            front_svg = generate_gb_spring_svg(Nt, Na, d, Dm, L0, scale)
+            # 解析画法 z 从 0 到 L0，与包围盒中心对齐
+            gb_offset = ((bbox.ZMin + bbox.ZMax) / 2 - L0 / 2) * scale
+        else:
+            front_svg = _cached_project(shape, App.Vector(0, 1, 0))
+        print(f"Front view SVG: {len(front_svg)} chars")
+    
+    # 俯视图 (Z 方向)  
+    top_svg = ""
+    if "top" in views:
+        top_svg = _cached_project(shape, App.Vector(0, 0, 1))
+        print(f"Top view SVG: {len(top_svg)} chars")
     
-    # 写入文件
+    # 侧视图 (X 方向) 未在图纸中使用，不再投影
+    
+    # 生成 SVG: 各区块直接流式写入文件 (不在内存中拼接整张图纸)
+    today_str = datetime.date.today().isoformat()
     svg_path = output_path if output_path.endswith('.svg') else output_path.replace('.pdf', '.svg')
-    with open(svg_path, 'w', encoding='utf-8') as f:
-        f.write(svg_content)
+    with open(svg_path, 'w', encoding='utf-8', newline='', buffering=1 << 16) as out:
+        _emit_header(out, page_width, page_height, margin)
+        _emit_front_view(out, front_svg, scale, shape_height, bbox, OD, d, L0_tol, gb_offset)
+        _emit_top_view(out, top_svg, scale, shape_height, OD)
+        _emit_char_curve(out, spring_type, L0, L1, L2, max_deflection, F1, F2, Fs, spring_rate, k_tol)
+        _emit_tech_requirements(out, spring_type, margin, L0_tol, L0)
+        _emit_params_table(out, spring_type, d, Dm, OD, ID, L0, Na, Nt, pitch_active, spring_rate,
+                           p.arc_radius, p.arc_alpha)
+        _emit_title_block(out, spring_type, Na, Nt, scale, page_width, page_height, margin, today_str)
     
     print(f"Generated engineering drawing SVG: {svg_path}")
     return svg_path
 
 
+# GB 弹簧侧视图: 每半圈段数按图面尺寸自适应，弦高误差 < 0.5 (图纸单位)
+_GB_MIN_POINTS_PER_HALF = 6
+_GB_MAX_POINTS_PER_HALF = 24
+_GB_CHORD_TOL = 0.5
+
+
+def gb_points_per_half(R, r, scale):
+    """
+    半圈采样段数，限制在 [6, 24]
+    半径 Rs 上每段圆心角 π/n 的弦高 ≈ Rs·(π/n)²/8，令其 < 0.5 得 n = π·sqrt(Rs / 4)
+    """
+    Rs = (R + r) * scale
+    n = int(math.ceil(math.pi * math.sqrt(max(Rs, 0.0) / (8.0 * _GB_CHORD_TOL))))
+    return max(_GB_MIN_POINTS_PER_HALF, min(_GB_MAX_POINTS_PER_HALF, n))
+
+
+@functools.lru_cache(maxsize=_GB_MAX_POINTS_PER_HALF)
+def _gb_half_tables(points_per_half):
+    """
+    半圈采样参数 t 与 cos 表 (按段数缓存，只读)
+    返回: (half_t, cos_front, cos_back)
+    """
+    half_t = np.arange(points_per_half + 1) / points_per_half
+    cos_front = np.cos(half_t * math.pi)            # 0 到 π
+    cos_back = np.cos(math.pi + half_t * math.pi)   # π 到 2π
+    for arr in (half_t, cos_front, cos_back):
+        arr.setflags(write=False)
+    return half_t, cos_front, cos_back
+
+
+def _svg_points_x(xs):
+    """x 坐标数组 -> 已格式化的字符串列表 (各圈共用，只格式化一次)"""
+    return [f2(x) for x in xs.tolist()]
+
+
+def _svg_points(x_strs, ys):
+    """polyline points 属性: 'x1,y1 x2,y2 ...'"""
+    return ' '.join([f'{x},{f2(y)}' for x, y in zip(x_strs, ys.tolist())])
+
+
+def gb_coil_z(n_coils, Na, dead_coils_per_end, pitch_dead, pitch_active, scale, half_t):
+    """
+    GB 侧视图各圈前/后半圈 Z 坐标 (已乘 scale)，shape (n_coils, 2, 点数)
+    Numba 可用时走 JIT 内核，否则按圈向量化
+    """
+    if NUMBA_AVAILABLE:
+        return sample_gb_coil_z(n_coils, float(Na), float(dead_coils_per_end), float(pitch_dead),
+                                float(pitch_active), half_t, float(scale))
+    
+    coil = np.arange(n_coils)
+    bottom = coil < dead_coils_per_end
+    active = ~bottom & (coil < dead_coils_per_end + Na)
+    
+    # 底部死圈 / 有效圈 / 顶部死圈 的起始高度与节距
+    z_start = np.where(
+        bottom, coil * pitch_dead,
+        np.where(
+            active,
+            dead_coils_per_end * pitch_dead + (coil - dead_coils_per_end) * pitch_active,
+            dead_coils_per_end * pitch_dead + Na * pitch_active + (coil - dead_coils_per_end - Na) * pitch_dead
+        )
+    )[:, None]
+    current_pitch = np.where(active, pitch_active, pitch_dead)[:, None]
+    
+    dz = half_t * current_pitch / 2
+    out = np.empty((n_coils, 2, half_t.shape[0]))
+    out[:, 0] = (z_start + dz) * scale
+    out[:, 1] = (z_start + current_pitch / 2 + dz) * scale
+    return out
+
+
 def generate_gb_spring_svg(Nt, Na, d, Dm, L0, scale):
     """
     生成标准弹簧侧视图 SVG - 工程图标准画法
     每圈画两条线：外轮廓线和内轮廓线，形成 X 交叉
     """
-    import math
-    
     R = Dm / 2.0  # 中径半径
     r = d / 2.0   # 线材半径
     OD = Dm + d   # 外径
@@ -2894,96 +3591,302 @@ def generate_gb_spring_svg(Nt, Na, d, Dm, L0, scale):
     paths = []
     
     # 中心线 (长点划线)
-    paths.append(f'    <line x1="0" y1="-8" x2="0" y2="{L0 * scale + 8}" class="centerline"/>')
+    paths.append(f'    <line x1="0" y1="-8" x2="0" y2="{f2(L0 * scale + 8)}" class="centerline"/>')
     
     # 每圈绘制：从左到右的斜线 + 从右到左的斜线，形成 X
     # 标准画法：每半圈画一条线
     
-    points_per_half = 20  # 每半圈的点数
-    
-    for coil in range(int(Nt)):
-        # 计算这一圈的起始和结束高度
-        if coil < dead_coils_per_end:
-            # 底部死圈
-            z_start = coil * pitch_dead
-            z_end = (coil + 1) * pitch_dead
-            current_pitch = pitch_dead
-        elif coil < dead_coils_per_end + Na:
-            # 有效圈
-            coil_in_active = coil - dead_coils_per_end
-            z_start = dead_coils_per_end * pitch_dead + coil_in_active * pitch_active
-            z_end = dead_coils_per_end * pitch_dead + (coil_in_active + 1) * pitch_active
-            current_pitch = pitch_active
-        else:
-            # 顶部死圈
-            coil_in_top = coil - dead_coils_per_end - Na
-            z_start = dead_coils_per_end * pitch_dead + Na * pitch_active + coil_in_top * pitch_dead
-            z_end = dead_coils_per_end * pitch_dead + Na * pitch_active + (coil_in_top + 1) * pitch_dead
-            current_pitch = pitch_dead
-        
-        # 前半圈 (0 到 π): 从右到左，外轮廓实线
-        front_outer_points = []
-        front_inner_points = []
-        for i in range(points_per_half + 1):
-            t = i / points_per_half  # 0 到 1
-            theta = t * math.pi  # 0 到 π
-            z = z_start + t * current_pitch / 2
-            
-            # 外轮廓 (线材外边缘)
-            x_outer = (R + r) * math.cos(theta)
-            front_outer_points.append((x_outer * scale, z * scale))
-            
-            # 内轮廓 (线材内边缘)
-            x_inner = (R - r) * math.cos(theta)
-            front_inner_points.append((x_inner * scale, z * scale))
-        
-        # 后半圈 (π 到 2π): 从左到右，外轮廓虚线
-        back_outer_points = []
-        back_inner_points = []
-        for i in range(points_per_half + 1):
-            t = i / points_per_half  # 0 到 1
-            theta = math.pi + t * math.pi  # π 到 2π
-            z = z_start + current_pitch / 2 + t * current_pitch / 2
-            
-            # 外轮廓
-            x_outer = (R + r) * math.cos(theta)
-            back_outer_points.append((x_outer * scale, z * scale))
-            
-            # 内轮廓
-            x_inner = (R - r) * math.cos(theta)
-            back_inner_points.append((x_inner * scale, z * scale))
-        
-        # 绘制前半圈 - 实线
-        if len(front_outer_points) > 1:
-            pts = ' '.join([f'{p[0]:.2f},{p[1]:.2f}' for p in front_outer_points])
-            paths.append(f'    <polyline points="{pts}" class="medium" fill="none"/>')
-        if len(front_inner_points) > 1:
-            pts = ' '.join([f'{p[0]:.2f},{p[1]:.2f}' for p in front_inner_points])
-            paths.append(f'    <polyline points="{pts}" class="medium" fill="none"/>')
+    # 半圈采样段数随图面尺寸自适应; t 与 cos 表按段数缓存，各圈共用
+    points_per_half = gb_points_per_half(R, r, scale)
+    half_t, cos_front, cos_back = _gb_half_tables(points_per_half)
+    x_front_outer = _svg_points_x((R + r) * cos_front * scale)
+    x_front_inner = _svg_points_x((R - r) * cos_front * scale)
+    x_back_outer = _svg_points_x((R + r) * cos_back * scale)
+    x_back_inner = _svg_points_x((R - r) * cos_back * scale)
+    
+    # 各圈前/后半圈 Z 坐标一次算出
+    coil_z = gb_coil_z(int(Nt), Na, dead_coils_per_end, pitch_dead, pitch_active, scale, half_t)
+    
+    for z_front, z_back in coil_z:
+        # 绘制前半圈 - 实线 (外轮廓 / 内轮廓)
+        paths.append(f'    <polyline points="{_svg_points(x_front_outer, z_front)}" class="medium" fill="none"/>')
+        paths.append(f'    <polyline points="{_svg_points(x_front_inner, z_front)}" class="medium" fill="none"/>')
         
         # 绘制后半圈 - 虚线
-        if len(back_outer_points) > 1:
-            pts = ' '.join([f'{p[0]:.2f},{p[1]:.2f}' for p in back_outer_points])
-            paths.append(f'    <polyline points="{pts}" class="hidden" fill="none"/>')
-        if len(back_inner_points) > 1:
-            pts = ' '.join([f'{p[0]:.2f},{p[1]:.2f}' for p in back_inner_points])
-            paths.append(f'    <polyline points="{pts}" class="hidden" fill="none"/>')
+        paths.append(f'    <polyline points="{_svg_points(x_back_outer, z_back)}" class="hidden" fill="none"/>')
+        paths.append(f'    <polyline points="{_svg_points(x_back_inner, z_back)}" class="hidden" fill="none"/>')
     
     # 顶部和底部端面线
-    paths.append(f'    <line x1="{-OD/2 * scale}" y1="0" x2="{OD/2 * scale}" y2="0" class="medium"/>')
-    paths.append(f'    <line x1="{-OD/2 * scale}" y1="{L0 * scale}" x2="{OD/2 * scale}" y2="{L0 * scale}" class="medium"/>')
+    paths.append(f'    <line x1="{f2(-OD/2 * scale)}" y1="0" x2="{f2(OD/2 * scale)}" y2="0" class="medium"/>')
+    paths.append(f'    <line x1="{f2(-OD/2 * scale)}" y1="{f2(L0 * scale)}" x2="{f2(OD/2 * scale)}" y2="{f2(L0 * scale)}" class="medium"/>')
     
     # 两端线材截面圆
     # 底部
-    paths.append(f'    <circle cx="{-R * scale}" cy="{r * scale}" r="{r * scale}" class="medium"/>')
-    paths.append(f'    <circle cx="{R * scale}" cy="{r * scale}" r="{r * scale}" class="medium"/>')
+    paths.append(f'    <circle cx="{f2(-R * scale)}" cy="{f2(r * scale)}" r="{f2(r * scale)}" class="medium"/>')
+    paths.append(f'    <circle cx="{f2(R * scale)}" cy="{f2(r * scale)}" r="{f2(r * scale)}" class="medium"/>')
     # 顶部
-    paths.append(f'    <circle cx="{-R * scale}" cy="{(L0 - r) * scale}" r="{r * scale}" class="medium"/>')
-    paths.append(f'    <circle cx="{R * scale}" cy="{(L0 - r) * scale}" r="{r * scale}" class="medium"/>')
+    paths.append(f'    <circle cx="{f2(-R * scale)}" cy="{f2((L0 - r) * scale)}" r="{f2(r * scale)}" class="medium"/>')
+    paths.append(f'    <circle cx="{f2(R * scale)}" cy="{f2((L0 - r) * scale)}" r="{f2(r * scale)}" class="medium"/>')
     
     return '\n'.join(paths)
 
 
+# =============================================================================
+# 导出
+# =============================================================================
+
+# STL 网格精度档位: (LinearDeflection mm, AngularDeflection rad)
+# LinearDeflection: 控制沿路径平滑度, 越小越顺
+# AngularDeflection: 控制圆截面多边形感, 0.14 rad ≈ 8° ≈ 45 边非常圆
+# 三角形数量约与 1/LinearDeflection² 成正比
+STL_QUALITY_PRESETS = {
+    "preview": (0.5, 0.5),
+    "normal": (0.1, 0.3),
+    "fine": (0.01, 0.14),   # 原高精度预览参数
+}
+
+
+def _export_part(doc, spring_obj, filepath, opts):
+    """STEP / IGES: 由 Part.export 按扩展名选择格式"""
+    Part.export([spring_obj], filepath)
+    print(f"Exported: {filepath}")
+    return filepath
+
+
+def _export_stl(doc, spring_obj, filepath, opts):
+    """STL: MeshPart 网格化，失败时回退 tessellate / exportStl"""
+    import time
+    stl_start = time.time()
+    stl_quality = opts["stl_quality"]
+    
+    # 使用 Mesh 模块导出，可以控制精度
+    try:
+        import Mesh
+        # 网格精度按 stl_quality 档位选取 (见 STL_QUALITY_PRESETS)
+        linear_deflection, angular_deflection = STL_QUALITY_PRESETS.get(
+            stl_quality, STL_QUALITY_PRESETS["normal"])
+        
+        shape = spring_obj.Shape
+        mesh = None
+        
+        # 使用 MeshPart 进行更好的控制（弹簧专用设置）
+        # 失败时放宽到 10 倍弦高再试一次，仍是一次 C++ 批量网格化
+        try:
+            import MeshPart
+            for deflection in (linear_deflection, linear_deflection * 10):
+                try:
+                    mesh = MeshPart.meshFromShape(
+                        Shape=shape,
+                        LinearDeflection=deflection,
+                        AngularDeflection=angular_deflection,
+                        Relative=False  # 绝对值更可控，适用于弹簧这种高曲率物体
+                    )
+                    break
+                except Exception as e:
+                    print(f"MeshPart failed (LinearDeflection={deflection}): {e}")
+        except ImportError:
+            pass
+        
+        if mesh is None:
+            # 备用：直接 tessellate，三角形列表一次性交给 Mesh.Mesh 构造 (不逐个 addFacet)
+            vertices, facets = shape.tessellate(linear_deflection)
+            mesh = Mesh.Mesh([(vertices[a], vertices[b], vertices[c]) for a, b, c in facets])
+        
+        mesh.write(filepath)
+        stl_time = time.time() - stl_start
+        file_size = os.path.getsize(filepath)
+        print(f"Exported STL ({stl_quality}, {mesh.CountFacets} facets, {file_size/1024/1024:.1f}MB, {stl_time:.1f}s): {filepath}")
+        return filepath
+    except Exception as e:
+        print(f"Mesh export failed: {e}, trying exportStl")
+        try:
+            spring_obj.Shape.exportStl(filepath)
+            stl_time = time.time() - stl_start
+            file_size = os.path.getsize(filepath)
+            print(f"Exported STL (fallback, {file_size/1024/1024:.1f}MB, {stl_time:.1f}s): {filepath}")
+            return filepath
+        except Exception as e2:
+            print(f"exportStl also failed: {e2}")
+    return None
+
+
+def _export_fcstd(doc, spring_obj, filepath, opts):
+    """FreeCAD 原生文档"""
+    doc.saveAs(filepath)
+    print(f"Exported: {filepath}")
+    return filepath
+
+
+def _export_drawing(doc, spring_obj, filepath, opts):
+    """PDF / SVG: 使用 TechDraw 生成 2D 工程图"""
+    try:
+        drawing_params = opts["drawing_params"]
+        if drawing_params is None:
+            drawing_params = DrawingParams.from_geometry(opts["geometry"], opts["spring_type"])
+        drawing_file = generate_techdraw(doc, spring_obj, opts["geometry"], opts["spring_type"], filepath,
+                                         opts["fmt"], params=drawing_params)
+        if drawing_file:
+            print(f"Exported TechDraw: {drawing_file}")
+        return drawing_file
+    except Exception as e:
+        print(f"TechDraw export failed: {e}")
+    return None
+
+
+# 格式注册表: 格式名 (大写) -> (文件扩展名, 导出函数)
+# 导出函数签名统一为 (doc, spring_obj, filepath, opts)，返回生成的文件路径或 None
+_EXPORTERS = {
+    "STEP": ("step", _export_part),
+    "IGES": ("iges", _export_part),
+    "STL": ("stl", _export_stl),
+    "FCSTD": ("FCStd", _export_fcstd),
+    "PDF": ("pdf", _export_drawing),
+    "SVG": ("svg", _export_drawing),
+}
+
+
+def export_format(doc, spring_obj, fmt, output_dir, export_name, spring_type, geometry,
+                  drawing_params=None, stl_quality="normal"):
+    """
+    导出单一格式 (按 _EXPORTERS 注册表分派)
+    stl_quality: STL 网格精度档位 ("preview" / "normal" / "fine")
+    返回: 生成的文件路径列表 (失败或格式不支持时为空)
+    """
+    fmt_upper = fmt.upper()
+    entry = _EXPORTERS.get(fmt_upper)
+    if entry is None:
+        print(f"Unsupported export format: {fmt}")
+        return []
+    
+    ext, exporter = entry
+    filepath = os.path.join(output_dir, f"{export_name}.{ext}")
+    opts = {
+        "fmt": fmt_upper,
+        "spring_type": spring_type,
+        "geometry": geometry,
+        "drawing_params": drawing_params,
+        "stl_quality": stl_quality,
+    }
+    path = exporter(doc, spring_obj, filepath, opts)
+    return [path] if path else []
+
+
+def _export_format_worker(brep, fmt, output_dir, export_name, spring_type, geometry, drawing_params,
+                          stl_quality):
+    """
+    进程池任务: 从 BREP 字符串重建实体后导出单一格式
+    每个子进程使用独立的 FreeCAD 文档，互不共享状态
+    """
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    doc = App.newDocument(f"Spring_{fmt.upper()}")
+    spring_obj = doc.addObject("Part::Feature", "Spring")
+    spring_obj.Shape = shape
+    doc.recompute()
+    return export_format(doc, spring_obj, fmt, output_dir, export_name, spring_type, geometry,
+                         drawing_params, stl_quality)
+
+
+def export_formats_parallel(spring_obj, export_formats, output_dir, export_name, spring_type,
+                            geometry, drawing_params, stl_quality):
+    """
+    各格式输出文件相互独立: 实体序列化为 BREP 后分发到进程池并行导出
+    仅在支持 fork 的平台启用 (spawn 需重新导入 FreeCAD，开销抵消收益)
+    PDF / SVG 写入同一个 {name}.svg (generate_techdraw)，合并为一个图纸任务，
+    避免两个子进程同时截断写同一文件
+    返回: 按 export_formats 顺序排列的文件路径列表；不可用或失败时返回 None，由调用方顺序导出
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if "fork" not in multiprocessing.get_all_start_methods():
+        print("Parallel export unavailable (no fork start method), exporting sequentially")
+        return None
+    
+    try:
+        # 任务键: 图纸类格式共用 "DRAWING"，其余按格式名去重
+        job_keys = ["DRAWING" if fmt.upper() in ("PDF", "SVG") else fmt.upper() for fmt in export_formats]
+        jobs = {}  # 任务键 -> 首个请求该任务的格式
+        for key, fmt in zip(job_keys, export_formats):
+            jobs.setdefault(key, fmt)
+        
+        brep = spring_obj.Shape.exportBrepToString()
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("fork")) as pool:
+            futures = {
+                key: pool.submit(_export_format_worker, brep, fmt, output_dir, export_name,
+                                 spring_type, geometry, drawing_params, stl_quality)
+                for key, fmt in jobs.items()
+            }
+            # 与顺序导出一致: 每个请求的格式各对应一份结果 (PDF / SVG 共享同一文件路径)
+            return [path for key in job_keys for path in futures[key].result()]
+    except Exception as e:
+        print(f"Parallel export failed: {e}, exporting sequentially")
+        return None
+
+
+# =============================================================================
+# 批量生成 (参数扫描 / 目录生成)
+# =============================================================================
+
+# 可批量生成的弹簧类型 → 构建函数 (均为模块级函数，可被子进程直接调用)
+# 弧形弹簧需要 FreeCAD 文档参与构建，不在此列
+SPRING_BUILDERS = {
+    "compression": make_compression_spring,
+    "extension": make_extension_spring,
+    "torsion": make_torsion_spring,
+    "spiral_torsion": make_spiral_torsion_spring,
+    "conical": make_conical_spring,
+    "variable_pitch_compression": make_variable_pitch_compression_spring,
+    "suspension_spring": make_suspension_spring,
+}
+
+
+def _generate_spring_worker(spring_type, geometry):
+    """
+    进程池任务: 生成单个弹簧实体并序列化为 BREP 字符串
+    (Part.Shape 不保证可 pickle，与 _export_format_worker 相同走 BREP 传输)
+    """
+    return SPRING_BUILDERS[spring_type](geometry).exportBrepToString()
+
+
+def batch_generate(spring_type, params_list, workers=None):
+    """
+    批量生成同一类型、不同参数的弹簧实体 (灵敏度分析 / 目录生成)
+    
+    各组参数的扫掠 (OCCT) 相互独立且 CPU 密集: 分发到进程池并行生成，
+    子进程返回 BREP 字符串，主进程重建 Part.Shape。
+    仅在支持 fork 的平台启用，否则或并行失败时顺序生成。
+    单个弹簧的交互式生成 (main) 仍为同步调用。
+    
+    返回: 按 params_list 顺序排列的 Part.Shape 列表
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    builder = SPRING_BUILDERS[spring_type]
+    params_list = list(params_list)
+    max_workers = min(len(params_list), workers or os.cpu_count() or 1)
+    
+    if max_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("fork")) as pool:
+                breps = list(pool.map(_generate_spring_worker,
+                                      [spring_type] * len(params_list), params_list))
+            shapes = []
+            for brep in breps:
+                shape = Part.Shape()
+                shape.importBrepFromString(brep)
+                shapes.append(shape)
+            return shapes
+        except Exception as e:
+            print(f"Parallel batch generation failed: {e}, generating sequentially")
+    
+    return [builder(params) for params in params_list]
+
+
 # =============================================================================
 # 主函数
 # =============================================================================
@@ -3016,6 +3919,7 @@ def main():
     
     export_formats = export_config.get("formats", ["STEP"])
     export_name = export_config.get("name", f"{spring_type}_spring")
+    stl_quality = export_config.get("stlQuality", "normal")
     
     print(f"=== Spring Export ===")
     print(f"Type: {spring_type}")
@@ -3060,88 +3964,24 @@ def main():
     
     # 导出
     output_files = []
-    
-    for fmt in export_formats:
-        fmt_upper = fmt.upper()
-        
-        if fmt_upper == "STEP":
-            filepath = os.path.join(output_dir, f"{export_name}.step")
-            Part.export([spring_obj], filepath)
-            output_files.append(filepath)
-            print(f"Exported: {filepath}")
-            
-        elif fmt_upper == "IGES":
-            filepath = os.path.join(output_dir, f"{export_name}.iges")
-            Part.export([spring_obj], filepath)
-            output_files.append(filepath)
-            print(f"Exported: {filepath}")
-            
-        elif fmt_upper == "STL":
-            filepath = os.path.join(output_dir, f"{export_name}.stl")
-            import time
-            stl_start = time.time()
-            
-            # 使用 Mesh 模块导出，可以控制精度
-            try:
-                import Mesh
-                # 预览用高精度（弹簧专用参数 - 追求视觉平滑）
-                # LinearDeflection: 控制沿路径平滑度, 越小越顺 (mm)
-                # AngularDeflection: 控制圆截面多边形感, 8°≈45边非常圆 (degrees)
-                linear_deflection = 0.01  # mm - 高精度预览
-                angular_deflection = 0.14  # radians ≈ 8° - 极圆
-                
-                # 创建 mesh 并导出
-                mesh = Mesh.Mesh()
-                shape = spring_obj.Shape
-                
-                # 使用 MeshPart 进行更好的控制（弹簧专用设置）
-                try:
-                    import MeshPart
-                    mesh = MeshPart.meshFromShape(
-                        Shape=shape,
-                        LinearDeflection=linear_deflection,
-                        AngularDeflection=angular_deflection,
-                        Relative=False  # 绝对值更可控，适用于弹簧这种高曲率物体
-                    )
-
-                except:
-                    # 备用：直接 tessellate
-                    vertices, facets = shape.tessellate(linear_deflection)
-                    for facet in facets:
-                        mesh.addFacet(vertices[facet[0]], vertices[facet[1]], vertices[facet[2]])
-                
-                mesh.write(filepath)
-                stl_time = time.time() - stl_start
-                file_size = os.path.getsize(filepath)
-                print(f"Exported STL ({file_size/1024/1024:.1f}MB, {stl_time:.1f}s): {filepath}")
-                output_files.append(filepath)
-            except Exception as e:
-                print(f"Mesh export failed: {e}, trying exportStl")
-                try:
-                    spring_obj.Shape.exportStl(filepath)
-                    stl_time = time.time() - stl_start
-                    file_size = os.path.getsize(filepath)
-                    print(f"Exported STL (fallback, {file_size/1024/1024:.1f}MB, {stl_time:.1f}s): {filepath}")
-                    output_files.append(filepath)
-                except Exception as e2:
-                    print(f"exportStl also failed: {e2}")
-            
-        elif fmt_upper == "FCSTD":
-            filepath = os.path.join(output_dir, f"{export_name}.FCStd")
-            doc.saveAs(filepath)
-            output_files.append(filepath)
-            print(f"Exported: {filepath}")
-            
-        elif fmt_upper == "PDF" or fmt_upper == "SVG":
-            # 使用 TechDraw 生成 2D 工程图
-            filepath = os.path.join(output_dir, f"{export_name}.{fmt.lower()}")
-            try:
-                drawing_file = generate_techdraw(doc, spring_obj, geometry, spring_type, filepath, fmt_upper)
-                if drawing_file:
-                    output_files.append(drawing_file)
-                    print(f"Exported TechDraw: {drawing_file}")
-            except Exception as e:
-                print(f"TechDraw export failed: {e}")
+    drawing_params = None  # PDF / SVG 共用，首次用到时解析
+    
+    # 多格式时可选并行导出 (export.parallel)，不可用或失败时回退到顺序导出
+    parallel_files = None
+    if export_config.get("parallel", False) and len(export_formats) > 1:
+        if any(fmt.upper() in ("PDF", "SVG") for fmt in export_formats):
+            drawing_params = DrawingParams.from_geometry(geometry, spring_type)
+        parallel_files = export_formats_parallel(spring_obj, export_formats, output_dir, export_name,
+                                                 spring_type, geometry, drawing_params, stl_quality)
+    
+    if parallel_files is not None:
+        output_files = parallel_files
+    else:
+        for fmt in export_formats:
+            if fmt.upper() in ("PDF", "SVG") and drawing_params is None:
+                drawing_params = DrawingParams.from_geometry(geometry, spring_type)
+            output_files.extend(export_format(doc, spring_obj, fmt, output_dir, export_name, spring_type,
+                                              geometry, drawing_params, stl_quality))
     
     print("=== Export Complete ===")
     
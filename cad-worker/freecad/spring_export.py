@@ -32,6 +32,7 @@ Windows 安装:
 
 import FreeCAD as App
 import Part
+import functools
 import math
 import json
 import sys
@@ -72,25 +73,61 @@ def helix_point_and_tangent(t, R, L, turns, left_handed=False):
     return App.Vector(x, y, z), tan
 
 
-def cubic_bezier(p0, p1, p2, p3, t):
-    """三次贝塞尔曲线"""
-    omt = 1.0 - t
-    return (p0 * (omt * omt * omt) +
-            p1 * (3 * omt * omt * t) +
-            p2 * (3 * omt * t * t) +
-            p3 * (t * t * t))
+@functools.lru_cache(maxsize=16)
+def arc_cos_sin(segments, start_angle, total_angle):
+    """
+    圆弧采样角的 (cos θ, sin θ) 表，θ = start_angle + total_angle * i / segments
+    只依赖 (段数, 起始角, 总弧度)，上下两个钩弧及重复导出共用同一张表
+    """
+    table = []
+    for i in range(segments + 1):
+        t = float(i) / segments
+        theta = start_angle + total_angle * t
+        table.append((math.cos(theta), math.sin(theta)))
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=8)
+def bernstein_table(samples):
+    """
+    三次 Bernstein 权重表，t = i / samples, i = 0..samples
+    返回: ((b0, b1, b2, b3), ...) 元组，按段数缓存
+    """
+    table = []
+    for i in range(samples + 1):
+        t = float(i) / samples
+        omt = 1.0 - t
+        table.append((omt * omt * omt, 3 * omt * omt * t, 3 * omt * t * t, t * t * t))
+    return tuple(table)
+
+
+def bezier_points(p0, p1, p2, p3, samples):
+    """
+    三次贝塞尔曲线批量采样 (samples+1 个点)
+    控制点坐标只取一次，按权重表做标量运算，每个点只构造一个 App.Vector，
+    不再逐点做 7 次 App.Vector 运算
+    """
+    x0, y0, z0 = p0.x, p0.y, p0.z
+    x1, y1, z1 = p1.x, p1.y, p1.z
+    x2, y2, z2 = p2.x, p2.y, p2.z
+    x3, y3, z3 = p3.x, p3.y, p3.z
+    return [
+        App.Vector(b0 * x0 + b1 * x1 + b2 * x2 + b3 * x3,
+                   b0 * y0 + b1 * y1 + b2 * y2 + b3 * y3,
+                   b0 * z0 + b1 * z1 + b2 * z2 + b3 * z3)
+        for b0, b1, b2, b3 in bernstein_table(samples)
+    ]
 
 
 def clamp_radius_min(p, min_r):
     """防止凹进：如果半径 < min_r，就投影到 min_r"""
-    r_vec = App.Vector(p.x, p.y, 0)
-    r_len = r_vec.Length
-    if r_len < 1e-8:
+    # 先比较半径平方，绝大多数点无需钳制，可跳过 sqrt 和临时 App.Vector
+    x, y = p.x, p.y
+    r2 = x * x + y * y
+    if r2 < 1e-16 or r2 >= min_r * min_r:
         return p
-    if r_len < min_r:
-        r_vec.normalize()
-        return App.Vector(r_vec.x * min_r, r_vec.y * min_r, p.z)
-    return p
+    scale = min_r / math.sqrt(r2)
+    return App.Vector(x * scale, y * scale, p.z)
 
 
 def make_bspline_from_points(points):
@@ -234,23 +271,18 @@ def make_extension_spring(params):
     # 钩圆心
     hook_center = App.Vector(0, 0, end_pos.z + hook_gap)
     
-    # 钩平面基底
+    # 钩平面基底 (radial ⊥ axis 且均为单位向量，叉积无需再归一化)
     axis_dir = App.Vector(0, 0, 1)
     u = axis_dir
     v = radial_dir.cross(u)
-    v.normalize()
     
     # 钩弧点
     arc_start_angle = -math.pi * 0.5
     arc_total_angle = math.radians(hook_angle)
-    hook_arc_pts = []
-    for i in range(samples_arc + 1):
-        t = float(i) / samples_arc
-        theta = arc_start_angle + arc_total_angle * t
-        c = math.cos(theta)
-        s = math.sin(theta)
-        p = hook_center + u * (hook_radius * c) + v * (hook_radius * s)
-        hook_arc_pts.append(p)
+    arc_table = arc_cos_sin(samples_arc, arc_start_angle, arc_total_angle)
+    uR = u * hook_radius
+    vR = v * hook_radius
+    hook_arc_pts = [hook_center + uR * c + vR * s for c, s in arc_table]
     
     hook_attach = hook_arc_pts[0]
     
@@ -269,12 +301,8 @@ def make_extension_spring(params):
     ctrl1 = segA_end + end_tan * (d * 0.7) + radial_dir * (d * 0.3) + axis_dir * (d * 0.3)
     ctrl2 = hook_attach + axis_dir * (-d * 0.4)
     
-    segB_pts = []
-    for i in range(samples_bezier + 1):
-        t = float(i) / samples_bezier
-        p = cubic_bezier(segA_end, ctrl1, ctrl2, hook_attach, t)
-        p = clamp_radius_min(p, R)
-        segB_pts.append(p)
+    segB_pts = [clamp_radius_min(p, R)
+                for p in bezier_points(segA_end, ctrl1, ctrl2, hook_attach, samples_bezier)]
     
     # 3) 底部钩 (Start Hook) - 镜像
     bottom_hook_center = App.Vector(0, 0, start_pos.z - hook_gap)
@@ -285,17 +313,11 @@ def make_extension_spring(params):
     bottom_radial.normalize()
     
     bottom_u = App.Vector(0, 0, -1)  # 向下
-    bottom_v = bottom_radial.cross(bottom_u)
-    bottom_v.normalize()
-    
-    bottom_arc_pts = []
-    for i in range(samples_arc + 1):
-        t = float(i) / samples_arc
-        theta = arc_start_angle + arc_total_angle * t
-        c = math.cos(theta)
-        s = math.sin(theta)
-        p = bottom_hook_center + bottom_u * (hook_radius * c) + bottom_v * (hook_radius * s)
-        bottom_arc_pts.append(p)
+    bottom_v = bottom_radial.cross(bottom_u)  # 单位向量叉积，已归一化
+    
+    bottom_uR = bottom_u * hook_radius
+    bottom_vR = bottom_v * hook_radius
+    bottom_arc_pts = [bottom_hook_center + bottom_uR * c + bottom_vR * s for c, s in arc_table]
     
     bottom_hook_attach = bottom_arc_pts[0]
     
@@ -311,12 +333,9 @@ def make_extension_spring(params):
     bottom_ctrl1 = bottom_segA_end - start_tan * (d * 0.7) + bottom_radial * (d * 0.3) - axis_dir * (d * 0.3)
     bottom_ctrl2 = bottom_hook_attach - axis_dir * (d * 0.4)
     
-    bottom_segB_pts = []
-    for i in range(samples_bezier + 1):
-        t = float(i) / samples_bezier
-        p = cubic_bezier(bottom_segA_end, bottom_ctrl1, bottom_ctrl2, bottom_hook_attach, t)
-        p = clamp_radius_min(p, R)
-        bottom_segB_pts.append(p)
+    bottom_segB_pts = [clamp_radius_min(p, R)
+                       for p in bezier_points(bottom_segA_end, bottom_ctrl1, bottom_ctrl2,
+                                              bottom_hook_attach, samples_bezier)]
     
     # 4) 合并中心线
     # 底部钩 (反向) + 螺旋体 + 顶部过渡 + 顶部钩
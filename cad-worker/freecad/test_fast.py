@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数值内核一致性测试
+
+运行: cd cad-worker/freecad && python -m pytest -q test_fast.py
+
+- _fast 各 Numba 内核 vs 原始逐点标量公式: 只依赖 numpy
+  (安装 numba 时同时测试编译版本与 .py_func 纯 Python 版本)
+- run_export / hook_builder 的 NumPy 回退路径 vs 内核 / 原始公式:
+  需要 FreeCAD 模块，不可用时跳过
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import _fast
+import hook_builder
+
+
+def _variants(kernel):
+    """内核本身 + (numba 编译时) 其纯 Python 版本"""
+    fns = [kernel]
+    if hasattr(kernel, "py_func"):
+        fns.append(kernel.py_func)
+    return fns
+
+
+def _kernel_params(kernel):
+    return pytest.mark.parametrize(
+        "fn", _variants(kernel), ids=lambda fn: "py_func" if fn is getattr(kernel, "py_func", None) else "kernel"
+    )
+
+
+@pytest.fixture
+def run_export():
+    """run_export 在缺少 FreeCAD 时直接 sys.exit，需先确认 FreeCAD 可导入"""
+    pytest.importorskip("FreeCAD")
+    import run_export as module
+    return module
+
+
+# =============================================================================
+# 原始标量公式 (逐点循环，作为参考实现)
+# =============================================================================
+
+def _ref_smoothstep01(x):
+    t = max(0, min(1, x))
+    return t * t * (3 - 2 * t)
+
+
+def _ref_compression(total_coils, active_coils, mean_diameter, wire_diameter, free_length,
+                     current_deflection, num_samples):
+    """压缩弹簧中心线: 死圈 + 有效圈 + 死圈 的分段 Z"""
+    dead_coils = total_coils - active_coils
+    dead_coils_per_end = dead_coils / 2.0
+    R = mean_diameter / 2.0
+    d = wire_diameter
+    pitch_dead = d
+    Hb = free_length - dead_coils * pitch_dead
+    Hb_compressed = max(Hb - current_deflection, active_coils * pitch_dead)
+    pitch_active = Hb_compressed / active_coils if active_coils > 0 else d
+    total_angle = 2.0 * math.pi * total_coils
+    
+    pts = []
+    for i in range(num_samples + 1):
+        theta = i / num_samples * total_angle
+        n = theta / (2.0 * math.pi)
+        if n <= dead_coils_per_end:
+            z = pitch_dead * n
+        elif n >= total_coils - dead_coils_per_end:
+            z = dead_coils_per_end * pitch_dead + Hb_compressed + (n - (total_coils - dead_coils_per_end)) * pitch_dead
+        else:
+            z = dead_coils_per_end * pitch_dead + pitch_active * (n - dead_coils_per_end)
+        pts.append((R * math.cos(theta), R * math.sin(theta), z))
+    
+    args = (num_samples, total_angle, R, dead_coils_per_end, total_coils,
+            pitch_dead, pitch_active, Hb_compressed)
+    return np.array(pts), args
+
+
+def _ref_suspension_z(num_segs, d_theta, theta_total, theta_closed, theta_ground, theta_trans,
+                      pitch_active, p_center, p_end, has_closed, is_uniform):
+    """悬架弹簧 Z: 逐段节距积分 + 两端磨平压平"""
+    def w_pitch(theta):
+        if theta_closed <= 0:
+            return 1
+        if theta < theta_closed:
+            return _ref_smoothstep01(theta / theta_closed)
+        if theta > theta_total - theta_closed:
+            return _ref_smoothstep01((theta_total - theta) / theta_closed)
+        return 1
+    
+    def ground_weight(theta):
+        if theta < theta_ground:
+            return _ref_smoothstep01(1 - theta / theta_ground)
+        if theta > theta_total - theta_ground:
+            return _ref_smoothstep01(1 - (theta_total - theta) / theta_ground)
+        return 0
+    
+    z_raw = [0.0]
+    z_current = 0.0
+    for i in range(1, num_segs + 1):
+        theta_mid = (i - 0.5) * d_theta
+        if not has_closed:
+            p = pitch_active if is_uniform else p_center
+        elif is_uniform:
+            p = pitch_active * w_pitch(theta_mid)
+        elif theta_mid < theta_closed:
+            p = p_end
+        elif theta_mid < theta_closed + theta_trans:
+            p = p_end + (p_center - p_end) * _ref_smoothstep01((theta_mid - theta_closed) / theta_trans)
+        elif theta_mid > theta_total - (theta_closed + theta_trans):
+            if theta_mid < theta_total - theta_closed:
+                u = _ref_smoothstep01((theta_total - theta_closed - theta_mid) / theta_trans)
+                p = p_end + (p_center - p_end) * u
+            else:
+                p = p_end
+        else:
+            p = p_center
+        z_current += (p / (2.0 * math.pi)) * d_theta
+        z_raw.append(z_current)
+    
+    z_end = z_raw[-1]
+    z = []
+    for i in range(num_segs + 1):
+        theta = i * d_theta
+        zi = z_raw[i]
+        if theta_ground > 0:
+            wg = ground_weight(theta)
+            if theta < theta_ground:
+                zi = zi * (1.0 - wg)
+            elif theta > theta_total - theta_ground:
+                zi = z_end - (z_end - zi) * (1.0 - wg)
+        z.append(zi)
+    return np.array(z)
+
+
+def _ref_gb_coil_z(n_coils, Na, dead_coils_per_end, pitch_dead, pitch_active, half_t, scale):
+    """GB 侧视图每圈前/后半圈 Z"""
+    out = np.empty((n_coils, 2, len(half_t)))
+    for coil in range(n_coils):
+        if coil < dead_coils_per_end:
+            z_start = coil * pitch_dead
+            current_pitch = pitch_dead
+        elif coil < dead_coils_per_end + Na:
+            z_start = dead_coils_per_end * pitch_dead + (coil - dead_coils_per_end) * pitch_active
+            current_pitch = pitch_active
+        else:
+            coil_in_top = coil - dead_coils_per_end - Na
+            z_start = dead_coils_per_end * pitch_dead + Na * pitch_active + coil_in_top * pitch_dead
+            current_pitch = pitch_dead
+        for i, t in enumerate(half_t):
+            out[coil, 0, i] = (z_start + t * current_pitch / 2) * scale
+            out[coil, 1, i] = (z_start + current_pitch / 2 + t * current_pitch / 2) * scale
+    return out
+
+
+# (totalCoils, activeCoils, meanDiameter, wireDiameter, freeLength, currentDeflection, numSamples)
+COMPRESSION_CASES = [
+    (10, 8, 24.0, 3.2, 50.0, 0.0, 800),
+    (7.5, 5.5, 18.0, 2.0, 40.0, 6.0, 240),
+    (6, 6, 30.0, 4.0, 60.0, 0.0, 192),      # 无死圈
+    (12, 8, 20.0, 2.5, 30.0, 50.0, 384),    # 压并 (Hb_compressed 取下限)
+]
+
+# (has_closed, is_uniform, theta_ground>0, theta_trans)
+SUSPENSION_CASES = [
+    (has_closed, is_uniform, ground, trans)
+    for has_closed in (True, False)
+    for is_uniform in (True, False)
+    for ground in (True, False)
+    for trans in (0.75, 0.0)
+    if has_closed or not ground
+]
+
+
+def _suspension_args(has_closed, is_uniform, ground, trans_turns, Nt=8.0):
+    num_segs = int(Nt * 80)
+    theta_total = 2.0 * math.pi * Nt
+    return (
+        num_segs, theta_total / num_segs, theta_total,
+        2.0 * math.pi * 1.0 if has_closed else 0.0,
+        2.0 * math.pi * 0.5 if ground else 0.0,
+        2.0 * math.pi * trans_turns,
+        41.5, 45.0, 45.0 * 0.15, has_closed, is_uniform,
+    )
+
+
+# =============================================================================
+# _fast 内核 vs 原始标量公式
+# =============================================================================
+
+@_kernel_params(_fast.sample_helix)
+@pytest.mark.parametrize("case", COMPRESSION_CASES)
+def test_sample_helix_matches_scalar(fn, case):
+    ref, args = _ref_compression(*case)
+    pts, min_z, max_z = fn(*args)
+    np.testing.assert_allclose(pts, ref, rtol=0, atol=1e-9)
+    assert min_z == pytest.approx(ref[:, 2].min(), abs=1e-9)
+    assert max_z == pytest.approx(ref[:, 2].max(), abs=1e-9)
+
+
+@_kernel_params(_fast.sample_coil)
+@pytest.mark.parametrize("R_from, R_to", [(10.0, 10.0), (10.0, 20.0), (25.0, 8.0)])
+def test_sample_coil_matches_scalar(fn, R_from, R_to):
+    theta0, total_angle, z0, height, n = 0.3, 2.0 * math.pi * 12.5, 1.5, 80.0, 1000
+    pts = fn(theta0, total_angle, z0, height, R_from, R_to, n, np.empty((n + 1, 3)))
+    ref = []
+    for i in range(n + 1):
+        t = i / n
+        theta = theta0 + total_angle * t
+        R = R_from + (R_to - R_from) * t
+        ref.append((R * math.cos(theta), R * math.sin(theta), z0 + height * t))
+    np.testing.assert_allclose(pts, ref, rtol=0, atol=1e-9)
+
+
+@_kernel_params(_fast.sample_arc)
+@pytest.mark.parametrize("theta0, total_arc, n", [(-math.pi / 2, math.radians(160), 36),
+                                                  (0.7, math.radians(270), 24),
+                                                  (0.0, -math.pi, 8)])
+def test_sample_arc_matches_scalar(fn, theta0, total_arc, n):
+    center = np.array((1.0, -2.0, 30.0))
+    u = np.array((0.0, 0.0, -1.0))
+    v = np.array((0.6, -0.8, 0.0))
+    radius = 7.3
+    pts = fn(center, u, v, radius, theta0, total_arc, n, np.empty((n + 1, 3)))
+    ref = []
+    for i in range(n + 1):
+        theta = theta0 + total_arc * (i / n)
+        ref.append(center + u * (radius * math.cos(theta)) + v * (radius * math.sin(theta)))
+    np.testing.assert_allclose(pts, ref, rtol=0, atol=1e-12)
+
+
+@_kernel_params(_fast.sample_bezier)
+def test_sample_bezier_matches_scalar(fn):
+    p0, p1, p2, p3 = (np.array(p, dtype=float) for p in
+                      ((0, 0, 0), (1, 2, 0.5), (3, -1, 2), (4, 0.5, 3)))
+    steps = 20
+    pts = fn(p0, p1, p2, p3, steps)
+    ref = []
+    for i in range(steps + 1):
+        t = i / steps
+        omt = 1.0 - t
+        ref.append(p0 * (omt * omt * omt) + p1 * (3 * omt * omt * t) +
+                   p2 * (3 * omt * t * t) + p3 * (t * t * t))
+    np.testing.assert_allclose(pts, ref, rtol=0, atol=1e-12)
+
+
+@_kernel_params(_fast.sample_gb_coil_z)
+@pytest.mark.parametrize("Nt, Na", [(10, 8), (9, 6.5), (6, 6)])
+def test_sample_gb_coil_z_matches_scalar(fn, Nt, Na):
+    d, L0, scale = 3.0, 60.0, 1.7
+    dead_coils_per_end = (Nt - Na) / 2.0
+    pitch_active = (L0 - (Nt - Na) * d) / Na
+    half_t = np.linspace(0.0, 1.0, 21)
+    out = fn(int(Nt), float(Na), dead_coils_per_end, d, pitch_active, half_t, scale)
+    ref = _ref_gb_coil_z(int(Nt), Na, dead_coils_per_end, d, pitch_active, half_t, scale)
+    np.testing.assert_allclose(out, ref, rtol=0, atol=1e-12)
+
+
+@_kernel_params(_fast.sample_suspension_z)
+@pytest.mark.parametrize("case", SUSPENSION_CASES)
+def test_sample_suspension_z_matches_scalar(fn, case):
+    args = _suspension_args(*case)
+    np.testing.assert_allclose(fn(*args), _ref_suspension_z(*args), rtol=0, atol=1e-9)
+
+
+# =============================================================================
+# hook_builder 数组辅助函数 (只依赖 numpy)
+# =============================================================================
+
+def test_clamp_radius_array_matches_scalar():
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(-12.0, 12.0, size=(200, 3))
+    pts[0] = (0.0, 0.0, 1.0)  # 轴线上的点不钳制
+    min_radius = 8.0
+    
+    ref = []
+    for x, y, z in pts:
+        r = math.sqrt(x * x + y * y)
+        if 1e-8 < r < min_radius:
+            scale = min_radius / r
+            ref.append((x * scale, y * scale, z))
+        else:
+            ref.append((x, y, z))
+    
+    out = hook_builder.clamp_radius_array(pts.copy(), min_radius)
+    np.testing.assert_allclose(out, ref, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("kind", ["machine", "side", "crossover", "extended", "doubleLoop"])
+def test_arc_basis_matches_scalar(kind):
+    spec = hook_builder.get_hook_spec(kind)
+    segments, hook_radius = 24, 9.1
+    total_angle = math.radians(spec.loop_angle_deg)
+    ref = [(hook_radius * math.cos(spec.loop_start_angle + total_angle * i / segments),
+            hook_radius * math.sin(spec.loop_start_angle + total_angle * i / segments))
+           for i in range(segments + 1)]
+    np.testing.assert_allclose(hook_builder.arc_basis(spec, segments, hook_radius), ref,
+                               rtol=0, atol=1e-12)
+
+
+# =============================================================================
+# run_export NumPy 回退路径 vs 内核 (需要 FreeCAD)
+# =============================================================================
+
+@pytest.mark.parametrize("case", SUSPENSION_CASES)
+def test_suspension_z_fallback_matches_kernel(run_export, case):
+    args = _suspension_args(*case)
+    np.testing.assert_allclose(run_export._suspension_z(*args), _fast.sample_suspension_z(*args),
+                               rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("theta_closed_turns, Nt", [(0.0, 8.0), (1.0, 8.0), (1.5, 4.0), (3.0, 4.0)])
+def test_numeric_avg_wpitch_closed_form(run_export, theta_closed_turns, Nt):
+    theta_closed = 2.0 * math.pi * theta_closed_turns
+    theta_total = 2.0 * math.pi * Nt
+    segments = int(Nt * 80)
+    d_theta = theta_total / segments
+    
+    total = 0.0
+    for i in range(segments):
+        theta = (i + 0.5) * d_theta
+        total += run_export.wPitch(theta, theta_closed, theta_total)
+    ref = total / segments
+    assert run_export.numericAvgWPitch(theta_closed, theta_total, segments) == pytest.approx(ref, abs=1e-4)
+
+
+@pytest.mark.parametrize("case", COMPRESSION_CASES)
+def test_compression_centerline_paths_agree(run_export, monkeypatch, case):
+    total_coils, active_coils, mean_d, d, L0, deflection, num_samples = case
+    params = {"totalCoils": total_coils, "activeCoils": active_coils, "meanDiameter": mean_d,
+              "wireDiameter": d, "freeLength": L0, "currentDeflection": deflection,
+              "numSamples": num_samples}
+    ref, _ = _ref_compression(*case)
+    for numba in (True, False):
+        monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+        pts, min_z, max_z = run_export.generate_compression_centerline(params)
+        np.testing.assert_allclose(pts, ref, rtol=0, atol=1e-9)
+        assert (min_z, max_z) == pytest.approx((ref[:, 2].min(), ref[:, 2].max()), abs=1e-9)
+
+
+@pytest.mark.parametrize("R_from, R_to", [(10.0, 10.0), (12.0, 6.0)])
+def test_coil_points_paths_agree(run_export, monkeypatch, R_from, R_to):
+    results = []
+    for numba in (True, False):
+        monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+        results.append(run_export.coil_points(0.2, 2.0 * math.pi * 9.5, 3.0, 70.0, R_from, R_to, 600))
+    np.testing.assert_allclose(results[0], results[1], rtol=0, atol=1e-9)
+
+
+def test_sample_arc_points_paths_agree(run_export, monkeypatch):
+    center = np.array((0.0, 0.0, 42.0))
+    u = np.array((0.0, 0.0, 1.0))
+    v = np.array((0.8, -0.6, 0.0))
+    results = []
+    for numba in (True, False):
+        monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+        results.append(run_export.sample_arc_points(center, 6.5, u, v, -math.pi / 2, math.radians(160), 36))
+    np.testing.assert_allclose(results[0], results[1], rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("Nt, Na", [(10, 8), (9, 6.5)])
+def test_gb_coil_z_paths_agree(run_export, monkeypatch, Nt, Na):
+    d, L0, scale = 3.0, 60.0, 1.7
+    dead_coils_per_end = (Nt - Na) / 2.0
+    pitch_active = (L0 - (Nt - Na) * d) / Na
+    half_t = np.linspace(0.0, 1.0, 21)
+    ref = _ref_gb_coil_z(int(Nt), Na, dead_coils_per_end, d, pitch_active, half_t, scale)
+    for numba in (True, False):
+        monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+        out = run_export.gb_coil_z(int(Nt), Na, dead_coils_per_end, d, pitch_active, scale, half_t)
+        np.testing.assert_allclose(out, ref, rtol=0, atol=1e-12)
+
+
+def test_suspension_centerline_paths_agree(run_export, monkeypatch):
+    params = {"wireDiameter": 12, "activeCoils": 6, "totalCoils": 8, "freeLength": 300,
+              "pitchProfile": {"mode": "progressive", "endType": "closed_ground",
+                               "endClosedTurns": 1.0, "pitchCenter": 45.0, "transitionTurns": 0.75},
+              "diameterProfile": {"mode": "barrel", "DmStart": 100, "DmMid": 120, "DmEnd": 90}}
+    results = []
+    for numba in (True, False):
+        monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+        run_export._CENTERLINE_CACHE.clear()
+        results.append(run_export.generate_suspension_centerline(params)[0])
+    run_export._CENTERLINE_CACHE.clear()
+    np.testing.assert_allclose(results[0], results[1], rtol=0, atol=1e-9)
+    assert results[0][-1, 2] == pytest.approx(300.0)
+
+
+@pytest.mark.parametrize("numba", [True, False])
+def test_compression_sampling_params_reach_centerline(run_export, monkeypatch, numba):
+    monkeypatch.setattr(run_export, "NUMBA_AVAILABLE", numba)
+    base = {"wireDiameter": 3.2, "meanDiameter": 24.0, "activeCoils": 8, "totalCoils": 10,
+            "freeLength": 50.0, "groundEnds": True}
+    
+    counts = []
+    for samples_per_coil in (16, 48):
+        params = dict(base, samplesPerCoil=samples_per_coil)
+        centerline_params = run_export._compression_centerline_params(params)
+        counts.append(len(run_export.generate_compression_centerline(centerline_params)[0]))
+    assert counts == [10 * 16 + 1, 10 * 48 + 1]
+    
+    # numSamples 显式指定时优先于 samplesPerCoil
+    centerline_params = run_export._compression_centerline_params(dict(base, numSamples=300, samplesPerCoil=48))
+    assert len(run_export.generate_compression_centerline(centerline_params)[0]) == 301
+    
+    # 未指定时保持默认每圈 32 点
+    centerline_params = run_export._compression_centerline_params(base)
+    assert len(run_export.generate_compression_centerline(centerline_params)[0]) == 10 * 32 + 1
+
+
+# =============================================================================
+# hook_builder 专用构建函数 vs 原始逐点构建 (需要 FreeCAD)
+# =============================================================================
+
+def _ref_hook_centerline(App, spec, end_info, d, R, is_start):
+    """原始 list + App.Vector 实现"""
+    def clamp(p):
+        r = math.sqrt(p.x ** 2 + p.y ** 2)
+        if 1e-8 < r < R:
+            return App.Vector(p.x * R / r, p.y * R / r, p.z)
+        return p
+    
+    end_pos = end_info.end_point
+    axis_dir = end_info.axis_dir
+    radial_dir = end_info.radial_dir
+    hook_gap = d * spec.axial_gap_factor
+    hook_radius = R * spec.hook_radius_factor + d * 0.4
+    offset = 0.0 if spec.center_mode == "on-axis" else d * spec.radial_offset_factor
+    hook_center = App.Vector(radial_dir.x * offset, radial_dir.y * offset, end_pos.z + axis_dir.z * hook_gap)
+    u = App.Vector(axis_dir.x, axis_dir.y, axis_dir.z)
+    v = radial_dir.cross(axis_dir)
+    v.normalize()
+    
+    total_angle = math.radians(spec.loop_angle_deg)
+    loop_pts = []
+    for i in range(25):
+        theta = spec.loop_start_angle + total_angle * i / 24
+        loop_pts.append(hook_center + u * (hook_radius * math.cos(theta)) + v * (hook_radius * math.sin(theta)))
+    
+    seg_a_end = end_pos + end_info.tangent_dir * d
+    seg_a_pts = [clamp(end_pos * (1 - i / 10) + seg_a_end * (i / 10)) for i in range(11)]
+    
+    p0, p3 = seg_a_end, loop_pts[0]
+    p1 = seg_a_end + radial_dir * (0.5 * d) + axis_dir * (0.5 * d)
+    p2 = loop_pts[0] - axis_dir * (0.5 * d)
+    seg_b_pts = []
+    for i in range(1, 21):
+        t = i / 20
+        omt = 1.0 - t
+        seg_b_pts.append(clamp(p0 * (omt ** 3) + p1 * (3 * omt * omt * t) + p2 * (3 * omt * t * t) + p3 * (t ** 3)))
+    
+    if is_start:
+        return (loop_pts[::-1] + seg_b_pts[::-1] + seg_a_pts[::-1])[:-1]
+    return seg_a_pts[1:] + seg_b_pts + loop_pts
+
+
+@pytest.mark.parametrize("kind", ["machine", "side"])
+@pytest.mark.parametrize("is_start", [True, False])
+@pytest.mark.parametrize("numba", [True, False])
+def test_hook_builder_matches_scalar(monkeypatch, kind, is_start, numba):
+    App = pytest.importorskip("FreeCAD")
+    monkeypatch.setattr(hook_builder, "NUMBA_AVAILABLE", numba)
+    d, R = 2.0, 8.0
+    helix = [App.Vector(R * math.cos(a), R * math.sin(a), 0.35 * a)
+             for a in np.linspace(0.0, 2.0 * math.pi * 6.3, 200)]
+    spec = hook_builder.get_hook_spec(kind)
+    end_info = hook_builder.get_helix_end_info(helix, is_start)
+    
+    pts = hook_builder.build_hook_centerline(spec, end_info, d, R, is_start)
+    ref = _ref_hook_centerline(App, spec, end_info, d, R, is_start)
+    assert len(pts) == len(ref)
+    np.testing.assert_allclose([(p.x, p.y, p.z) for p in pts], [(p.x, p.y, p.z) for p in ref],
+                               rtol=0, atol=1e-9)
+
+
+class _FakeShape:
+    """hashCode 相同但不是同一形体的替身 (模拟 TShape 地址被复用)"""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def hashCode(self):
+        return 42
+
+    def isSame(self, other):
+        return self.tag == other.tag
+
+
+def test_projection_cache_rejects_reused_hash(run_export, monkeypatch):
+    App = pytest.importorskip("FreeCAD")
+    calls = []
+
+    class _TechDraw:
+        @staticmethod
+        def projectToSVG(shape, direction):
+            calls.append(shape.tag)
+            return f"<svg-{shape.tag}>"
+
+    monkeypatch.setattr(run_export, "TechDraw", _TechDraw, raising=False)
+    monkeypatch.setattr(run_export, "TECHDRAW_AVAILABLE", True)
+    monkeypatch.setattr(run_export, "_PROJ_CACHE", type(run_export._PROJ_CACHE)())
+    direction = App.Vector(0, 1, 0)
+    
+    assert run_export._cached_project(_FakeShape("a"), direction) == "<svg-a>"
+    assert run_export._cached_project(_FakeShape("a"), direction) == "<svg-a>"
+    assert run_export._cached_project(_FakeShape("b"), direction) == "<svg-b>"
+    assert calls == ["a", "b"]
@@ -5,7 +5,7 @@ import uuid
 import base64
 import subprocess
 import shutil
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from fastapi import FastAPI, HTTPException, Body
 from pydantic import BaseModel
 
@@ -40,6 +40,10 @@ class Geometry(BaseModel):
 class ExportConfig(BaseModel):
     formats: List[str]
     name: Optional[str] = None
+    # STL 网格精度档位，对应 run_export.STL_QUALITY_PRESETS
+    stlQuality: Literal["preview", "normal", "fine"] = "normal"
+    # 多格式导出时是否并行执行
+    parallel: bool = False
 
 class ExportRequest(BaseModel):
     springType: str
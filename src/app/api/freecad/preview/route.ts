@@ -167,6 +167,7 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
           export: {
             formats: ["STL"],
             name: `preview_${Date.now()}`,
+            stlQuality: "fine",  // 预览使用高精度网格
           },
         };
 
@@ -254,6 +255,7 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
       export: {
         formats: ["STL"],  // 使用 STL 格式，Three.js 可以直接加载
         name: exportName,
+        stlQuality: "fine",  // 预览使用高精度网格
       },
     };
 